@@ -0,0 +1,76 @@
+const MANIFEST = {"precache":[["./","9eb4c259c7"],["../assets/InterVariable.693b77d4f3.woff2","693b77d4f3"],["../assets/reveal.9736bf3d89.js","9736bf3d89"],["../assets/reveal.edbb49beff.css","edbb49beff"],["../assets/white.5e0cf5231a.css","5e0cf5231a"],["img/favicon.ico","781e43774b"],["slides/slide-01.jpg","dbbed92e9e"],["slides/slide-02.jpg","0f66de442b"],["slides/slide-03.jpg","7d88b20281"],["slides/slide-04.jpg","22bfc7ca74"],["slides/slide-05.jpg","c388ae347e"],["slides/slide-06.jpg","6533fb0b25"],["slides/slide-07.jpg","f23f11fce6"],["slides/slide-08.jpg","c546027871"],["slides/slide-09.jpg","d7c4f3e340"],["slides/slide-10.jpg","5db1613e83"],["slides/slide-11.jpg","3007180c16"],["slides/slide-12.jpg","898d94f087"],["slides/slide-13.jpg","0ce9e2271a"]],"runtime":[["../assets/source-sans-pro-italic.05d3615fdb.woff","05d3615fdb"],["../assets/source-sans-pro-italic.ad4b079960.eot","ad4b079960"],["../assets/source-sans-pro-italic.d13268affb.ttf","d13268affb"],["../assets/source-sans-pro-regular.c1865d89d7.ttf","c1865d89d7"],["../assets/source-sans-pro-regular.d4eaa48ba4.woff","d4eaa48ba4"],["../assets/source-sans-pro-regular.dce8869d25.eot","dce8869d25"],["../assets/source-sans-pro-semibold.a53e27232e.ttf","a53e27232e"],["../assets/source-sans-pro-semibold.b0abd27363.woff","b0abd27363"],["../assets/source-sans-pro-semibold.ebb8918da9.eot","ebb8918da9"],["../assets/source-sans-pro-semibolditalic.7225cacc06.woff","7225cacc06"],["../assets/source-sans-pro-semibolditalic.dfe0b47abf.eot","dfe0b47abf"],["../assets/source-sans-pro-semibolditalic.e8ec22b619.ttf","e8ec22b619"],["img/aromagic_logo-160.80af43ee99.avif","98dcc397e4"],["img/aromagic_logo-160.80af43ee99.png","83f58076e4"],["img/aromagic_logo-160.80af43ee99.webp","f43d5516e2"],["img/aromagic_logo-320.80af43ee99.avif","f535396269"],["img/aromagic_logo-320.80af43ee99.png","029547bd54"],["img/aromagic_logo-320.80af43ee99.webp","feea836a55"],["img/grafika-covid-1024.2dff926a16.avif","b974eac4e6"],["img/grafika-covid-1024.2dff926a16.jpg","ed09e9cd2e"],["img/grafika-covid-1024.2dff926a16.webp","d2cdba591e"],["img/grafika-covid-480.2dff926a16.avif","cfc6461b74"],["img/grafika-covid-480.2dff926a16.jpg","f1201a57d0"],["img/grafika-covid-480.2dff926a16.webp","0815e33226"],["img/grafika-covid-960.2dff926a16.avif","82dcb70d8b"],["img/grafika-covid-960.2dff926a16.jpg","ec448743fc"],["img/grafika-covid-960.2dff926a16.webp","2984f29b34"],["img/grafika-dzienniczek-1024.f82076b420.avif","0bc917d354"],["img/grafika-dzienniczek-1024.f82076b420.jpg","674ee64368"],["img/grafika-dzienniczek-1024.f82076b420.webp","cf52ed21d6"],["img/grafika-dzienniczek-480.f82076b420.avif","71981b25f6"],["img/grafika-dzienniczek-480.f82076b420.jpg","586561aa42"],["img/grafika-dzienniczek-480.f82076b420.webp","34cbafe2da"],["img/grafika-dzienniczek-960.f82076b420.avif","f17a24f399"],["img/grafika-dzienniczek-960.f82076b420.jpg","b551681948"],["img/grafika-dzienniczek-960.f82076b420.webp","1b3b7529e7"],["img/grafika-grypa-1024.4657bf91dd.avif","6b0d04b44b"],["img/grafika-grypa-1024.4657bf91dd.jpg","a9e92ff153"],["img/grafika-grypa-1024.4657bf91dd.webp","7bff83e6a2"],["img/grafika-grypa-480.4657bf91dd.avif","7b01e330c1"],["img/grafika-grypa-480.4657bf91dd.jpg","9d1b9d790d"],["img/grafika-grypa-480.4657bf91dd.webp","2689b89c5c"],["img/grafika-grypa-960.4657bf91dd.avif","6b325a3555"],["img/grafika-grypa-960.4657bf91dd.jpg","e570faa4ae"],["img/grafika-grypa-960.4657bf91dd.webp","42690c23ad"],["img/grafika-medytacja-cytrusy-1248.1d0e4cce05.avif","70c67bc5e6"],["img/grafika-medytacja-cytrusy-1248.1d0e4cce05.jpg","2f872a7727"],["img/grafika-medytacja-cytrusy-1248.1d0e4cce05.webp","483d263f28"],["img/grafika-medytacja-cytrusy-480.1d0e4cce05.avif","4eec5402b9"],["img/grafika-medytacja-cytrusy-480.1d0e4cce05.jpg","8c59fd1154"],["img/grafika-medytacja-cytrusy-480.1d0e4cce05.webp","e43e7658bd"],["img/grafika-medytacja-cytrusy-960.1d0e4cce05.avif","52a1606b72"],["img/grafika-medytacja-cytrusy-960.1d0e4cce05.jpg","98691ecb15"],["img/grafika-medytacja-cytrusy-960.1d0e4cce05.webp","040d660c79"],["img/grafika-neuroplastycznosc-1024.9b9c6b3748.avif","4103b47c42"],["img/grafika-neuroplastycznosc-1024.9b9c6b3748.jpg","133e10031c"],["img/grafika-neuroplastycznosc-1024.9b9c6b3748.webp","93b6680ef3"],["img/grafika-neuroplastycznosc-480.9b9c6b3748.avif","5d2d973306"],["img/grafika-neuroplastycznosc-480.9b9c6b3748.jpg","bd446e7607"],["img/grafika-neuroplastycznosc-480.9b9c6b3748.webp","ddaa285153"],["img/grafika-neuroplastycznosc-960.9b9c6b3748.avif","c468578189"],["img/grafika-neuroplastycznosc-960.9b9c6b3748.jpg","944febf823"],["img/grafika-neuroplastycznosc-960.9b9c6b3748.webp","2239e76814"],["img/grafika-olejki-1600.f1cf4d44cc.avif","24fe348bb2"],["img/grafika-olejki-1600.f1cf4d44cc.jpg","77ee857b5b"],["img/grafika-olejki-1600.f1cf4d44cc.webp","6b04f0da61"],["img/grafika-olejki-480.f1cf4d44cc.avif","0811c4b336"],["img/grafika-olejki-480.f1cf4d44cc.jpg","cd3d93c2bb"],["img/grafika-olejki-480.f1cf4d44cc.webp","b7fb421eae"],["img/grafika-olejki-960.f1cf4d44cc.avif","d0858472c9"],["img/grafika-olejki-960.f1cf4d44cc.jpg","2103ca56cc"],["img/grafika-olejki-960.f1cf4d44cc.webp","4c9df10a60"],["img/grafika-papier-akwarelowy-1600.c2d3def949.avif","596a6e004c"],["img/grafika-papier-akwarelowy-1600.c2d3def949.jpg","173ad75770"],["img/grafika-papier-akwarelowy-1600.c2d3def949.webp","07b7090cce"],["img/grafika-papier-akwarelowy-480.c2d3def949.avif","c6b8a4f23b"],["img/grafika-papier-akwarelowy-480.c2d3def949.jpg","3e81c7f227"],["img/grafika-papier-akwarelowy-480.c2d3def949.webp","a1464ced4c"],["img/grafika-papier-akwarelowy-960.c2d3def949.avif","0b103bcc34"],["img/grafika-papier-akwarelowy-960.c2d3def949.jpg","fc1123fec4"],["img/grafika-papier-akwarelowy-960.c2d3def949.webp","6b08fba6b0"],["img/grafika-sloiczki-1600.50e8c176f5.avif","35209829c7"],["img/grafika-sloiczki-1600.50e8c176f5.jpg","e4ca64fdf6"],["img/grafika-sloiczki-1600.50e8c176f5.webp","0a7a0a8eda"],["img/grafika-sloiczki-480.50e8c176f5.avif","3d3994733e"],["img/grafika-sloiczki-480.50e8c176f5.jpg","6fcf87e44e"],["img/grafika-sloiczki-480.50e8c176f5.webp","10b1a463ea"],["img/grafika-sloiczki-960.50e8c176f5.avif","d40a58f5a6"],["img/grafika-sloiczki-960.50e8c176f5.jpg","14fd1ba6a3"],["img/grafika-sloiczki-960.50e8c176f5.webp","f5bcb25f13"],["img/grafika-technika-blad-1024.3cad6053f5.avif","8e07e4000f"],["img/grafika-technika-blad-1024.3cad6053f5.jpg","a6486f6399"],["img/grafika-technika-blad-1024.3cad6053f5.webp","a423c21a57"],["img/grafika-technika-blad-480.3cad6053f5.avif","0b15bc434e"],["img/grafika-technika-blad-480.3cad6053f5.jpg","b9a280a1f4"],["img/grafika-technika-blad-480.3cad6053f5.webp","2bc2a18888"],["img/grafika-technika-blad-960.3cad6053f5.avif","83cfe1ea5b"],["img/grafika-technika-blad-960.3cad6053f5.jpg","a8cc43705c"],["img/grafika-technika-blad-960.3cad6053f5.webp","e040c53cad"],["img/grafika-technika-prawidlowa-1024.583f1b8209.avif","af0e152773"],["img/grafika-technika-prawidlowa-1024.583f1b8209.jpg","884d4359de"],["img/grafika-technika-prawidlowa-1024.583f1b8209.webp","d5e6b65ec6"],["img/grafika-technika-prawidlowa-480.583f1b8209.avif","b65e4308e2"],["img/grafika-technika-prawidlowa-480.583f1b8209.jpg","7c1bec9628"],["img/grafika-technika-prawidlowa-480.583f1b8209.webp","a6e464a4ae"],["img/grafika-technika-prawidlowa-960.583f1b8209.avif","2ebb576847"],["img/grafika-technika-prawidlowa-960.583f1b8209.jpg","86f3eb1039"],["img/grafika-technika-prawidlowa-960.583f1b8209.webp","714d1a1ee2"],["img/grafika-wachanie-1024.cf57db3167.avif","1586786f3e"],["img/grafika-wachanie-1024.cf57db3167.jpg","b26491cb57"],["img/grafika-wachanie-1024.cf57db3167.webp","0830c098d5"],["img/grafika-wachanie-480.cf57db3167.avif","315cc941ef"],["img/grafika-wachanie-480.cf57db3167.jpg","e8ce8f06cb"],["img/grafika-wachanie-480.cf57db3167.webp","fa0e2e03e8"],["img/grafika-wachanie-960.cf57db3167.avif","379630bab8"],["img/grafika-wachanie-960.cf57db3167.jpg","15c7480441"],["img/grafika-wachanie-960.cf57db3167.webp","d58daf9184"],["img/grafika-zasady-1024.7527271bbf.avif","afbb344a7b"],["img/grafika-zasady-1024.7527271bbf.jpg","66da87cf3a"],["img/grafika-zasady-1024.7527271bbf.webp","f008c214e1"],["img/grafika-zasady-480.7527271bbf.avif","893ac0931b"],["img/grafika-zasady-480.7527271bbf.jpg","f7b7a38482"],["img/grafika-zasady-480.7527271bbf.webp","b89c077107"],["img/grafika-zasady-960.7527271bbf.avif","c51b529b13"],["img/grafika-zasady-960.7527271bbf.jpg","00f243c1f2"],["img/grafika-zasady-960.7527271bbf.webp","1ba81a02b7"]]};
+const CACHE = "offline:" + self.registration.scope;
+const revisions = new Map();
+for (const [url, revision] of MANIFEST.precache.concat(MANIFEST.runtime)) {
+revisions.set(new URL(url, self.location).href, revision);
+}
+function cacheKey(href, revision) {
+return href + (href.includes("?") ? "&" : "?") + "__rev=" + revision;
+}
+function resolve(request) {
+const url = new URL(request.url);
+url.hash = "";
+if (request.mode === "navigate") {
+url.search = "";
+if (url.pathname.endsWith("/index.html")) {
+url.pathname = url.pathname.slice(0, -"index.html".length);
+}
+}
+return url.href;
+}
+self.addEventListener("install", (event) => {
+event.waitUntil((async () => {
+const cache = await caches.open(CACHE);
+await Promise.all(MANIFEST.precache.map(async ([url, revision]) => {
+const href = new URL(url, self.location).href;
+const key = cacheKey(href, revision);
+if (await cache.match(key)) {
+return;
+}
+const response = await fetch(href, {cache: "no-cache"});
+if (!response.ok) {
+throw new Error(href + ": HTTP " + response.status);
+}
+await cache.put(key, response);
+}));
+await self.skipWaiting();
+})());
+});
+self.addEventListener("activate", (event) => {
+event.waitUntil((async () => {
+const cache = await caches.open(CACHE);
+const current = new Set();
+for (const [href, revision] of revisions) {
+current.add(cacheKey(href, revision));
+}
+for (const request of await cache.keys()) {
+if (!current.has(request.url)) {
+await cache.delete(request);
+}
+}
+await self.clients.claim();
+})());
+});
+self.addEventListener("fetch", (event) => {
+if (event.request.method !== "GET") {
+return;
+}
+const href = resolve(event.request);
+const revision = revisions.get(href);
+if (revision === undefined) {
+return; 
+}
+event.respondWith((async () => {
+const cache = await caches.open(CACHE);
+const key = cacheKey(href, revision);
+const cached = await cache.match(key);
+if (cached) {
+return cached;
+}
+const response = await fetch(event.request);
+if (response.ok) {
+await cache.put(key, response.clone());
+}
+return response;
+})());
+});
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Time-aligned Polish and English transcripts of a lecture.
+
+Lecture 11 is in transkrypcje/ twice, ``11. ….srt`` and ``11. … (EN).srt``:
+one video timeline, but each file breaks it into sentences of its own. An
+Alignment loads the sentences of both (srt.iter_sentences) into an
+IntervalIndex each, so the text of one language for a span of the other
+takes two bisections instead of a scan of the file.
+
+A sentence counts for a span when at least half of it, or half of the span,
+lies inside. pairs() cuts both timelines wherever both have a sentence
+boundary within TOLERANCE_MS of each other, in one merge-like pass; every
+piece is a pair of PL and EN text covering the same stretch of the lecture.
+
+    python3 narzedzia/align.py 11 12:30 14:00            # EN for a PL span
+    python3 narzedzia/align.py 11 12:30 14:00 --from en  # PL for an EN span
+    python3 narzedzia/align.py 11 --export pary.tsv      # all aligned pairs
+"""
+
+import argparse
+import csv
+import glob
+import os
+import sys
+from typing import NamedTuple
+
+import intervals
+import srt
+import transcripts
+
+LANGS = ("pl", "en")
+TOLERANCE_MS = 700  # boundaries this close count as the same moment
+
+
+class Pair(NamedTuple):
+    start: int  # ms
+    end: int    # ms
+    pl: str
+    en: str
+
+
+def twins(query, directory=transcripts.TRANSCRIPTS_DIR):
+    """{lang: path} of the lecture numbered query, in both languages."""
+    found = {}
+    for path in sorted(glob.glob(os.path.join(directory, "*.srt"))):
+        number, _, lang = transcripts.lecture_meta(os.path.basename(path))
+        if number and number.lstrip("0") == query.strip().lstrip("0"):
+            found[lang] = path
+    missing = [lang for lang in LANGS if lang not in found]
+    if missing:
+        raise KeyError("Brak transkrypcji wykładu %s: %s" % (query, ", ".join(missing)))
+    return found
+
+
+def _weighty(sentences, start, end):
+    """The sentences with at least half of themselves, or of the span, inside it."""
+    if end <= start:
+        return sentences
+    return [s for s in sentences
+            if 2 * (min(s.end, end) - max(s.start, start)) >= min(s.end - s.start, end - start)]
+
+
+class Alignment:
+    def __init__(self, pl, en):
+        self.index = {"pl": intervals.IntervalIndex(pl), "en": intervals.IntervalIndex(en)}
+
+    @classmethod
+    def load(cls, query, directory=transcripts.TRANSCRIPTS_DIR):
+        paths = twins(query, directory)
+        return cls(*(srt.iter_sentences(paths[lang]) for lang in LANGS))
+
+    def sentences(self, lang, start, end):
+        """Sentences of lang that count for [start, end] (a moment if end <= start)."""
+        return _weighty(self.index[lang].overlapping(start, end), start, end)
+
+    def translate(self, start, end, source="pl"):
+        """(source sentences, other language's sentences) for a span.
+
+        The span is first widened to the source sentences that count for
+        it, so the answer covers whole sentences on both sides.
+        """
+        target = LANGS[1 - LANGS.index(source)]
+        found = self.sentences(source, start, end)
+        if not found:
+            return [], []
+        start, end = found[0].start, found[-1].end
+        return found, self.sentences(target, start, end)
+
+    def pairs(self, tolerance=TOLERANCE_MS):
+        """Aligned Pair objects covering both transcripts, in order."""
+        pl, en = self.index["pl"].items, self.index["en"].items
+        out, i0, j0, i, j = [], 0, 0, 1, 1
+        while i < len(pl) and j < len(en):
+            a, b = pl[i].start, en[j].start
+            if a < b - tolerance:
+                i += 1
+            elif b < a - tolerance:
+                j += 1
+            else:
+                out.append(_pair(pl[i0:i], en[j0:j]))
+                i0, j0, i, j = i, j, i + 1, j + 1
+        if i0 < len(pl) or j0 < len(en):
+            out.append(_pair(pl[i0:], en[j0:]))
+        return out
+
+
+def _pair(pl, en):
+    both = pl + en
+    return Pair(min(s.start for s in both), max(s.end for s in both),
+                " ".join(s.text for s in pl), " ".join(s.text for s in en))
+
+
+def export(pairs, path):
+    """Write pairs as TSV (start, end, pl, en) for a spreadsheet."""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f, delimiter="\t")
+        writer.writerow(["start", "end", "pl", "en"])
+        for p in pairs:
+            writer.writerow([srt.format_timestamp(p.start), srt.format_timestamp(p.end), p.pl, p.en])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dopasowanie czasowe transkrypcji PL i EN wykładu.")
+    parser.add_argument("lecture", help="numer wykładu, np. 11")
+    parser.add_argument("start", nargs="?", help="początek, np. 12:30 lub 00:41:10")
+    parser.add_argument("end", nargs="?", help="koniec (domyślnie: sam moment początku)")
+    parser.add_argument("--from", dest="source", default="pl", choices=LANGS,
+                        help="język, w którym podany jest fragment (domyślnie: pl)")
+    parser.add_argument("--export", metavar="PLIK", help="zapisz wszystkie pary PL/EN do pliku TSV")
+    args = parser.parse_args(argv)
+    try:
+        alignment = Alignment.load(args.lecture)
+    except KeyError as e:
+        print(f"BŁĄD: {e.args[0]}", file=sys.stderr)
+        return 1
+
+    if args.export:
+        pairs = alignment.pairs()
+        export(pairs, args.export)
+        print(f"{args.export}: {len(pairs)} par")
+    if args.start is None:
+        return 0
+    try:
+        start = transcripts.parse_time(args.start)
+        end = transcripts.parse_time(args.end) if args.end else start
+    except ValueError as e:
+        print(f"BŁĄD: {e}", file=sys.stderr)
+        return 1
+    for lang, found in zip((args.source, LANGS[1 - LANGS.index(args.source)]),
+                           alignment.translate(start, end, args.source)):
+        print(f"[{lang.upper()}]")
+        for s in found:
+            print(f"{srt.format_timestamp(s.start)}  {s.text}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
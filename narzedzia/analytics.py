@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""Training-progress analytics over patient diary entries.
+
+A diary entry is one oil smelled in one session: patient, date, session,
+oil, intensity 0–5 and the sensation (nic / chłód / zniekształcony /
+czysty), as the diary in the deck and in diaries.py asks for. Entries come
+from CSV (comma or semicolon separated) or JSON (a list of objects, or one
+object per line) with these keys:
+
+    id           patient (required; also "pacjent")
+    data         YYYY-MM-DD (required)
+    olejek       oil (required)
+    intensywnosc 0–5 (required; also "intensywność")
+    pora         rano / południe / wieczór
+    odczucia     nic / chłód / zniekształcony / czysty, or the longer wording
+                 of the diary template ("wrażenie chłodu", "czysty zapach")
+
+Loading turns every column into a NumPy array once: text columns become
+integer codes (np.unique over the column, so each distinct value is parsed
+once) and rows are sorted by patient and date. Everything else is computed
+on whole arrays, grouped with np.bincount, never row by row:
+
+    trends()           slope of intensity per week, by patient, oil or both
+    rolling_mean()     trailing average per patient and training day
+    parosmia_onset()   first training day with repeated distorted smells
+    monthly()          mean intensity per training month, overall or per oil
+    cohort_summary()   one dict for the whole cohort
+
+The chart helpers draw monthly() curves as a ReportLab Drawing, for the
+PDF builders (renderPDF.draw onto a canvas), or as a native chart on a
+python-pptx slide.
+
+    python3 narzedzia/analytics.py wpisy.csv
+    python3 narzedzia/analytics.py wpisy.json --pdf raport.pdf --pptx raport.pptx
+"""
+
+import argparse
+import csv
+import json
+import sys
+from typing import NamedTuple
+
+import numpy as np
+
+import themes
+
+SENSATIONS = ("nic", "chłód", "zniekształcony", "czysty")
+DISTORTED = SENSATIONS.index("zniekształcony")
+# Leading letters of the accepted wordings, e.g. "wrażenie chłodu".
+_SENSATION_STEMS = (("nic", 0), ("brak", 0), ("chł", 1), ("chl", 1), ("wrażenie chł", 1),
+                    ("znie", 2), ("czy", 3))
+SESSIONS = ("rano", "południe", "wieczór")
+_SESSION_STEMS = (("ran", 0), ("poł", 1), ("pol", 1), ("wie", 2))
+FIELDS = {
+    "patient": ("id", "pacjent"),
+    "day": ("data",),
+    "oil": ("olejek",),
+    "intensity": ("intensywnosc", "intensywność"),
+    "session": ("pora",),
+    "sensation": ("odczucia",),
+}
+REQUIRED = ("patient", "day", "oil", "intensity")
+MAX_INTENSITY = 5
+MONTH_DAYS = 30.4375
+
+
+# === LOADING ===
+
+class Entries(NamedTuple):
+    """Diary entries as columns, sorted by patient, day and session."""
+    patient: np.ndarray    # int32 codes into patients
+    day: np.ndarray        # datetime64[D]
+    t: np.ndarray          # int32 days since the patient's first entry
+    session: np.ndarray    # int8 index into SESSIONS, -1 unknown
+    oil: np.ndarray        # int32 codes into oils
+    intensity: np.ndarray  # int8 0..MAX_INTENSITY
+    sensation: np.ndarray  # int8 index into SENSATIONS, -1 unknown
+    patients: tuple
+    oils: tuple
+    skipped: int           # rows dropped for a bad date or intensity
+
+    def __len__(self):
+        return len(self.patient)
+
+
+def _codes(column):
+    """(codes, distinct values) of a text column."""
+    values, codes = np.unique(np.asarray(column, dtype=str), return_inverse=True)
+    return codes.astype(np.int32), values
+
+
+def _decode(column, parse, dtype, missing):
+    """Parse each distinct value of column once; missing where parse fails."""
+    codes, values = _codes(column)
+    parsed = []
+    for value in values:
+        try:
+            parsed.append(parse(value.strip()))
+        except ValueError:
+            parsed.append(missing)
+    return np.array(parsed, dtype=dtype)[codes]
+
+
+def _stem(stems):
+    def parse(value):
+        value = value.lower()
+        for stem, code in stems:
+            if value.startswith(stem):
+                return code
+        raise ValueError(value)
+    return parse
+
+
+def _columns(path):
+    """{field: strings (list or array), None if absent} from a CSV or JSON file."""
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        if path.lower().endswith((".json", ".jsonl")):
+            text = f.read()
+            try:
+                records = json.loads(text)
+            except ValueError:  # one object per line
+                records = [json.loads(line) for line in text.splitlines() if line.strip()]
+            keys = set().union(*records) if records else set()
+            names = {field: next((k for k in aliases if k in keys), None) for field, aliases in FIELDS.items()}
+            return {field: [str(r.get(k, "")) for r in records] if k else None
+                    for field, k in names.items()}
+        header = f.readline()
+    delimiter = ";" if header.count(";") > header.count(",") else ","
+    head = [h.strip().strip('"').lower() for h in header.split(delimiter)]
+    # NumPy's C reader gives one string array per column directly.
+    table = np.loadtxt(path, dtype=str, delimiter=delimiter, quotechar='"', skiprows=1,
+                       encoding="utf-8-sig", ndmin=2)
+    out = {}
+    for field, aliases in FIELDS.items():
+        index = next((head.index(a) for a in aliases if a in head), None)
+        out[field] = table[:, index] if index is not None else None
+    return out
+
+
+def load(path):
+    """Entries from a CSV or JSON file; ValueError if a required column is missing."""
+    cols = _columns(path)
+    missing = [FIELDS[f][0] for f in REQUIRED if cols[f] is None]
+    if missing:
+        raise ValueError("%s: brak kolumn %s" % (path, ", ".join(missing)))
+    n = len(cols["patient"])
+    day = _decode(cols["day"], np.datetime64, "datetime64[D]", np.datetime64("NaT"))
+    intensity = _decode(cols["intensity"], lambda v: int(float(v.replace(",", "."))), np.int16, -1)
+    session = (_decode(cols["session"], _stem(_SESSION_STEMS), np.int8, -1)
+               if cols["session"] is not None else np.full(n, -1, np.int8))
+    sensation = (_decode(cols["sensation"], _stem(_SENSATION_STEMS), np.int8, -1)
+                 if cols["sensation"] is not None else np.full(n, -1, np.int8))
+    keep = ~np.isnat(day) & (intensity >= 0) & (intensity <= MAX_INTENSITY)
+    patient, patients = _codes(np.asarray(cols["patient"], dtype=str)[keep])
+    oil, oils = _codes(np.asarray(cols["oil"], dtype=str)[keep])
+    day, session, intensity, sensation = (a[keep] for a in (day, session, intensity, sensation))
+    order = np.lexsort((session, day, patient))
+    patient, day, session, oil, intensity, sensation = (
+        a[order] for a in (patient, day, session, oil, intensity, sensation))
+    # Sorted by patient, so each patient's first day opens its run.
+    starts = np.flatnonzero(np.r_[True, patient[1:] != patient[:-1]]) if len(patient) else np.array([], int)
+    first = np.repeat(day[starts], np.diff(np.r_[starts, len(day)]))
+    t = (day - first).astype(np.int32)
+    return Entries(patient, day, t, session, oil, intensity.astype(np.int8), sensation,
+                   tuple(patients), tuple(oils), int(n - keep.sum()))
+
+
+# === ANALYTICS ===
+
+class Trend(NamedTuple):
+    slope: np.ndarray  # intensity points per week; NaN with fewer than two days
+    mean: np.ndarray
+    count: np.ndarray
+
+
+def _groups(entries, by):
+    """(group index per entry, number of groups) for by = patient, oil or patient_oil."""
+    if by == "patient":
+        return entries.patient, len(entries.patients)
+    if by == "oil":
+        return entries.oil, len(entries.oils)
+    if by == "patient_oil":
+        return entries.patient * len(entries.oils) + entries.oil, len(entries.patients) * len(entries.oils)
+    raise ValueError("by: patient, oil albo patient_oil, nie %r" % by)
+
+
+def trends(entries, by="patient"):
+    """Least-squares slope of intensity over training time per group.
+
+    For patient_oil, reshape the fields to (patients, oils).
+    """
+    group, size = _groups(entries, by)
+    x = entries.t / 7.0
+    y = entries.intensity.astype(float)
+    n = np.bincount(group, minlength=size).astype(float)
+    sx, sy = np.bincount(group, x, size), np.bincount(group, y, size)
+    sxx, sxy = np.bincount(group, x * x, size), np.bincount(group, x * y, size)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        den = n * sxx - sx * sx
+        slope = np.where(den > 1e-9, (n * sxy - sx * sy) / den, np.nan)
+        mean = sy / n
+    return Trend(slope, mean, n.astype(int))
+
+
+def _daily(entries, values):
+    """(patients, days) sums of values per patient and training day."""
+    days = int(entries.t.max()) + 1 if len(entries) else 0
+    flat = entries.patient.astype(np.int64) * days + entries.t
+    shape = (len(entries.patients), days)
+    return np.bincount(flat, values, shape[0] * shape[1]).reshape(shape)
+
+
+def _trailing(matrix, window):
+    """Sums over the trailing window of days, along axis 1."""
+    c = np.cumsum(matrix, axis=1)
+    out = c.copy()
+    out[:, window:] -= c[:, :-window]
+    return out
+
+
+def rolling_mean(entries, window=7):
+    """(patients, days) trailing mean intensity; NaN where a window has no entries."""
+    sums = _trailing(_daily(entries, entries.intensity.astype(float)), window)
+    counts = _trailing(_daily(entries, None), window)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, sums / counts, np.nan)
+
+
+def parosmia_onset(entries, window=7, min_days=3):
+    """Training day per patient on which the trailing window holds at least
+    min_days days with a distorted smell; -1 for patients without parosmia.
+
+    Days rather than entries are counted: one session covers several oils,
+    and a single distorted note is often a misread one.
+    """
+    distorted = _daily(entries, (entries.sensation == DISTORTED).astype(float)) > 0
+    hit = _trailing(distorted.astype(np.int32), window) >= min_days
+    return np.where(hit.any(axis=1), hit.argmax(axis=1), -1)
+
+
+def months(entries):
+    """Training month (0 = the first) of every entry."""
+    return (entries.t / MONTH_DAYS).astype(np.int32)
+
+
+def monthly(entries, by=None):
+    """(month numbers, {name: mean intensity per month}) overall or per oil.
+
+    Months without entries are NaN.
+    """
+    month = months(entries)
+    size = int(month.max()) + 1 if len(entries) else 0
+    y = entries.intensity.astype(float)
+    if by is None:
+        keys, names = np.zeros(len(entries), np.int32), ("wszystkie",)
+    elif by == "oil":
+        keys, names = entries.oil, entries.oils
+    else:
+        raise ValueError("by: None albo oil, nie %r" % by)
+    flat = keys.astype(np.int64) * size + month
+    total = np.bincount(flat, y, len(names) * size).reshape(len(names), size)
+    count = np.bincount(flat, None, len(names) * size).reshape(len(names), size)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.where(count > 0, total / count, np.nan)
+    return np.arange(size), dict(zip(names, means))
+
+
+def cohort_summary(entries, window=7, min_days=3):
+    """Plain-Python dict (JSON-ready) describing the whole cohort."""
+    trend = trends(entries)
+    onset = parosmia_onset(entries, window, min_days)
+    oil_trend = trends(entries, "oil")
+    month_numbers, curves = monthly(entries)
+    month = months(entries)
+    known = entries.sensation >= 0
+    shares = np.bincount(month[known] * len(SENSATIONS) + entries.sensation[known],
+                         minlength=len(month_numbers) * len(SENSATIONS)).reshape(-1, len(SENSATIONS))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        shares = shares / shares.sum(axis=1, keepdims=True)
+    # Entries are sorted, so a session starts wherever patient, day or session changes.
+    new = (np.diff(entries.patient) != 0) | (np.diff(entries.day).astype(int) != 0) | (np.diff(entries.session) != 0)
+    sessions = int(new.sum()) + 1 if len(entries) else 0
+    has_trend = ~np.isnan(trend.slope)
+    with_onset = onset >= 0
+
+    def clean(a):
+        return [None if np.isnan(v) else round(float(v), 3) for v in a]
+
+    return {
+        "pacjenci": len(entries.patients),
+        "wpisy": len(entries),
+        "sesje": int(sessions),
+        "pominiete_wiersze": entries.skipped,
+        "poprawa": round(float((trend.slope[has_trend] > 0).mean()), 3) if has_trend.any() else None,
+        "nachylenie_mediana": round(float(np.median(trend.slope[has_trend])), 4) if has_trend.any() else None,
+        "parosmia": round(float(with_onset.mean()), 3) if len(onset) else None,
+        "parosmia_dzien_mediana": float(np.median(onset[with_onset])) if with_onset.any() else None,
+        "srednia_w_miesiacu": clean(curves["wszystkie"]),
+        "odczucia_w_miesiacu": {name: clean(shares[:, i]) for i, name in enumerate(SENSATIONS)},
+        "olejki": {name: {"srednia": clean([oil_trend.mean[i]])[0],
+                          "nachylenie": clean([oil_trend.slope[i]])[0],
+                          "wpisy": int(oil_trend.count[i])}
+                   for i, name in enumerate(entries.oils)},
+    }
+
+
+# === CHARTS ===
+
+def _palette(theme="Aromagic"):
+    colors = themes.load(theme).colors
+    names = ("purple", "green", "purple_dark", "text_sec", "text_muted")
+    return [colors[n] for n in names if n in colors] or ["#7E57C2"]
+
+
+def chart_drawing(month_numbers, curves, width=480, height=220, font=None, theme="Aromagic"):
+    """ReportLab Drawing of monthly() curves: intensity 0–5 over training months.
+
+    Draw it on a canvas with reportlab.graphics.renderPDF.draw(); font
+    should be a registered font with Polish glyphs (the backend's FONT).
+    """
+    from reportlab.graphics.charts.legends import Legend
+    from reportlab.graphics.charts.lineplots import LinePlot
+    from reportlab.graphics.shapes import Drawing
+    from reportlab.lib.colors import HexColor
+
+    font = font or "Helvetica"
+    palette = [HexColor(c) for c in _palette(theme)]
+    d = Drawing(width, height)
+    plot = LinePlot()
+    plot.x, plot.y, plot.width, plot.height = 36, 40, width - 48, height - 56
+    plot.data = [[(int(m), float(v)) for m, v in zip(month_numbers, ys) if not np.isnan(v)] or [(0, 0)]
+                 for ys in curves.values()]
+    plot.xValueAxis.valueMin, plot.xValueAxis.valueMax = 0, max(1, len(month_numbers) - 1)
+    plot.xValueAxis.valueStep = max(1, len(month_numbers) // 12)
+    plot.xValueAxis.labelTextFormat = lambda m: "%d" % (m + 1)
+    plot.yValueAxis.valueMin, plot.yValueAxis.valueMax, plot.yValueAxis.valueStep = 0, MAX_INTENSITY, 1
+    for axis in (plot.xValueAxis, plot.yValueAxis):
+        axis.labels.fontName, axis.labels.fontSize = font, 8
+    for i in range(len(plot.data)):
+        plot.lines[i].strokeColor = palette[i % len(palette)]
+        plot.lines[i].strokeWidth = 1.5
+    d.add(plot)
+    legend = Legend()
+    legend.x, legend.y, legend.fontName, legend.fontSize = 36, 14, font, 8
+    legend.alignment, legend.columnMaximum, legend.dx, legend.dy = "right", 1, 8, 8
+    legend.colorNamePairs = [(palette[i % len(palette)], name) for i, name in enumerate(curves)]
+    d.add(legend)
+    return d
+
+
+def add_pptx_chart(slide, x, y, cx, cy, month_numbers, curves, theme="Aromagic"):
+    """Native line chart of monthly() curves on a python-pptx slide (EMU box)."""
+    from pptx.chart.data import CategoryChartData
+    from pptx.dml.color import RGBColor
+    from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
+
+    data = CategoryChartData()
+    data.categories = ["%d" % (m + 1) for m in month_numbers]
+    for name, ys in curves.items():
+        data.add_series(name, [None if np.isnan(v) else round(float(v), 2) for v in ys])
+    chart = slide.shapes.add_chart(XL_CHART_TYPE.LINE, x, y, cx, cy, data).chart
+    chart.has_legend = len(curves) > 1
+    if chart.has_legend:
+        chart.legend.position = XL_LEGEND_POSITION.BOTTOM
+        chart.legend.include_in_layout = False
+    axis = chart.value_axis
+    axis.minimum_scale, axis.maximum_scale, axis.major_unit = 0, MAX_INTENSITY, 1
+    palette = _palette(theme)
+    for i, series in enumerate(chart.series):
+        series.format.line.color.rgb = RGBColor.from_string(palette[i % len(palette)].lstrip("#"))
+        series.smooth = False
+    return chart
+
+
+# === REPORT ===
+
+def write_pdf(entries, out_path):
+    """One A4 page: cohort curve and per-oil curves."""
+    import build_all
+    from reportlab.graphics import renderPDF
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen import canvas
+
+    aromagic = build_all.load_backend("Aromagic")
+    aromagic.register_fonts()
+    c = canvas.Canvas(out_path, pagesize=A4)
+    c.setTitle("Postępy treningu węchowego")
+    w, h = A4
+    y = h - 60
+    c.setFont(aromagic.FONT_BOLD, 18)
+    c.setFillColor(aromagic.TEXT)
+    c.drawString(40, y, "Postępy treningu węchowego")
+    for title, by in (("Średnia intensywność w kolejnych miesiącach", None), ("Według olejków", "oil")):
+        y -= 30
+        c.setFont(aromagic.FONT_SEMI, 11)
+        c.drawString(40, y, title)
+        drawing = chart_drawing(*monthly(entries, by), width=w - 80, height=300, font=aromagic.FONT)
+        y -= 310
+        renderPDF.draw(drawing, c, 40, y)
+    c.save()
+
+
+def write_pptx(entries, out_path):
+    """Two slides (16:9): cohort curve and per-oil curves."""
+    from pptx import Presentation
+    from pptx.util import Inches, Pt
+
+    prs = Presentation()
+    prs.slide_width, prs.slide_height = Inches(13.333), Inches(7.5)
+    for title, by in (("Średnia intensywność w kolejnych miesiącach", None), ("Według olejków", "oil")):
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        box = slide.shapes.add_textbox(Inches(0.6), Inches(0.4), Inches(12), Inches(0.8))
+        box.text_frame.text = title
+        box.text_frame.paragraphs[0].runs[0].font.size = Pt(28)
+        add_pptx_chart(slide, Inches(0.6), Inches(1.4), Inches(12.1), Inches(5.6), *monthly(entries, by))
+    prs.save(out_path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analiza postępów treningu węchowego z wpisów dzienniczków.")
+    parser.add_argument("source", help="wpisy: plik CSV albo JSON")
+    parser.add_argument("--json", metavar="PLIK", help="zapisz podsumowanie kohorty jako JSON")
+    parser.add_argument("--pdf", metavar="PLIK", help="wykresy w PDF")
+    parser.add_argument("--pptx", metavar="PLIK", help="wykresy w PPTX")
+    args = parser.parse_args(argv)
+    try:
+        entries = load(args.source)
+    except (OSError, ValueError) as e:
+        print("BŁĄD: %s" % e, file=sys.stderr)
+        return 1
+    summary = cohort_summary(entries)
+    print(f"{summary['pacjenci']} pacjentów, {summary['sesje']} sesji, {summary['wpisy']} wpisów "
+          f"({summary['pominiete_wiersze']} pominiętych)")
+    if summary["poprawa"] is not None:
+        print(f"poprawa u {summary['poprawa']:.0%} pacjentów, "
+              f"mediana nachylenia {summary['nachylenie_mediana']:+.3f} pkt/tydz.")
+    if summary["parosmia"] is not None:
+        onset = summary["parosmia_dzien_mediana"]
+        print(f"parosmia u {summary['parosmia']:.0%} pacjentów"
+              + (f", mediana początku: {onset:.0f}. dzień" if onset is not None else ""))
+    for name, oil in summary["olejki"].items():
+        slope = "—" if oil["nachylenie"] is None else "%+.3f" % oil["nachylenie"]
+        print(f"  {name:20s} średnio {oil['srednia']:.2f}  nachylenie {slope:>7s}  {oil['wpisy']:7d} wpisów")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=1)
+    if args.pdf:
+        write_pdf(entries, args.pdf)
+    if args.pptx:
+        write_pptx(entries, args.pptx)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""Responsive, fingerprinted images for the site pages.
+
+The source images live once, next to the deck that uses them
+(``projekty/<projekt>/grafika-*.png``). Every ``<img src="img/NAME">`` in a
+page is rewritten to a ``<picture>`` with AVIF and WebP sources and a JPEG
+(PNG for images with transparency) fallback, each in a few widths with a
+``srcset``. Output files are named after the content of the source and the
+encoder settings (``grafika-zasady-960.3f2a9c81de.webp``), so an existing
+output is always up to date and can be cached forever; only these outputs
+are copied into docs/.
+
+The rewrite is idempotent: ``<picture data-asset="NAME">`` is regenerated
+from NAME on every run, and outputs no longer referenced are removed. Pages
+are rewritten in strona/; sitebuild.py then publishes them to docs/.
+
+    python3 narzedzia/assets.py && python3 narzedzia/sitebuild.py
+"""
+
+import argparse
+import html
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image, features
+
+import cache
+import sitebuild
+
+ROOT = cache.ROOT
+
+# (page source, directory with the source images). Images are served from
+# img/ next to the published page.
+PAGES = [
+    ("strona/trening-wechowy/index.html", "projekty/trening-wechowy"),
+]
+IMG_DIR = "img"
+
+WIDTHS = (480, 960, 1600)
+# Per-image overrides of (widths, sizes); the default sizes suits the
+# 1280×720 slides, where pictures fill at most about half of the screen.
+SIZES = "(max-aspect-ratio: 4/3) 100vw, 60vw"
+OVERRIDES = {
+    "aromagic_logo.png": ((160, 320), "160px"),
+}
+
+QUALITY = {"avif": 55, "webp": 78, "jpg": 82, "png": None}
+MIME = {"avif": "image/avif", "webp": "image/webp", "jpg": "image/jpeg", "png": "image/png"}
+SOURCE_EXTS = (".png", ".jpg", ".jpeg")
+
+# A processed <picture> (matched first, so its inner <img> is consumed too)
+# or a bare <img>.
+_TAG_RE = re.compile(r'<picture class="asset" data-asset="([^"]+)">.*?</picture>|<img\b[^>]*>', re.S)
+_IMG_RE = re.compile(r"<img\b[^>]*>", re.S)
+_ATTR_RE = re.compile(r'([\w-]+)="([^"]*)"')
+_OUTPUT_RE = re.compile(r"-\d+\.[0-9a-f]{10}\.(?:avif|webp|jpg|png)$")
+_GENERATED = {"src", "srcset", "sizes", "decoding"}
+
+
+def formats(has_alpha):
+    """Encoded formats, best first; the last one is the <img> fallback."""
+    out = ["avif"] if features.check("avif") else []
+    return out + ["webp", "png" if has_alpha else "jpg"]
+
+
+def fingerprint(source):
+    """Short content address of a source image and the encoder settings."""
+    return cache.digest(cache.file_digest(source), sorted(QUALITY.items()))[:10]
+
+
+def plan(source):
+    """{fmt: [(width, filename)]} for one source image."""
+    name = os.path.basename(source)
+    stem = os.path.splitext(name)[0]
+    with Image.open(source) as im:
+        width = im.width
+        has_alpha = im.mode in ("RGBA", "LA") or "transparency" in im.info
+    wanted, _ = OVERRIDES.get(name, (WIDTHS, SIZES))
+    widths = sorted({min(w, width) for w in wanted})
+    fp = fingerprint(source)
+    return {fmt: [(w, f"{stem}-{w}.{fp}.{fmt}") for w in widths]
+            for fmt in formats(has_alpha)}
+
+
+def encode(source, fmt, variants, out_dir):
+    """Worker: write the missing variants of one source in one format."""
+    missing = [(w, f) for w, f in variants if not os.path.exists(os.path.join(out_dir, f))]
+    if not missing:
+        return 0
+    with Image.open(source) as im:
+        im.load()
+        if fmt == "jpg" and im.mode != "RGB":
+            im = im.convert("RGB")
+        for w, filename in missing:
+            out = im if w == im.width else im.resize((w, round(im.height * w / im.width)),
+                                                      Image.LANCZOS)
+            path = os.path.join(out_dir, filename)
+            tmp = path + ".tmp"
+            options = {"optimize": True} if fmt in ("jpg", "png") else {}
+            if fmt == "jpg":
+                options["progressive"] = True
+            if QUALITY[fmt] is not None:
+                options["quality"] = QUALITY[fmt]
+            out.save(tmp, format={"jpg": "JPEG"}.get(fmt, fmt.upper()), **options)
+            os.replace(tmp, path)
+    return len(missing)
+
+
+def picture(name, attrs, variants):
+    """<picture> markup for one image; attrs are the original <img> attributes."""
+    _, sizes = OVERRIDES.get(name, (WIDTHS, SIZES))
+
+    def srcset(fmt):
+        return ", ".join(f"{IMG_DIR}/{f} {w}w" for w, f in variants[fmt])
+
+    *best, fallback = variants
+    out = [f'<picture class="asset" data-asset="{html.escape(name)}">']
+    out += [f'<source type="{MIME[fmt]}" srcset="{srcset(fmt)}" sizes="{sizes}" />' for fmt in best]
+    w, src = variants[fallback][len(variants[fallback]) // 2]
+    img = {"src": f"{IMG_DIR}/{src}", "srcset": srcset(fallback), "sizes": sizes}
+    img.update((k, v) for k, v in attrs.items() if k not in _GENERATED)
+    img["decoding"] = "async"
+    out.append("<img " + " ".join(f'{k}="{v}"' for k, v in img.items()) + " />")
+    return "".join(out) + "</picture>"
+
+
+def _image(m):
+    """(name, original <img> attributes) for a _TAG_RE match, name None if not ours."""
+    if m.group(1):
+        return html.unescape(m.group(1)), dict(_ATTR_RE.findall(_IMG_RE.search(m.group(0)).group(0)))
+    attrs = dict(_ATTR_RE.findall(m.group(0)))
+    src = attrs.get("src", "")
+    if src.startswith(IMG_DIR + "/") and src.lower().endswith(SOURCE_EXTS):
+        return src[len(IMG_DIR) + 1:], attrs
+    return None, attrs
+
+
+def references(text):
+    """Names of the images a page uses, processed or not."""
+    return {name for name, _ in map(_image, _TAG_RE.finditer(text)) if name}
+
+
+def rewrite(text, plans):
+    """Page text with every planned image turned into a <picture>."""
+    def replace(m):
+        name, attrs = _image(m)
+        return picture(name, attrs, plans[name]) if name in plans else m.group(0)
+    return _TAG_RE.sub(replace, text)
+
+
+def build(jobs=None, verbose=True):
+    """Process every page in PAGES; returns the number of files written."""
+    written = 0
+    for page, source_dir in PAGES:
+        page_path = os.path.join(ROOT, page)
+        out_dir = os.path.join(os.path.dirname(sitebuild.output_path(page_path)), IMG_DIR)
+        with open(page_path, encoding="utf-8") as f:
+            text = f.read()
+        plans, missing = {}, []
+        for name in sorted(references(text)):
+            source = os.path.join(ROOT, source_dir, name)
+            if os.path.exists(source):
+                plans[name] = (source, plan(source))
+            else:
+                missing.append(name)
+        for name in missing:
+            print(f"{page}: brak źródła {os.path.join(source_dir, name)}", file=sys.stderr)
+
+        os.makedirs(out_dir, exist_ok=True)
+        tasks = [(source, fmt, variants, out_dir)
+                 for source, variants_by_fmt in plans.values()
+                 for fmt, variants in variants_by_fmt.items()]
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            written += sum(pool.map(encode, *zip(*tasks))) if tasks else 0
+
+        new_text = rewrite(text, {name: v for name, (_, v) in plans.items()})
+        if new_text != text:
+            tmp = page_path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(new_text)
+            os.replace(tmp, page_path)
+
+        # Outputs are content-addressed: anything not referenced now is stale.
+        keep = {f for _, v in plans.values() for variants in v.values() for _, f in variants}
+        stale = [f for f in os.listdir(out_dir) if _OUTPUT_RE.search(f) and f not in keep]
+        for f in stale:
+            os.remove(os.path.join(out_dir, f))
+        if verbose:
+            size = sum(os.path.getsize(os.path.join(out_dir, f)) for f in keep)
+            print(f"{page}: {len(plans)} obrazów, {len(keep)} wariantów "
+                  f"({size / 1e6:.1f} MB), zapisano {written}, usunięto {len(stale)}")
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Responsywne, fingerprintowane obrazy dla docs/.")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="liczba procesów (domyślnie: liczba rdzeni)")
+    args = parser.parse_args(argv)
+    build(max(1, args.jobs))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Build every deck × theme under projekty/ in parallel.
+
+A deck is any ``projekty/<projekt>/slides.py`` exposing ``build_deck()``, or
+any Markdown file next to it (compiled by md.py).
+Each (deck, theme) pair is rendered in its own worker process, so ReportLab
+and python-pptx work runs on all cores. Outputs land next to the deck source
+and go through the same content-hash cache as build.py. Text that a backend
+had to split onto a "(cd.)" slide or shrink, and text that still does not
+fit, is listed after the build (see fit.py); only rendered artifacts are
+checked, so use --force to check them all.
+
+    python3 narzedzia/build_all.py -j 16
+    python3 narzedzia/build_all.py --force --diagnostics fit.json
+"""
+
+import argparse
+import glob
+import importlib
+import importlib.util
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import cache
+import fit
+import md
+import themes
+
+ROOT = cache.ROOT
+PROJECTS_DIR = os.path.join(ROOT, "projekty")
+DECK_SOURCE = "slides.py"
+MARKDOWN_SOURCES = "*.md"
+
+# Themes are data files (see themes.py) naming the engine that draws them;
+# engines live with the original deck and give, per theme, a backend with
+# SUFFIX, EXT, output_path(deck, outdir) and render(deck, out_path).
+BACKEND_DIR = os.path.join(PROJECTS_DIR, "trening-wechowy")
+THEMES = themes.available()
+
+
+def discover(projects_dir=PROJECTS_DIR):
+    """[(project, deck_source_path)] for every deck source in every project."""
+    found = []
+    for project_dir in sorted(glob.glob(os.path.join(projects_dir, "*", ""))):
+        project = os.path.basename(os.path.dirname(project_dir))
+        paths = glob.glob(os.path.join(project_dir, DECK_SOURCE))
+        paths += sorted(glob.glob(os.path.join(project_dir, MARKDOWN_SOURCES)))
+        found.extend((project, path) for path in paths)
+    return found
+
+
+def load_backend(theme):
+    if BACKEND_DIR not in sys.path:
+        sys.path.insert(0, BACKEND_DIR)
+    return importlib.import_module(THEMES[theme]).backend(themes.load(theme))
+
+
+_decks = {}
+
+
+def load_deck(project, source):
+    """Import a deck source under a unique module name; memoized per process."""
+    if source not in _decks and source.endswith(".md"):
+        _decks[source] = md.load_deck(source)
+    if source not in _decks:
+        spec = importlib.util.spec_from_file_location("slides_" + project.replace("-", "_"), source)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _decks[source] = module.build_deck()
+    return _decks[source]
+
+
+def build_one(project, source, theme, force=False):
+    """Worker: render one artifact. Returns a result dict (picklable)."""
+    t0 = time.perf_counter()
+    deck = load_deck(project, source)
+    backend = load_backend(theme)
+    out_path = backend.output_path(deck, os.path.dirname(source))
+    key = cache.artifact_key(deck, backend)
+    result = {"project": project, "theme": theme, "out_path": out_path,
+              "slides": None, "entry": None, "diagnostics": []}
+    if force or not cache.BuildCache().is_fresh(out_path, key):
+        out_path, result["slides"] = backend.render(deck, out_path)
+        # Workers must not write the manifest concurrently; the parent merges.
+        result["entry"] = cache.make_entry(out_path, key, deck)
+        result["diagnostics"] = [o._asdict() for o in fit.drain()]
+    result["seconds"] = time.perf_counter() - t0
+    return result
+
+
+def run(tasks, jobs, force=False):
+    results, errors = [], []
+    if jobs == 1:
+        for task in tasks:
+            try:
+                results.append(build_one(*task, force=force))
+            except Exception as e:
+                errors.append((task, e))
+        return results, errors
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(build_one, *task, force=force): task for task in tasks}
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                errors.append((futures[future], e))
+    return results, errors
+
+
+def report_diagnostics(results, path=None):
+    """Print what does not fit (and a count of what was split or shrunk)."""
+    found = [fit.Overflow(**d) for r in results for d in r["diagnostics"]]
+    for o in found:
+        if o.action == fit.OVERFLOW:
+            print("UWAGA: " + o.describe(), file=sys.stderr)
+    counts = {a: sum(o.action == a for o in found) for a in (fit.SPLIT, fit.SHRINK, fit.OVERFLOW)}
+    if found:
+        print("Dopasowanie tekstu: %(split)d podziałów, %(shrink)d zmniejszeń, "
+              "%(overflow)d przepełnień" % counts)
+    if path:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump([o._asdict() for o in found], f, ensure_ascii=False, indent=1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Buduje wszystkie prezentacje (projekt × motyw).")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="liczba procesów (domyślnie: liczba rdzeni)")
+    parser.add_argument("--force", action="store_true", help="ignoruj cache, buduj wszystko")
+    parser.add_argument("--project", action="append", help="tylko wskazane projekty")
+    parser.add_argument("--theme", action="append", choices=sorted(THEMES), help="tylko wskazane motywy")
+    parser.add_argument("--diagnostics", metavar="PLIK",
+                        help="zapisz podziały, zmniejszenia i przepełnienia slajdów jako JSON")
+    args = parser.parse_args(argv)
+
+    decks = [(p, s) for p, s in discover() if not args.project or p in args.project]
+    selected = args.theme or list(THEMES)
+    tasks = [(project, source, theme) for project, source in decks for theme in selected]
+    if not tasks:
+        print("Brak prezentacji do zbudowania.")
+        return 0
+
+    jobs = max(1, min(args.jobs, len(tasks)))
+    t0 = time.perf_counter()
+    results, errors = run(tasks, jobs, force=args.force)
+    wall = time.perf_counter() - t0
+
+    build_cache = cache.BuildCache()
+    for r in results:
+        if r["entry"]:
+            build_cache.merge(*r["entry"])
+    build_cache.save()
+
+    for r in sorted(results, key=lambda r: (r["project"], r["theme"])):
+        status = "bez zmian" if r["slides"] is None else f"{r['slides']:3d} slajdów"
+        print(f"{r['project']:22s} {r['theme']:10s} {status:12s} {r['seconds']:6.2f}s  "
+              f"{os.path.relpath(r['out_path'], ROOT)}")
+    for (project, source, theme), e in errors:
+        print(f"{project:22s} {theme:10s} BŁĄD: {os.path.basename(source)}: {e!r}", file=sys.stderr)
+    report_diagnostics(results, args.diagnostics)
+    total = sum(r["seconds"] for r in results)
+    print(f"{len(results)} artefaktów, -j {jobs}: {wall:.2f}s "
+          f"(suma czasów {total:.2f}s, przyspieszenie {total / wall if wall else 0:.1f}×)")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+"""Content-hash build cache.
+
+Every artifact is keyed on a fingerprint of everything that can change it:
+the deck content (hashed per slide), the backend's theme constants and source,
+the shared layout code in SOURCES, and referenced asset files such as
+``aromagic_logo.png`` and the fonts text is measured with. If the key recorded
+in the manifest matches and the output file is still the one we wrote, the
+build is skipped.
+
+The manifest is a small JSON file in ``BUILD_CACHE_DIR`` (default:
+``.build-cache`` in the repository root).
+"""
+
+import hashlib
+import inspect
+import json
+import os
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.abspath(os.path.join(HERE, os.pardir))
+CACHE_DIR = os.environ.get("BUILD_CACHE_DIR", os.path.join(ROOT, ".build-cache"))
+MANIFEST = "manifest.json"
+# Tool modules every backend lays out and paginates its output with.
+SOURCES = [os.path.join(HERE, name) for name in ("deck.py", "fit.py", "pdfpages.py")]
+
+_file_digests = {}
+
+
+def digest(*parts):
+    """sha256 hex digest of the repr of parts."""
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(repr(part).encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def file_digest(path):
+    """sha256 of a file's bytes, memoized on (path, mtime, size)."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    key = (path, st.st_mtime_ns, st.st_size)
+    if key not in _file_digests:
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                h.update(chunk)
+        _file_digests[key] = h.hexdigest()
+    return _file_digests[key]
+
+
+def slide_digests(deck):
+    """One digest per slide, plus one for the cover fields."""
+    cover = digest(deck.name, deck.title, deck.subtitle, deck.label, deck.author, deck.credit)
+    return [cover] + [digest(s) for s in deck.slides]
+
+
+def _constant(value):
+    if isinstance(value, str) and os.path.isabs(value):
+        return file_digest(value) if os.path.isfile(value) else None
+    if isinstance(value, (list, tuple)):
+        return [_constant(v) for v in value]
+    if isinstance(value, dict):
+        return sorted((repr(k), _constant(v)) for k, v in value.items())
+    return repr(value)
+
+
+def theme_digest(backend):
+    """Digest of a backend: its UPPER_CASE constants and its source file.
+
+    Constants are listed explicitly so that colors/fonts resolved at import
+    time (e.g. FONT falling back to Helvetica) also invalidate the cache.
+    Absolute paths count by the contents of the file they name, so the key
+    does not depend on where the repository is checked out.
+    A backend may also be an object built from a theme file (see themes.py);
+    then its attributes and its class's module count.
+    """
+    constants = sorted(
+        (name, _constant(value)) for name, value in vars(backend).items()
+        if name.isupper() and not inspect.ismodule(value)
+    )
+    source = backend if inspect.ismodule(backend) else type(backend)
+    return digest(constants, file_digest(inspect.getsourcefile(source)))
+
+
+def artifact_key(deck, backend, extra=()):
+    assets = [(os.path.basename(p), file_digest(p)) for p in getattr(backend, "ASSETS", ())]
+    return digest(slide_digests(deck), theme_digest(backend), assets,
+                  [file_digest(p) for p in SOURCES], list(extra))
+
+
+def _entry_name(out_path):
+    # Relative to the repo root so the manifest survives a different checkout path.
+    return os.path.relpath(os.path.abspath(out_path), ROOT)
+
+
+def make_entry(out_path, key, deck):
+    """(name, entry) describing a finished build, for BuildCache.merge()."""
+    return _entry_name(out_path), {
+        "key": key,
+        "output": file_digest(out_path),
+        "slides": slide_digests(deck),
+    }
+
+
+class BuildCache:
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.path = os.path.join(cache_dir, MANIFEST)
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except (FileNotFoundError, ValueError):
+            self.entries = {}
+        self.dirty = False
+
+    def is_fresh(self, out_path, key):
+        entry = self.entries.get(_entry_name(out_path))
+        return (entry is not None
+                and entry["key"] == key
+                and entry["output"] == file_digest(out_path))
+
+    def changed_slides(self, out_path, deck):
+        """Indices (0 = cover) of slides whose content differs from the last build."""
+        entry = self.entries.get(_entry_name(out_path))
+        new = slide_digests(deck)
+        old = entry["slides"] if entry else []
+        return [i for i, d in enumerate(new) if i >= len(old) or old[i] != d]
+
+    def record(self, out_path, key, deck):
+        """Remember a finished build."""
+        self.merge(*make_entry(out_path, key, deck))
+
+    def record_file(self, out_path, key):
+        """Remember an output that is not a whole deck (e.g. one rasterized page)."""
+        self.merge(_entry_name(out_path), {"key": key, "output": file_digest(out_path)})
+
+    def forget(self, out_path):
+        if self.entries.pop(_entry_name(out_path), None) is not None:
+            self.dirty = True
+
+    def merge(self, name, entry):
+        """Add an entry recorded by another process (see build_all.py)."""
+        self.entries[name] = entry
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=1, ensure_ascii=False)
+        os.replace(tmp, self.path)
+        self.dirty = False
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""Compact WebVTT/SRT captions from the rolling auto-captions in transkrypcje/.
+
+Every phrase of the source .srt files is on screen in two overlapping cues.
+The sentences of srt.merge_cues() don't overlap; each becomes one cue, or,
+when it is too long to read at once, a few cues split at word boundaries
+(after a comma where possible), timed by character position. Short
+sentences in a row share a cue while it stays readable. A cue never holds
+part of a sentence with another, and has at most two balanced lines.
+
+Files are streamed cue by cue, lectures are converted in parallel, and an
+output is rewritten only when its source or the settings below change.
+Outputs are named after the lecture (``01-jak-aromaterapia-zmienia-mozg.vtt``,
+``...-en.vtt`` for English) and go to docs/napisy/ for the site.
+
+    python3 narzedzia/captions.py                  # all lectures, .vtt
+    python3 narzedzia/captions.py -f vtt srt 06    # one lecture, both formats
+"""
+
+import argparse
+import glob
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import cache
+import polish
+import srt
+import transcripts
+
+OUT_DIR = os.path.join(cache.ROOT, "docs", "napisy")
+FORMATS = ("vtt", "srt")
+
+LINE_CHARS = 42   # per caption line
+CUE_CHARS = 84    # two lines
+MIN_CUE_MS = 700  # a split never leaves a piece shorter than this on screen
+MAX_CUE_MS = 7000  # sentences are joined into one cue up to this long
+
+
+class Caption(NamedTuple):
+    start: int  # ms
+    end: int    # ms
+    text: str   # lines separated by "\n"
+
+
+def wrap(text, width=LINE_CHARS):
+    """text on one line, or two lines of about equal length."""
+    if len(text) <= width:
+        return text
+    middle = len(text) // 2
+    spaces = [i for i, c in enumerate(text) if c == " "]
+    if not spaces:
+        return text
+    cut = min(spaces, key=lambda i: abs(i - middle))
+    return text[:cut] + "\n" + text[cut + 1:]
+
+
+def chunks(text, max_chars=CUE_CHARS):
+    """Split text into pieces of at most max_chars (longer words stay whole),
+    about equal in length, ending after a comma when that comes close."""
+    if len(text) <= max_chars:
+        return [text]
+    count = -(-len(text) // max_chars)
+    limit = min(max_chars, -(-len(text) // count) + 10)
+    out, current = [], ""
+    for word in text.split():
+        if current and len(current) + 1 + len(word) > limit:
+            out.append(current)
+            current = word
+        else:
+            current = current + " " + word if current else word
+        if current.endswith(",") and len(current) >= 0.6 * limit:
+            out.append(current)
+            current = ""
+    if current:
+        out.append(current)
+    return out
+
+
+def pieces(sentences, max_chars=CUE_CHARS):
+    """Yield (start, end, text, whole) per cue-sized piece of each sentence;
+    whole is False for the parts of a split sentence."""
+    for sentence in sentences:
+        parts = chunks(sentence.text, max_chars)
+        span = sentence.end - sentence.start
+        if len(parts) > 1 and span < MIN_CUE_MS * len(parts):
+            parts = [sentence.text]  # too fast to split: one long cue
+        total = sum(len(p) for p in parts) + len(parts) - 1
+        pos, start = 0, sentence.start
+        for i, piece in enumerate(parts):
+            pos += len(piece) + (1 if i < len(parts) - 1 else 0)
+            end = sentence.end if i == len(parts) - 1 else sentence.start + span * pos // total
+            yield start, end, piece, len(parts) == 1
+            start = end
+
+
+def captions(sentences, max_chars=CUE_CHARS, max_ms=MAX_CUE_MS):
+    """Yield Caption objects for a stream of srt.Sentence."""
+    held = None  # (start, end, text) of whole sentences not yet written
+    for start, end, text, whole in pieces(sentences, max_chars):
+        if (held and whole and len(held[2]) + 1 + len(text) <= max_chars
+                and end - held[0] <= max_ms):
+            held = (held[0], end, held[2] + " " + text)
+            continue
+        if held:
+            yield Caption(held[0], held[1], wrap(held[2]))
+        held = (start, end, text) if whole else None
+        if not whole:
+            yield Caption(start, end, wrap(text))
+    if held:
+        yield Caption(held[0], held[1], wrap(held[2]))
+
+
+def vtt_timestamp(ms):
+    """62345 -> '01:02.345'; WebVTT leaves out a zero hour."""
+    text = srt.format_timestamp(ms, ".")
+    return text[3:] if text.startswith("00:") else text
+
+
+def write_vtt(caps, f):
+    """Write captions as WebVTT; returns the cue count."""
+    f.write("WEBVTT\n")
+    n = 0
+    for n, c in enumerate(caps, 1):
+        f.write("\n%s --> %s\n%s\n" % (vtt_timestamp(c.start), vtt_timestamp(c.end), c.text))
+    return n
+
+
+def write_srt(caps, f):
+    """Write captions as SubRip; returns the cue count."""
+    n = 0
+    for n, c in enumerate(caps, 1):
+        f.write("%s%d\n%s --> %s\n%s\n" % ("\n" if n > 1 else "", n, srt.format_timestamp(c.start),
+                                           srt.format_timestamp(c.end), c.text))
+    return n
+
+
+WRITERS = {"vtt": write_vtt, "srt": write_srt}
+
+
+def output_name(filename, fmt):
+    """'11. Epidemiologia ... (EN).srt' -> '11-epidemiologia-...-en.vtt'"""
+    number, title, lang = transcripts.lecture_meta(filename)
+    slug = re.sub(r"[^a-z0-9]+", "-", polish.fold(title).lower()).strip("-")
+    return "-".join(p for p in (number, slug, "en" if lang == "en" else "") if p) + "." + fmt
+
+
+def settings_key():
+    return cache.digest(LINE_CHARS, CUE_CHARS, MIN_CUE_MS, MAX_CUE_MS,
+                        cache.file_digest(__file__), cache.file_digest(srt.__file__))
+
+
+def convert(path, fmt, out_dir):
+    """Worker: stream one .srt into out_dir as fmt; returns (out path, cues)."""
+    out = os.path.join(out_dir, output_name(os.path.basename(path), fmt))
+    tmp = "%s.%d.tmp" % (out, os.getpid())
+    with open(tmp, "w", encoding="utf-8", newline="\n") as f:
+        count = WRITERS[fmt](captions(srt.iter_sentences(path)), f)
+    os.replace(tmp, out)
+    return out, count
+
+
+def select(queries, directory=transcripts.TRANSCRIPTS_DIR):
+    """Source .srt files: all, or those whose number or title matches a query."""
+    paths = sorted(glob.glob(os.path.join(directory, "*.srt")))
+    if not queries:
+        return paths
+    chosen = []
+    for path in paths:
+        number, title, _ = transcripts.lecture_meta(os.path.basename(path))
+        if any(q.lstrip("0") == number.lstrip("0") or q.lower() in title.lower() for q in queries):
+            chosen.append(path)
+    return chosen
+
+
+def build(paths, formats=("vtt",), out_dir=OUT_DIR, jobs=None, force=False, build_cache=None):
+    """Convert paths; returns [(source, out path, cues or None if fresh)]."""
+    if build_cache is None:
+        build_cache = cache.BuildCache()
+    os.makedirs(out_dir, exist_ok=True)
+    settings = settings_key()
+    results, tasks = [], []
+    for path in paths:
+        key = cache.digest(cache.file_digest(path), settings)
+        for fmt in formats:
+            out = os.path.join(out_dir, output_name(os.path.basename(path), fmt))
+            if not force and build_cache.is_fresh(out, key):
+                results.append((path, out, None))
+            else:
+                tasks.append((path, fmt, key))
+    if tasks:
+        with ProcessPoolExecutor(max_workers=min(jobs or os.cpu_count() or 1, len(tasks))) as pool:
+            done = pool.map(convert, [t[0] for t in tasks], [t[1] for t in tasks],
+                            [out_dir] * len(tasks))
+            for (path, _, key), (out, count) in zip(tasks, done):
+                build_cache.record_file(out, key)
+                results.append((path, out, count))
+    build_cache.save()
+    return sorted(results)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Zwarte napisy WebVTT/SRT z transkrypcji wykładów.")
+    parser.add_argument("lectures", nargs="*", help="numery lub fragmenty tytułów (domyślnie: wszystkie)")
+    parser.add_argument("-f", "--format", nargs="+", choices=FORMATS, default=["vtt"],
+                        help="formaty wyjściowe (domyślnie: vtt)")
+    parser.add_argument("-o", "--out", default=OUT_DIR, help="katalog wyjściowy (domyślnie: docs/napisy)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="liczba procesów (domyślnie: liczba rdzeni)")
+    parser.add_argument("--force", action="store_true", help="konwertuj także aktualne pliki")
+    args = parser.parse_args(argv)
+
+    paths = select(args.lectures)
+    if not paths:
+        print("BŁĄD: brak pasujących transkrypcji", file=sys.stderr)
+        return 1
+    results = build(paths, args.format, args.out, max(1, args.jobs), args.force)
+    total_in = total_out = 0
+    for path, out, count in results:
+        size_in, size_out = os.path.getsize(path), os.path.getsize(out)
+        total_in += size_in
+        total_out += size_out
+        state = "aktualny" if count is None else f"{count} napisów"
+        print(f"{os.path.basename(out)}: {size_in / 1e3:.1f} kB -> {size_out / 1e3:.1f} kB "
+              f"({size_out / size_in:.0%}, {state})")
+    print(f"razem: {total_in / 1e3:.1f} kB -> {total_out / 1e3:.1f} kB ({total_out / total_in:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
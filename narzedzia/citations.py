@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""Map slide claims to the transcript passages they most likely come from.
+
+Every text block of every deck (leads, bullets, cards, callouts, quotes…) is
+matched against all transcript passages at once: both sides become TF-IDF
+vectors over polish.terms(), and one NumPy matrix product scores every
+claim against every passage. The result is a source map
+page -> lecture file + timestamp, where page is the page of the Aromagic
+PDF on which the claim's slide starts (slides that overflow continue on
+"(cd.)" pages, so slide and page numbers drift apart).
+
+    python3 narzedzia/citations.py                 # all decks, table on stdout
+    python3 narzedzia/citations.py --json zrodla.json
+"""
+
+import argparse
+import itertools
+import json
+import sys
+
+import numpy as np
+
+import build_all
+import deck as dk
+import polish
+import srt
+import transcripts
+
+WINDOW = 2        # sentences per transcript passage (stride 1)
+# Below this a claim is reported as unsourced. Set on the current decks:
+# text written for the slides rather than taken from a lecture (the jar
+# preparation steps, short headings) still finds a best passage, sharing a
+# word or two with it, and scores 0.14-0.25; real sources mostly score more.
+MIN_SCORE = 0.25
+PAGES_THEME = "Aromagic"  # page numbers are those of this theme's PDF
+
+
+def first_pages(deck, backend):
+    """Page of the paginated deck on which every slide starts."""
+    counts = backend.page_counts(deck)  # cover first
+    return list(itertools.accumulate([1] + counts))[1:-1]
+
+
+def claims(deck, pages):
+    """[(page, slide_title, text)] for every sourceable text in a deck;
+    pages gives the page each slide starts on (see first_pages)."""
+    out = []
+    for no, slide in zip(pages, deck.slides):
+        for block in slide.blocks:
+            if isinstance(block, (dk.Lead, dk.Paragraph, dk.Callout, dk.Quote)):
+                texts = [block.text]
+            elif isinstance(block, (dk.Bullets, dk.Steps, dk.Checklist)):
+                texts = list(block.items)
+            elif isinstance(block, dk.Cards):
+                texts = [(c.title + ". " if c.title else "") + c.body for c in block.cards]
+            elif isinstance(block, dk.Stats):
+                texts = [number + " " + label for number, label in block.items]
+            else:
+                continue
+            out.extend((no, slide.title, dk.plain(t)) for t in texts)
+    return out
+
+
+def passages(store, lang="pl", window=WINDOW):
+    """[(file, start_ms, text)] sliding windows of sentences over all lectures."""
+    out = []
+    for lecture_id, file, number, title, l in store.lectures():
+        if lang and l != lang:
+            continue
+        rows = store.sentences(lecture_id)
+        for i in range(len(rows)):
+            chunk = rows[i:i + window]
+            out.append((file, chunk[0][0], " ".join(r[2] for r in chunk)))
+    return out
+
+
+class TfIdf:
+    """Sparse TF-IDF over a passage corpus, stored as flat NumPy arrays."""
+
+    def __init__(self, texts):
+        self.vocab = {}
+        doc_idx, term_idx = [], []
+        for d, text in enumerate(texts):
+            for term in polish.terms(text):
+                doc_idx.append(d)
+                term_idx.append(self.vocab.setdefault(term, len(self.vocab)))
+        n_docs, n_terms = len(texts), len(self.vocab)
+        # Collapse (doc, term) pairs into counts in one pass.
+        codes, counts = np.unique(np.asarray(doc_idx, np.int64) * n_terms
+                                  + np.asarray(term_idx, np.int64), return_counts=True)
+        self.doc_idx = codes // n_terms
+        self.term_idx = codes % n_terms
+        df = np.bincount(self.term_idx, minlength=n_terms)
+        self.idf = (np.log((n_docs + 1) / (df + 1)) + 1).astype(np.float32)
+        self.weights = (1 + np.log(counts)).astype(np.float32) * self.idf[self.term_idx]
+        norms = np.sqrt(np.bincount(self.doc_idx, self.weights ** 2, minlength=n_docs))
+        self.weights /= norms[self.doc_idx].astype(np.float32)
+        self.n_docs = n_docs
+
+    def query_matrix(self, queries):
+        """Normalized TF-IDF rows for queries, restricted to known terms.
+
+        Returns (Q, cols): Q has one column per vocabulary term used by any
+        query; cols maps those columns back to vocabulary ids.
+        """
+        rows = [[self.vocab[t] for t in polish.terms(q) if t in self.vocab] for q in queries]
+        cols = np.unique(np.fromiter((t for r in rows for t in r), np.int64))
+        col_of = {t: i for i, t in enumerate(cols)}
+        q = np.zeros((len(queries), len(cols)), np.float32)
+        for i, r in enumerate(rows):
+            for t in r:
+                q[i, col_of[t]] += 1
+        nz = q > 0
+        q[nz] = (1 + np.log(q[nz])) * self.idf[cols][np.nonzero(nz)[1]]
+        norms = np.linalg.norm(q, axis=1, keepdims=True)
+        return q / np.where(norms == 0, 1, norms), cols
+
+    def scores(self, queries):
+        """(len(queries), n_docs) cosine similarities in one matrix product."""
+        q, cols = self.query_matrix(queries)
+        d = np.zeros((self.n_docs, len(cols)), np.float32)
+        pos = np.searchsorted(cols, self.term_idx)
+        keep = (pos < len(cols)) & (cols[np.minimum(pos, len(cols) - 1)] == self.term_idx)
+        d[self.doc_idx[keep], pos[keep]] = self.weights[keep]
+        return q @ d.T
+
+
+def source_map(decks, store, lang="pl", min_score=MIN_SCORE):
+    """[{deck, page, title, claim, file, start, score, passage}] for all decks.
+
+    ValueError if there are no transcripts in lang to cite.
+    """
+    backend = build_all.load_backend(PAGES_THEME)
+    items = [(deck.name,) + c for deck in decks for c in claims(deck, first_pages(deck, backend))]
+    corpus = passages(store, lang)
+    if not corpus:
+        raise ValueError("brak transkrypcji w języku %s" % lang)
+    index = TfIdf([p[2] for p in corpus])
+    sim = index.scores([i[3] for i in items])
+    best = sim.argmax(axis=1)
+    out = []
+    for (name, no, title, claim), b, row in zip(items, best, sim):
+        score = float(row[b])
+        entry = {"deck": name, "page": no, "title": title, "claim": claim,
+                 "score": round(score, 3), "file": None, "start": None, "passage": None}
+        if score >= min_score:
+            file, start, text = corpus[b]
+            entry.update(file=file, start=srt.format_timestamp(start), passage=text)
+        out.append(entry)
+    return out
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mapa źródeł: slajd -> wykład + czas.")
+    parser.add_argument("--project", action="append", help="tylko wskazane projekty")
+    parser.add_argument("--lang", default="pl", choices=["pl", "en"])
+    parser.add_argument("--min-score", type=float, default=MIN_SCORE)
+    parser.add_argument("--json", metavar="PLIK", help="zapisz mapę źródeł do pliku JSON")
+    args = parser.parse_args(argv)
+
+    decks = [build_all.load_deck(p, s) for p, s in build_all.discover()
+             if not args.project or p in args.project]
+    try:
+        with transcripts.open_store() as store:
+            entries = source_map(decks, store, args.lang, args.min_score)
+    except ValueError as e:
+        print(f"BŁĄD: {e}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False, indent=1)
+    deck = None
+    for e in entries:
+        if e["deck"] != deck:
+            print(("\n" if deck else "") + e["deck"])
+            deck = e["deck"]
+        where = f"{e['file']} [{e['start']}]" if e["file"] else "— brak źródła —"
+        print(f"{e['page']:3d} {e['score']:.2f}  {where}\n      {e['claim'][:110]}")
+    unsourced = sum(1 for e in entries if not e["file"])
+    print(f"{len(entries)} twierdzeń, {unsourced} bez źródła.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
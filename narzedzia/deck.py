@@ -0,0 +1,197 @@
+"""In-memory slide deck model shared by every renderer.
+
+A ``Deck`` is built once (from Python literals or, later, from Markdown) and
+handed to any number of backends: PPTX Offerflow, PPTX doTERRA, PDF Aromagic.
+Blocks are plain immutable data; each backend decides how to draw them.
+
+Inline markup in block text is limited to ``<b>...</b>`` so that both
+ReportLab (which understands it natively) and python-pptx (via ``spans``)
+can render it.
+"""
+
+import re
+from dataclasses import dataclass, field, replace
+from typing import Optional, Tuple
+
+
+# === BLOCKS ===
+
+@dataclass(frozen=True)
+class Lead:
+    """Introductory paragraph right below the slide title."""
+    text: str
+    emphasis: bool = False
+
+
+@dataclass(frozen=True)
+class Heading:
+    text: str
+
+
+@dataclass(frozen=True)
+class Paragraph:
+    text: str
+
+
+@dataclass(frozen=True)
+class Bullets:
+    items: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class Steps:
+    """Numbered list."""
+    items: Tuple[str, ...]
+    start: int = 1  # number of the first item, for a list continued on another slide
+
+
+@dataclass(frozen=True)
+class Checklist:
+    items: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class Table:
+    headers: Tuple[str, ...]
+    rows: Tuple[Tuple[str, ...], ...]
+    widths: Optional[Tuple[float, ...]] = None  # fractions of content width
+
+    @classmethod
+    def from_columns(cls, headers, columns, widths=None):
+        """Table from one sequence per column, e.g. the columns of a data file."""
+        return cls(tuple(headers), tuple(tuple(map(str, row)) for row in zip(*columns)), widths)
+
+
+@dataclass(frozen=True)
+class Callout:
+    """Highlighted box; tone is "accent" or "success"."""
+    text: str
+    tone: str = "accent"
+
+
+@dataclass(frozen=True)
+class Quote:
+    text: str
+    cite: str = ""
+
+
+@dataclass(frozen=True)
+class Card:
+    title: Optional[str]
+    body: str
+    tone: Optional[str] = None  # None, "accent" or "success"
+
+
+@dataclass(frozen=True)
+class Cards:
+    cards: Tuple[Card, ...]
+    columns: int = 2
+
+
+@dataclass(frozen=True)
+class Stats:
+    """Big numbers with labels: ((number, label), ...)."""
+    items: Tuple[Tuple[str, str], ...]
+
+
+# === SLIDES ===
+
+@dataclass(frozen=True)
+class Slide:
+    section: str
+    title: str
+    blocks: Tuple[object, ...] = ()
+
+
+@dataclass(frozen=True)
+class Deck:
+    name: str          # used for output file names, e.g. "Trening Węchowy"
+    title: str
+    subtitle: str = ""
+    label: str = ""    # small pill on the cover, e.g. course name
+    author: str = ""
+    credit: str = ""
+    slides: Tuple[Slide, ...] = field(default_factory=tuple)
+
+    def output_name(self, suffix, ext):
+        """'<name> — Prezentacja<suffix>.<ext>'"""
+        return self.name + " — Prezentacja" + suffix + "." + ext
+
+
+def slide(section, title, *blocks):
+    return Slide(section, title, tuple(blocks))
+
+
+# === PAGINATION ===
+
+CONTINUED = " (cd.)"
+
+
+def continued(slide, blocks):
+    """Continuation of slide carrying the blocks that did not fit on it."""
+    title = slide.title if slide.title.endswith(CONTINUED) else slide.title + CONTINUED
+    return replace(slide, title=title, blocks=tuple(blocks))
+
+
+def split_table(table, row_heights, room, at_top=False):
+    """(head, rest) of a table cut where its rows stop fitting in room.
+
+    row_heights holds the header row's height and then every body row's, in
+    the backend's own units. Both parts repeat the headers. head is None
+    when not even one row fits (unless at_top: a slide that is already empty
+    takes at least one row), rest is None when the whole table fits.
+    """
+    used, n = row_heights[0], 0
+    for height in row_heights[1:]:
+        if used + height > room:
+            break
+        used += height
+        n += 1
+    if n == 0 and table.rows:
+        if not at_top:
+            return None, table
+        n = 1
+    if n == len(table.rows):
+        return table, None
+    return replace(table, rows=table.rows[:n]), replace(table, rows=table.rows[n:])
+
+
+# === INLINE MARKUP ===
+
+_TAG_RE = re.compile(r"(</?b>)")
+
+
+def spans(text):
+    """Split text with <b> markup into [(chunk, bold), ...]."""
+    out = []
+    bold = False
+    for part in _TAG_RE.split(text):
+        if part == "<b>":
+            bold = True
+        elif part == "</b>":
+            bold = False
+        elif part:
+            out.append((part, bold))
+    return out
+
+
+def plain(text):
+    """Text with inline markup removed."""
+    return _TAG_RE.sub("", text)
+
+
+# === ROUGH MEASUREMENT ===
+
+AVG_CHAR_EM = 0.52  # average glyph width of Inter/Helvetica in em
+
+
+def estimate_lines(text, font_size, width):
+    """Line count of wrapped text; font_size and width in points.
+
+    Good enough for backends that cannot measure text themselves (python-pptx).
+    """
+    per_line = max(1, int(width / (font_size * AVG_CHAR_EM)))
+    lines = 0
+    for para in plain(text).split("\n"):
+        lines += max(1, -(-len(para) // per_line))
+    return lines
@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""Personalized patient diaries (mail merge) as PDF.
+
+Reads a CSV of patients and their training plans and writes one diary PDF
+per patient: a cover with the plan, then one A4 page per week with a row
+per day and session and an intensity scale per oil. One row per patient:
+
+    pacjent      name printed on the diary (required)
+    olejki       oils separated by "/", "," or ";", at most MAX_OILS (required)
+    start        first day of training, YYYY-MM-DD (required)
+    miesiace     length of the plan, MIN_MONTHS to MAX_MONTHS (required)
+    sesje        sessions a day, 1 to 3 (default 2: morning and evening)
+    id           patient number, added to the file name; needed when two
+                 patients share a name (rows that clash are reported)
+
+The columns are separated by commas or, as Excel writes it with a Polish
+locale, by semicolons: whichever the header line uses.
+
+The CSV is read lazily and at most IN_FLIGHT diaries per worker are queued,
+so memory stays bounded for any number of patients; every PDF is written
+as soon as it is drawn. Fonts are registered and the logo is decoded and
+scaled once per worker process; within a diary the static part of a week
+page (grid, labels, oil names) is a Form XObject drawn once and placed on
+every page. Diaries go through the build cache keyed on the plan, so a
+rerun writes only the changed ones.
+
+    python3 narzedzia/diaries.py pacjenci.csv -o dzienniczki/
+"""
+
+import argparse
+import calendar
+import csv
+import datetime
+import functools
+import math
+import os
+import re
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import NamedTuple
+
+from PIL import Image
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfgen import canvas
+
+import build_all
+import cache
+
+aromagic = build_all.load_backend("Aromagic")
+
+PAGE_W, PAGE_H = A4
+MARGIN = 40
+CONTENT_W = PAGE_W - 2 * MARGIN
+
+MIN_MONTHS, MAX_MONTHS = 4, 24
+MAX_OILS = 6
+SESSIONS = {1: ("",), 2: ("rano", "wieczór"), 3: ("rano", "południe", "wieczór")}
+WEEKDAYS = ("pon", "wt", "śr", "czw", "pt", "sob", "nd")
+MONTHS = ("stycznia", "lutego", "marca", "kwietnia", "maja", "czerwca", "lipca",
+          "sierpnia", "września", "października", "listopada", "grudnia")
+SCALE = "0  1  2  3  4  5"
+
+# Week page geometry, pt from the top margin down.
+TABLE_TOP = 78
+HEADER_ROW = 26
+LEGEND_H = 46
+MAX_ROW_H = 40
+DAY_W, SESSION_W, NOTES_MIN_W = 62, 52, 110
+
+IN_FLIGHT = 4  # diaries queued per worker
+LOGO_W, LOGO_H, LOGO_DPI = 72, 18, 300
+
+
+# === PLANS ===
+
+class Plan(NamedTuple):
+    line: int          # CSV line, for messages
+    patient: str
+    oils: tuple
+    start: datetime.date
+    months: int
+    sessions: int = 2
+    id: str = ""
+
+    @property
+    def end(self):
+        """Last day of training."""
+        return add_months(self.start, self.months) - datetime.timedelta(days=1)
+
+    @property
+    def weeks(self):
+        return math.ceil(((self.end - self.start).days + 1) / 7)
+
+
+def add_months(day, months):
+    year, month = divmod(day.month - 1 + months, 12)
+    year, month = day.year + year, month + 1
+    return day.replace(year=year, month=month, day=min(day.day, calendar.monthrange(year, month)[1]))
+
+
+def parse_plan(line, row):
+    """Plan from one CSV row (dict); ValueError naming the line and field."""
+    def field(name, default=None):
+        value = (row.get(name) or "").strip()
+        if not value and default is None:
+            raise ValueError("wiersz %d: brak pola %s" % (line, name))
+        return value or default
+
+    oils = tuple(o.strip() for o in re.split(r"[/,;]", field("olejki")) if o.strip())
+    if not 1 <= len(oils) <= MAX_OILS:
+        raise ValueError("wiersz %d: od 1 do %d olejków, jest %d" % (line, MAX_OILS, len(oils)))
+    try:
+        start = datetime.date.fromisoformat(field("start"))
+        months, sessions = int(field("miesiace")), int(field("sesje", "2"))
+    except ValueError as e:
+        raise ValueError("wiersz %d: %s" % (line, e)) from None
+    if not MIN_MONTHS <= months <= MAX_MONTHS:
+        raise ValueError("wiersz %d: miesiace %d poza zakresem %d–%d" % (line, months, MIN_MONTHS, MAX_MONTHS))
+    if sessions not in SESSIONS:
+        raise ValueError("wiersz %d: sesje %d, dozwolone %s" % (line, sessions, ", ".join(map(str, SESSIONS))))
+    return Plan(line, field("pacjent"), oils, start, months, sessions, field("id", ""))
+
+
+def read_plans(path, errors):
+    """Yield the Plan of every valid row of the CSV; append the others' errors."""
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        header = f.readline()
+        f.seek(0)
+        reader = csv.DictReader(f, delimiter=";" if header.count(";") > header.count(",") else ",")
+        for row in reader:
+            try:
+                yield parse_plan(reader.line_num, row)
+            except ValueError as e:
+                errors.append(str(e))
+
+
+def output_name(plan):
+    name = re.sub(r'[\\/:*?"<>|]+', "-", plan.patient)
+    return "Dzienniczek — %s%s.pdf" % (name, " — " + plan.id if plan.id else "")
+
+
+def long_date(day):
+    return "%d %s %d" % (day.day, MONTHS[day.month - 1], day.year)
+
+
+# === DRAWING ===
+
+@functools.lru_cache(maxsize=None)
+def logo():
+    """The theme logo scaled to print resolution, decoded once per process."""
+    image = Image.open(aromagic.LOGO_PATH)
+    image.thumbnail((LOGO_W * LOGO_DPI // 72, LOGO_H * LOGO_DPI // 72))
+    return ImageReader(image)
+
+
+def fitted(text, font, size, width, min_size=6):
+    """Largest size up to size at which text fits width on one line."""
+    w = pdfmetrics.stringWidth(text, font, size)
+    return max(min_size, min(size, size * width / w)) if w else size
+
+
+class Layout(NamedTuple):
+    columns: tuple  # x of every column edge, left to right
+    row_h: float
+    top: float      # y of the top of the first data row
+
+
+@functools.lru_cache(maxsize=None)
+def layout(oils, sessions):
+    session_w = SESSION_W if sessions > 1 else 0
+    oil_w = min(80, (CONTENT_W - DAY_W - session_w - NOTES_MIN_W) / oils)
+    edges = [MARGIN, MARGIN + DAY_W, MARGIN + DAY_W + session_w]
+    edges += [edges[-1] + oil_w * (i + 1) for i in range(oils)] + [MARGIN + CONTENT_W]
+    if not session_w:
+        del edges[2]
+    top = PAGE_H - MARGIN - TABLE_TOP - HEADER_ROW
+    row_h = min(MAX_ROW_H, (top - MARGIN - LEGEND_H) / (7 * sessions))
+    return Layout(tuple(edges), row_h, top)
+
+
+def draw_logo(c):
+    c.drawImage(logo(), MARGIN, PAGE_H - MARGIN - LOGO_H, LOGO_W, LOGO_H,
+                preserveAspectRatio=True, mask="auto")
+
+
+def draw_cover(c, plan):
+    draw_logo(c)
+    y = PAGE_H - MARGIN - 90
+    c.setFont(aromagic.FONT_BOLD, 26)
+    c.setFillColor(aromagic.PURPLE)
+    c.drawString(MARGIN, y, "Dzienniczek treningu węchowego")
+    y -= 34
+    c.setFont(aromagic.FONT_BOLD, fitted(plan.patient, aromagic.FONT_BOLD, 18, CONTENT_W))
+    c.setFillColor(aromagic.TEXT)
+    c.drawString(MARGIN, y, plan.patient)
+    y -= 40
+    schedule = "%d× dziennie" % plan.sessions
+    if plan.sessions > 1:
+        schedule += ": " + ", ".join(SESSIONS[plan.sessions])
+    rows = (
+        ("Olejki", ", ".join(plan.oils)),
+        ("Początek", long_date(plan.start)),
+        ("Koniec", "%s (%d mies., %d tygodni)" % (long_date(plan.end), plan.months, plan.weeks)),
+        ("Sesje", schedule),
+    )
+    box_h = 26 * len(rows) + 20
+    c.setFillColor(aromagic.PURPLE_SOFT)
+    c.roundRect(MARGIN, y - box_h, CONTENT_W, box_h, 8, fill=1, stroke=0)
+    y -= 28
+    for label, value in rows:
+        c.setFont(aromagic.FONT_SEMI, 11)
+        c.setFillColor(aromagic.TEXT)
+        c.drawString(MARGIN + 18, y, label)
+        c.setFont(aromagic.FONT, fitted(value, aromagic.FONT, 11, CONTENT_W - 140))
+        c.setFillColor(aromagic.TEXT_SEC)
+        c.drawString(MARGIN + 120, y, value)
+        y -= 26
+    y -= 30
+    c.setFont(aromagic.FONT_SEMI, 13)
+    c.setFillColor(aromagic.TEXT)
+    c.drawString(MARGIN, y, "Jak prowadzić dzienniczek")
+    y -= 24
+    steps = (
+        "Każdy olejek wąchaj ok. 20 sekund, z 10–15 sekundami przerwy między zapachami.",
+        "Po każdej sesji zakreśl intensywność zapachu: 0 = nic nie czuję, 5 = zapach pełny i czysty.",
+        "W uwagach zapisz odczucia: nic / chłód / zniekształcony / czysty.",
+        "Parosmia (zapach zniekształcony) to dobry znak: neurony tworzą nowe połączenia.",
+        "Pierwsze efekty zwykle po 4 miesiącach; bądź systematyczny.",
+    )
+    c.setFont(aromagic.FONT, 10.5)
+    c.setFillColor(aromagic.TEXT_SEC)
+    for n, step in enumerate(steps, 1):
+        c.drawString(MARGIN, y, "%d." % n)
+        c.drawString(MARGIN + 16, y, step)
+        y -= 19
+
+
+def draw_week_form(c, plan):
+    """Everything a week page shares: header, grid, labels, scales, legend."""
+    lay = layout(len(plan.oils), plan.sessions)
+    edges, row_h, top = lay
+    draw_logo(c)
+    c.setFont(aromagic.FONT_SEMI, 9)
+    c.setFillColor(aromagic.TEXT_MUTED)
+    c.drawRightString(MARGIN + CONTENT_W, PAGE_H - MARGIN - 12, plan.patient)
+    # Header row
+    c.setFillColor(aromagic.BG_SOFT)
+    c.rect(MARGIN, top, CONTENT_W, HEADER_ROW, fill=1, stroke=0)
+    labels = ["Dzień"] + (["Pora"] if plan.sessions > 1 else []) + list(plan.oils) + ["Odczucia / uwagi"]
+    c.setFillColor(aromagic.TEXT)
+    for label, x0, x1 in zip(labels, edges, edges[1:]):
+        c.setFont(aromagic.FONT_SEMI, fitted(label, aromagic.FONT_SEMI, 8.5, x1 - x0 - 8))
+        c.drawString(x0 + 4, top + 9, label)
+    # Rows: zebra per day, sessions and intensity scales
+    rows = 7 * plan.sessions
+    first_oil = 2 if plan.sessions > 1 else 1
+    for day in range(7):
+        y = top - (day + 1) * plan.sessions * row_h
+        if day % 2:
+            c.setFillColor(aromagic.BG_SOFT)
+            c.rect(MARGIN, y, CONTENT_W, plan.sessions * row_h, fill=1, stroke=0)
+        for k, session in enumerate(SESSIONS[plan.sessions]):
+            base = top - (day * plan.sessions + k) * row_h - row_h / 2 - 3
+            c.setFillColor(aromagic.TEXT_SEC)
+            if session:
+                c.setFont(aromagic.FONT, 8)
+                c.drawString(edges[1] + 4, base, session)
+            c.setFillColor(aromagic.TEXT_MUTED)
+            for x0, x1 in zip(edges[first_oil:-2], edges[first_oil + 1:-1]):
+                c.setFont(aromagic.FONT, fitted(SCALE, aromagic.FONT, 8, x1 - x0 - 6))
+                c.drawCentredString((x0 + x1) / 2, base, SCALE)
+    # Grid
+    bottom = top - rows * row_h
+    c.setStrokeColor(aromagic.BORDER)
+    c.setLineWidth(0.5)
+    for r in range(rows + 1):
+        if r % plan.sessions == 0:
+            c.line(MARGIN, top - r * row_h, MARGIN + CONTENT_W, top - r * row_h)
+        else:
+            c.line(edges[1], top - r * row_h, MARGIN + CONTENT_W, top - r * row_h)
+    for x in edges:
+        c.line(x, top + HEADER_ROW, x, bottom)
+    c.line(MARGIN, top + HEADER_ROW, MARGIN + CONTENT_W, top + HEADER_ROW)
+    # Legend
+    c.setFont(aromagic.FONT, 8)
+    c.setFillColor(aromagic.TEXT_MUTED)
+    c.drawString(MARGIN, bottom - 16, "Intensywność: 0 = nic nie czuję … 5 = zapach pełny i czysty. "
+                                      "Odczucia: nic / chłód / zniekształcony / czysty.")
+    c.drawString(MARGIN, bottom - 30, "Parosmia (zapach zniekształcony) to dobry znak — "
+                                      "neurony nawiązują nowe połączenia.")
+
+
+def draw_week(c, plan, week):
+    """The parts of a week page that differ: dates, week number, days past the end."""
+    edges, row_h, top = layout(len(plan.oils), plan.sessions)
+    first = plan.start + datetime.timedelta(days=7 * week)
+    last = min(first + datetime.timedelta(days=6), plan.end)
+    c.setFont(aromagic.FONT_BOLD, 16)
+    c.setFillColor(aromagic.TEXT)
+    c.drawString(MARGIN, PAGE_H - MARGIN - 50, "Tydzień %d z %d" % (week + 1, plan.weeks))
+    c.setFont(aromagic.FONT, 10)
+    c.setFillColor(aromagic.TEXT_SEC)
+    c.drawRightString(MARGIN + CONTENT_W, PAGE_H - MARGIN - 50,
+                      "%s – %s" % (long_date(first), long_date(last)))
+    span = plan.sessions * row_h
+    for i in range(7):
+        day = first + datetime.timedelta(days=i)
+        y = top - i * span
+        if day > plan.end:
+            c.setFillColor(aromagic.BG)
+            c.rect(MARGIN + 0.5, y - span * (7 - i) + 0.5, CONTENT_W - 1, span * (7 - i) - 1, fill=1, stroke=0)
+            c.setFont(aromagic.FONT, 9)
+            c.setFillColor(aromagic.TEXT_MUTED)
+            c.drawString(MARGIN + 4, y - 14, "Koniec planu treningu.")
+            break
+        c.setFont(aromagic.FONT_SEMI, 9)
+        c.setFillColor(aromagic.TEXT)
+        c.drawString(MARGIN + 4, y - span / 2 + 1, "%s %02d.%02d" % (WEEKDAYS[day.weekday()], day.day, day.month))
+    c.setFont(aromagic.FONT, 8)
+    c.setFillColor(aromagic.TEXT_MUTED)
+    c.drawRightString(MARGIN + CONTENT_W, MARGIN / 2, "%d / %d" % (week + 2, plan.weeks + 1))
+
+
+def render(plan, out_path):
+    """Worker: write one diary; returns (path, pages)."""
+    aromagic.register_fonts()
+    tmp = "%s.%d.tmp" % (out_path, os.getpid())
+    c = canvas.Canvas(tmp, pagesize=A4, pageCompression=1)
+    c.setTitle("Dzienniczek treningu węchowego — " + plan.patient)
+    draw_cover(c, plan)
+    c.showPage()
+    c.beginForm("week")
+    draw_week_form(c, plan)
+    c.endForm()
+    for week in range(plan.weeks):
+        c.doForm("week")
+        draw_week(c, plan, week)
+        c.showPage()
+    c.save()
+    os.replace(tmp, out_path)
+    return out_path, plan.weeks + 1
+
+
+# === DRIVER ===
+
+@functools.lru_cache(maxsize=None)
+def source_key():
+    return cache.digest(cache.file_digest(os.path.abspath(__file__)), cache.theme_digest(aromagic),
+                        [cache.file_digest(p) for p in aromagic.ASSETS])
+
+
+def plan_key(plan):
+    return cache.digest(source_key(), plan._replace(line=0))
+
+
+def generate(plans, outdir, jobs=None, force=False, build_cache=None, errors=None):
+    """Write the diary of every plan (any iterable, consumed lazily).
+
+    Yields (plan, out_path, pages or None if fresh) as diaries finish. A
+    plan whose file name an earlier one already took (same patient, no id)
+    is not written: its error is appended to errors, or raised as
+    ValueError without a list.
+    """
+    if build_cache is None:
+        build_cache = cache.BuildCache()
+    jobs = jobs or os.cpu_count() or 1
+    os.makedirs(outdir, exist_ok=True)
+    taken = {}  # output name: CSV line
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = {}
+        for plan in plans:
+            name = output_name(plan)
+            if name in taken:
+                message = "wiersz %d: plik %s ma już wiersz %d; dodaj id" % (plan.line, name, taken[name])
+                if errors is None:
+                    raise ValueError(message)
+                errors.append(message)
+                continue
+            taken[name] = plan.line
+            out_path = os.path.join(outdir, name)
+            key = plan_key(plan)
+            if not force and build_cache.is_fresh(out_path, key):
+                yield plan, out_path, None
+                continue
+            pending[pool.submit(render, plan, out_path)] = (plan, key)
+            while len(pending) >= jobs * IN_FLIGHT:
+                yield from _finished(pending, build_cache, FIRST_COMPLETED)
+        while pending:
+            yield from _finished(pending, build_cache, FIRST_COMPLETED)
+    build_cache.save()
+
+
+def _finished(pending, build_cache, return_when):
+    done, _ = wait(pending, return_when=return_when)
+    for future in done:
+        plan, key = pending.pop(future)
+        out_path, pages = future.result()
+        build_cache.record_file(out_path, key)
+        yield plan, out_path, pages
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Spersonalizowane dzienniczki pacjentów (PDF) z pliku CSV.")
+    parser.add_argument("csv", help="plik CSV z pacjentami i planami treningu")
+    parser.add_argument("-o", "--outdir", default="dzienniczki", help="katalog wyjściowy (domyślnie: dzienniczki)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="liczba procesów (domyślnie: liczba rdzeni)")
+    parser.add_argument("--force", action="store_true", help="zapisz wszystkie dzienniczki")
+    args = parser.parse_args(argv)
+    t0 = time.perf_counter()
+    errors, written, fresh, pages = [], 0, 0, 0
+    for plan, out_path, count in generate(read_plans(args.csv, errors), args.outdir,
+                                          max(1, args.jobs), args.force, errors=errors):
+        if count is None:
+            fresh += 1
+        else:
+            written, pages = written + 1, pages + count
+    for e in errors:
+        print("BŁĄD: " + e, file=sys.stderr)
+    print(f"{written} dzienniczków ({pages} stron), {fresh} aktualnych, {len(errors)} błędów "
+          f"w {time.perf_counter() - t0:.2f}s  {args.outdir}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
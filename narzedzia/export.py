@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""Single-pass export of a Markdown document to HTML, PDF and PPTX.
+
+The Markdown file is parsed once (md.parse_file, with its section cache);
+the same sections feed every writer, so the handout and the deck cannot
+drift apart:
+
+    <stem>.html, <stem>.pdf          one section per page
+    <stem>_v2.html, <stem>_v2.pdf    compact: short sections share a page
+    <stem> — Prezentacja.pptx        the compiled deck (Offerflow theme)
+
+The HTML embeds dokument.css; the PDF is drawn with ReportLab on A4 with
+the same measurements, using the fonts, palette and wrap cache of the
+Aromagic backend. The writers run in worker processes, and every output
+goes through the build cache, so an unchanged file is not written again.
+
+    python3 narzedzia/export.py
+    python3 narzedzia/export.py "projekty/<projekt>/<dokument>.md" --force
+"""
+
+import argparse
+import functools
+import html
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import cm
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfgen import canvas
+from reportlab.platypus import Paragraph, Table, TableStyle
+
+import build_all
+import cache
+import deck as dk
+import md
+
+ROOT = cache.ROOT
+HERE = os.path.dirname(os.path.abspath(__file__))
+CSS_PATH = os.path.join(HERE, "dokument.css")
+DEFAULT_SOURCES = [
+    os.path.join(build_all.PROJECTS_DIR, "trening-wechowy", "Domowa Instrukcja Treningu Węchowego.md"),
+]
+
+# File-name suffix -> compact. In the compact variant a section shorter than
+# COMPACT_MAX_CHARS (plain text) follows the previous one on the same page.
+VARIANTS = {"": False, "_v2": True}
+COMPACT_MAX_CHARS = 700
+DECK_THEME = "Offerflow"
+
+aromagic = build_all.load_backend("Aromagic")
+
+
+# === DOCUMENT ===
+
+class Document(NamedTuple):
+    title: str
+    byline: str
+    sections: tuple  # md.Section per "##" section, in file order
+
+
+def load(path):
+    """(Document, Deck, number of sections parsed) from one pass over path."""
+    entries, parsed = md.parse_file(path)
+    sections = [s for s, _ in entries]
+    fields = md.cover_fields(path, sections)
+    byline = " · ".join(v for v in (fields.get("author"), fields.get("credit")) if v)
+    doc = Document(fields["title"], byline, tuple(s for s in sections if s.heading))
+    return doc, md.make_deck(path, entries), parsed
+
+
+def _texts(block):
+    if block.kind == "table":
+        return [c for row in (block.data[0],) + block.data[1] for c in row]
+    if block.kind == "break":
+        return []
+    return [block.data] if isinstance(block.data, str) else list(block.data)
+
+
+def section_length(section):
+    return sum(len(dk.plain(t)) for b in section.blocks for t in _texts(b))
+
+
+def page_breaks(doc, compact):
+    """For each section, whether it starts on a new page."""
+    return tuple(i > 0 and not (compact and section_length(s) < COMPACT_MAX_CHARS)
+                 for i, s in enumerate(doc.sections))
+
+
+def _write(path, data):
+    tmp = "%s.%d.tmp" % (path, os.getpid())
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+# === HTML ===
+
+def _html(text):
+    """Deck markup -> HTML: text escaped, <b> as <strong>, [ ] as a checkbox."""
+    text = html.escape(text, quote=False).replace("[ ]", "☐")
+    return text.replace("&lt;b&gt;", "<strong>").replace("&lt;/b&gt;", "</strong>")
+
+
+def html_block(block):
+    kind, data, hint = block
+    if kind == "para":
+        return "<p>%s</p>" % _html(data)
+    if kind == "heading":
+        return "<h3>%s</h3>" % _html(data)
+    if kind == "quote":
+        return "<blockquote>\n%s\n</blockquote>" % _html(data)
+    if kind in ("bullets", "steps", "checklist"):
+        tag = "ol" if kind == "steps" else "ul"
+        box = "☐ " if kind == "checklist" else ""
+        items = "".join("  <li>%s%s</li>\n" % (box, _html(i)) for i in data)
+        return "<%s>\n%s</%s>" % (tag, items, tag)
+    if kind == "table":
+        headers, rows = data
+        cls = ' class="diary"' if hint == "dzienniczek" else ""
+        out = ["<table%s>" % cls, "  <thead>", "    <tr>"]
+        out += ["      <th>%s</th>" % _html(h) for h in headers]
+        out += ["    </tr>", "  </thead>", "  <tbody>"]
+        for row in rows:
+            out.append("    <tr>")
+            out += ["      <td>%s</td>" % _html(c) for c in row]
+            out.append("    </tr>")
+        out += ["  </tbody>", "</table>"]
+        return "\n".join(out)
+    return ""
+
+
+def render_html(doc, breaks, out_path):
+    """Worker: write the HTML document; returns (path, sections)."""
+    with open(CSS_PATH, encoding="utf-8") as f:
+        css = "".join("    " + line if line.strip() else line for line in f)
+    title = _html(doc.title)
+    out = ['<!DOCTYPE html>\n<html lang="pl">\n<head>\n  <meta charset="utf-8" />\n'
+           '  <title>%s</title>\n  <style>\n%s  </style>\n</head>\n<body>' % (title, css)]
+    if doc.byline:
+        out.append('<h1>%s</h1>\n<p class="byline">%s</p>' % (title, _html(doc.byline)))
+    else:
+        out.append("<h1>%s</h1>" % title)
+    for section, page_break in zip(doc.sections, breaks):
+        if page_break:
+            out += ['<hr class="pb-hr">', '<h2 class="pb">%s</h2>' % _html(md.inline(section.heading))]
+        else:
+            out += ["<hr>", "<h2>%s</h2>" % _html(md.inline(section.heading))]
+        out += [html_block(b) for b in section.blocks if b.kind != "break"]
+    _write(out_path, "\n\n".join(out) + "\n\n</body>\n</html>\n")
+    return out_path, len(doc.sections)
+
+
+# === PDF ===
+# Measurements follow dokument.css (pt; the body is 10.5pt with 1.7 leading).
+
+PAGE_W, PAGE_H = A4
+MARGIN = 2.2 * cm
+CONTENT_W = PAGE_W - 2 * MARGIN
+BODY = 10.5
+DIARY_W = 285  # table.diary max-width
+
+
+@functools.lru_cache(maxsize=None)
+def table_style(pad):
+    """TableStyle shared by every table with cell padding pad."""
+    return TableStyle([
+        ("BACKGROUND", (0, 0), (-1, 0), aromagic.BG_SOFT),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ("TOPPADDING", (0, 0), (-1, -1), pad),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), pad),
+        ("LEFTPADDING", (0, 0), (-1, -1), pad + 4),
+        ("RIGHTPADDING", (0, 0), (-1, -1), pad + 4),
+        ("LINEBELOW", (0, 0), (-1, -2), 0.75, aromagic.BORDER),
+        ("ROUNDEDCORNERS", [6, 6, 6, 6]),
+        ("BOX", (0, 0), (-1, -1), 0.75, aromagic.BORDER),
+    ])
+
+
+class DocumentBuilder:
+    """Portrait A4 counterpart of SlideBuilder: primitives draw downwards
+    from self.y and start a new page when a block does not fit.
+
+    Vertical space is collapsed like CSS margins: space() only raises the
+    gap before the next block, and there is none at the top of a page.
+    """
+
+    def __init__(self, outfile, title):
+        aromagic.register_fonts()
+        self.c = canvas.Canvas(outfile, pagesize=A4)
+        self.c.setTitle(title)
+        self.page_num = 0
+        face = getattr(pdfmetrics.getFont(aromagic.FONT), "face", None)
+        self.checkbox = "☐" if face and ord("☐") in face.charToGlyph else "[ ]"
+        self.new_page()
+
+    def new_page(self):
+        if self.page_num > 0:
+            self.c.showPage()
+        self.page_num += 1
+        self.y = PAGE_H - MARGIN
+        self.gap = 0
+
+    @property
+    def at_top(self):
+        return self.y == PAGE_H - MARGIN
+
+    def space(self, h):
+        self.gap = max(self.gap, h)
+
+    def _advance(self):
+        if not self.at_top:
+            self.y -= self.gap
+        self.gap = 0
+
+    def keep(self, h):
+        """Start a new page unless h more points (after the gap) fit on this one."""
+        if self.y - self.gap - h < MARGIN and not self.at_top:
+            self.new_page()
+
+    def markup(self, text):
+        """Deck markup for a ReportLab Paragraph, bold as the semibold face."""
+        bold = '<font name="%s" color="%s">' % (aromagic.FONT_SEMI, aromagic.TEXT.hexval())
+        return text.replace("<b>", bold).replace("</b>", "</font>").replace("[ ]", self.checkbox)
+
+    def draw_flowable(self, f, x=MARGIN, width=CONTENT_W, gap=0):
+        """Draw a Paragraph or Table, split across pages when needed.
+
+        Returns the y of the top of the first part drawn.
+        """
+        self._advance()
+        top = None
+        while f is not None:
+            _, h = f.wrap(width, PAGE_H)
+            if self.y - h >= MARGIN or self.at_top and not f.split(width, self.y - MARGIN):
+                f.drawOn(self.c, x, self.y - h)
+                top = self.y if top is None else top
+                self.y -= h
+                break
+            parts = f.split(width, self.y - MARGIN)
+            if len(parts) < 2:
+                self.new_page()
+                continue
+            head, f = parts[0], parts[1]
+            _, hh = head.wrap(width, PAGE_H)
+            head.drawOn(self.c, x, self.y - hh)
+            top = self.y if top is None else top
+            self.new_page()
+        self.space(gap)
+        return top
+
+    def draw_title(self, text, byline):
+        style = aromagic.paragraph_style(aromagic.FONT_BOLD, 22, aromagic.TEXT, 1.15)
+        self.draw_flowable(Paragraph(self.markup(text), style), gap=4)
+        if byline:
+            style = aromagic.paragraph_style(aromagic.FONT, 9, aromagic.TEXT_MUTED)
+            self.draw_flowable(Paragraph(self.markup(byline), style))
+
+    def draw_rule(self):
+        self.space(21)
+        self._advance()
+        self.c.setStrokeColor(aromagic.BORDER)
+        self.c.setLineWidth(0.75)
+        self.c.line(MARGIN, self.y, MARGIN + CONTENT_W, self.y)
+        self.space(21)
+
+    def draw_heading(self, text, size=13, before=36, after=10):
+        self.space(before)
+        self.keep(size * 1.4 + 3 * BODY * 1.7)  # keep with the next lines
+        style = aromagic.paragraph_style(aromagic.FONT_SEMI, size, aromagic.TEXT, 1.3)
+        self.draw_flowable(Paragraph(self.markup(text), style), gap=after)
+
+    def draw_paragraph(self, text):
+        style = aromagic.paragraph_style(aromagic.FONT, BODY, aromagic.TEXT_SEC, 1.7)
+        self.draw_flowable(Paragraph(self.markup(text), style), gap=7)
+
+    def draw_list(self, items, kind):
+        style = aromagic.paragraph_style(aromagic.FONT, BODY, aromagic.TEXT_SEC, 1.7)
+        self.space(4)
+        for n, item in enumerate(items, 1):
+            top = self.draw_flowable(Paragraph(self.markup(item), style), MARGIN + 18, CONTENT_W - 18, 4.7)
+            base = top - BODY  # first baseline
+            if kind == "steps":
+                self.c.setFont(aromagic.FONT_SEMI, BODY)
+                self.c.setFillColor(aromagic.TEXT)
+                self.c.drawRightString(MARGIN + 12, base, "%d." % n)
+            elif kind == "checklist":
+                self.c.setStrokeColor(aromagic.TEXT_MUTED)
+                self.c.setLineWidth(0.75)
+                self.c.roundRect(MARGIN + 3, base - 0.5, 7.5, 7.5, 1.2, fill=0, stroke=1)
+            else:
+                self.c.setFillColor(aromagic.TEXT_MUTED)
+                self.c.circle(MARGIN + 8, base + 3, 1.8, fill=1, stroke=0)
+        self.space(4)
+
+    def draw_quote(self, text):
+        style = aromagic.paragraph_style(aromagic.FONT, 10, aromagic.TEXT_SEC, 1.75)
+        p = Paragraph(self.markup(text), style)
+        _, h = p.wrap(CONTENT_W - 40, PAGE_H)
+        box_h = h + 24
+        self.space(14)
+        self.keep(box_h)
+        self._advance()
+        self.c.setFillColor(aromagic.BG_SOFT)
+        self.c.roundRect(MARGIN, self.y - box_h, CONTENT_W, box_h, 6, fill=1, stroke=0)
+        self.c.setFillColor(aromagic.TEXT)
+        self.c.rect(MARGIN, self.y - box_h, 2, box_h, fill=1, stroke=0)
+        p.drawOn(self.c, MARGIN + 20, self.y - box_h + 12)
+        self.y -= box_h
+        self.space(14)
+
+    def draw_table(self, headers, rows, diary=False):
+        size, pad = (8.5, 6) if diary else (9.5, 9)
+        width = DIARY_W if diary else CONTENT_W
+        head = aromagic.paragraph_style(aromagic.FONT_MED, size - (0 if diary else 1), aromagic.TEXT_SEC, 1.4)
+        body = aromagic.paragraph_style(aromagic.FONT, size, aromagic.TEXT_SEC, 1.4)
+        data = [[Paragraph(self.markup(h.upper()), head) for h in headers]]
+        data += [[Paragraph(self.markup(c), body) for c in row] for row in rows]
+        fractions = md.column_widths([tuple(map(dk.plain, r)) for r in (headers,) + rows],
+                                     0.35 if diary else 0.15)
+        t = Table(data, colWidths=[width * f for f in fractions], repeatRows=1,
+                  style=table_style(pad))
+        self.space(12)
+        self.draw_flowable(t, gap=12)
+
+    def save(self):
+        self.c.save()
+
+
+def render_pdf(doc, breaks, out_path):
+    """Worker: write the PDF document; returns (path, pages)."""
+    s = DocumentBuilder(out_path, doc.title)
+    s.draw_title(doc.title, doc.byline)
+    for section, page_break in zip(doc.sections, breaks):
+        if page_break:
+            s.new_page()
+        else:
+            s.draw_rule()
+        s.draw_heading(md.inline(section.heading))
+        for block in section.blocks:
+            kind, data, hint = block
+            if kind == "para":
+                s.draw_paragraph(data)
+            elif kind == "heading":
+                s.draw_heading(data, BODY, 19, 5)
+            elif kind == "quote":
+                s.draw_quote(data)
+            elif kind in ("bullets", "steps", "checklist"):
+                s.draw_list(data, kind)
+            elif kind == "table":
+                s.draw_table(*data, diary=hint == "dzienniczek")
+    s.save()
+    return out_path, s.page_num
+
+
+# === PPTX ===
+
+def render_pptx(deck, out_path):
+    """Worker: write the deck; returns (path, slides)."""
+    return build_all.load_backend(DECK_THEME).render(deck, out_path)
+
+
+# === DRIVER ===
+
+def tasks(path):
+    """[(writer, args, out_path, key)] for one Markdown file, parsed once."""
+    doc, deck, _ = load(path)
+    stem = os.path.splitext(path)[0]
+    source_key = cache.digest(cache.file_digest(path), cache.file_digest(os.path.abspath(__file__)),
+                              cache.file_digest(os.path.abspath(md.__file__)))
+    out = []
+    for suffix, compact in VARIANTS.items():
+        breaks = page_breaks(doc, compact)
+        out.append((render_html, (doc, breaks), stem + suffix + ".html",
+                    cache.digest(source_key, breaks, cache.file_digest(CSS_PATH))))
+        out.append((render_pdf, (doc, breaks), stem + suffix + ".pdf",
+                    cache.digest(source_key, breaks, cache.theme_digest(aromagic),
+                                 [cache.file_digest(p) for p in aromagic.ASSETS])))
+    backend = build_all.load_backend(DECK_THEME)
+    out.append((render_pptx, (deck,), backend.output_path(deck, os.path.dirname(path)),
+                cache.artifact_key(deck, backend)))
+    return out
+
+
+def export(paths, jobs=None, force=False, build_cache=None):
+    """Export every path; returns [(out_path, count or None if fresh)]."""
+    if build_cache is None:
+        build_cache = cache.BuildCache()
+    todo, results = [], []
+    for path in paths:
+        for writer, args, out_path, key in tasks(path):
+            if force or not build_cache.is_fresh(out_path, key):
+                todo.append((writer, args, out_path, key))
+            else:
+                results.append((out_path, None))
+    if todo:
+        with ProcessPoolExecutor(max_workers=min(jobs or os.cpu_count() or 1, len(todo))) as pool:
+            futures = [(pool.submit(writer, *args, out_path), key)
+                       for writer, args, out_path, key in todo]
+            for future, key in futures:
+                out_path, count = future.result()
+                build_cache.record_file(out_path, key)
+                results.append((out_path, count))
+    build_cache.save()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Eksport dokumentu Markdown do HTML, PDF i PPTX.")
+    parser.add_argument("sources", nargs="*", default=DEFAULT_SOURCES, help="pliki .md")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="liczba procesów (domyślnie: liczba rdzeni)")
+    parser.add_argument("--force", action="store_true", help="zapisz wszystkie pliki")
+    args = parser.parse_args(argv)
+    t0 = time.perf_counter()
+    results = export([os.path.abspath(p) for p in args.sources], max(1, args.jobs), args.force)
+    for out_path, count in results:
+        state = "aktualny" if count is None else "zapisano (%d)" % count
+        print(f"{os.path.relpath(out_path, ROOT)}: {state}")
+    written = sum(1 for _, count in results if count is not None)
+    print(f"{written}/{len(results)} plików w {time.perf_counter() - t0:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""Text measurement, slide pagination and overflow diagnostics.
+
+Backends that cannot measure text themselves (python-pptx) wrap it here
+with real font metrics instead of an average glyph width. Advance widths
+come from ReportLab, from the theme's TTF when fonts.py finds it and from
+the standard Helvetica metrics otherwise, and are cached per word; line
+counts are cached per (text, size, width). Measuring every block of
+every slide in every theme therefore costs a few dictionary lookups once
+the first deck has been laid out.
+
+paginate() decides which blocks of a slide fit and cuts a list or table
+at the boundary; fit_size() picks the largest font size at which a slide
+title fits its box. What a backend had to split or shrink, and what still
+does not fit, is reported as Overflow records, collected per process:
+build_all.py and build.py drain and print them after a render.
+"""
+
+import contextlib
+import functools
+from dataclasses import replace
+from typing import NamedTuple
+
+from reportlab.pdfbase import pdfmetrics
+
+import deck as dk
+import fonts
+
+LINE_CACHE_SIZE = 16384
+STANDARD = ("Helvetica", "Helvetica-Bold")
+
+
+# === METRICS ===
+
+class Metrics:
+    """Advance widths of one regular/bold font pair, cached per word."""
+
+    def __init__(self, regular, bold, paths=()):
+        self.fonts = (regular, bold)
+        self.paths = tuple(paths)  # the TTFs, for cache keys
+        self._widths = {}
+
+    def __repr__(self):
+        return "Metrics(%r, %r)" % self.fonts
+
+    def width(self, text, size, bold=False):
+        key = (text, bold)
+        w = self._widths.get(key)
+        if w is None:
+            w = self._widths[key] = pdfmetrics.stringWidth(text, self.fonts[bold], 1)
+        return w * size
+
+    def lines(self, text, size, width):
+        """Line count of text with <b> markup wrapped to width (points)."""
+        return _lines(self, text, size, width)
+
+    def height(self, text, size, width, leading=1.2):
+        return self.lines(text, size, width) * size * leading
+
+
+@functools.lru_cache(maxsize=LINE_CACHE_SIZE)
+def _lines(metrics, text, size, width):
+    space = metrics.width(" ", size)
+    lines, x = 1, 0.0
+    for chunk, bold in dk.spans(text):
+        for i, part in enumerate(chunk.split("\n")):
+            if i:
+                lines, x = lines + 1, 0.0
+            for word in part.split():
+                w = metrics.width(word, size, bold)
+                if x and x + space + w > width:
+                    lines, x = lines + 1, 0.0
+                x += (space if x else 0.0) + w
+                if x > width:  # a word longer than the line breaks inside
+                    extra = int(x // width)
+                    lines, x = lines + extra, x - extra * width
+    return lines
+
+
+@functools.lru_cache(maxsize=None)
+def metrics(family=None):
+    """Metrics for a font family by file name (e.g. "Inter"), or Helvetica.
+
+    The TTFs are registered under their own names so that measuring never
+    replaces a font a PDF backend registered for drawing.
+    """
+    if family:
+        paths = fonts.resolve({
+            "Measure-" + family: (family + "-Regular.ttf", family + "_24pt-Regular.ttf", family + ".ttf"),
+            "Measure-" + family + "-Bold": (family + "-Bold.ttf", family + "_28pt-Bold.ttf"),
+        })
+        if paths:
+            fonts.register(paths)
+            return Metrics("Measure-" + family, "Measure-" + family + "-Bold", sorted(paths.values()))
+    return Metrics(*STANDARD)
+
+
+def fit_size(metrics, text, size, width, height, min_size, leading=1.2):
+    """(font size, fits): the largest whole size from size down to min_size
+    at which text wrapped to width is at most height tall; (min_size, False)
+    when even that does not fit."""
+    s = size
+    while s >= min_size:
+        if metrics.height(text, s, width, leading) <= height:
+            return s, True
+        s -= 1
+    return min_size, False
+
+
+# === PAGINATION ===
+
+def paginate(blocks, room, height, split=None):
+    """(page, rest): the leading blocks that fit in room and the others.
+
+    height(block) is the space a block takes including the gap after it.
+    split(block, room, at_top) may cut the block that crosses the bottom
+    into (head, tail), or return None to move it whole. A slide always
+    keeps its first block, even one taller than the slide, so paginating
+    always makes progress; a heading is never left last on a page.
+    """
+    page, used = [], 0
+    for i, block in enumerate(blocks):
+        h = height(block)
+        if used + h <= room:
+            page.append(block)
+            used += h
+            continue
+        parts = split(block, room - used, not page) if split else None
+        if parts:
+            page.append(parts[0])
+            rest = [parts[1]] + list(blocks[i + 1:])
+        elif not page:
+            page.append(block)
+            rest = list(blocks[i + 1:])
+        else:
+            rest = list(blocks[i:])
+        if len(page) > 1 and isinstance(page[-1], dk.Heading):
+            rest.insert(0, page.pop())
+        return page, rest
+    return page, []
+
+
+def split_items(block, room, height, at_top=False):
+    """(head, tail) of a Bullets, Steps or Checklist block cut to room, or None.
+
+    Continued steps keep their numbering.
+    """
+    if not isinstance(block, (dk.Bullets, dk.Steps, dk.Checklist)):
+        return None
+    items = block.items
+    n = len(items) - 1
+    while n > 0 and height(replace(block, items=items[:n])) > room:
+        n -= 1
+    if n == 0 and at_top and len(items) > 1:
+        n = 1
+    if n == 0:
+        return None
+    tail = replace(block, items=items[n:])
+    if isinstance(block, dk.Steps):
+        tail = replace(tail, start=block.start + n)
+    return replace(block, items=items[:n]), tail
+
+
+# === DIAGNOSTICS ===
+
+SPLIT, SHRINK, OVERFLOW = "split", "shrink", "overflow"
+_ACTIONS = {SPLIT: "podzielono", SHRINK: "zmniejszono", OVERFLOW: "NIE MIEŚCI SIĘ"}
+
+
+class Overflow(NamedTuple):
+    deck: str
+    theme: str
+    slide: int       # page number in the output; the cover is 1
+    title: str
+    action: str      # SPLIT, SHRINK or OVERFLOW
+    detail: str = ""
+    excess: float = 0.0  # points that did not fit, for OVERFLOW
+
+    def describe(self):
+        text = "%s / %s, slajd %d „%s”: %s" % (self.deck, self.theme, self.slide, self.title,
+                                               _ACTIONS[self.action])
+        if self.detail:
+            text += " (%s)" % self.detail
+        if self.excess:
+            text += ", brakuje %.0f pt" % self.excess
+        return text
+
+
+_reports = []
+
+
+def report(*args, **kwargs):
+    _reports.append(Overflow(*args, **kwargs))
+
+
+def drain():
+    """Overflow records reported since the last drain()."""
+    out = list(_reports)
+    del _reports[:]
+    return out
+
+
+@contextlib.contextmanager
+def captured():
+    """Collect the records reported inside the block in the yielded list
+    instead, e.g. to cache them with a rendered page and replay them."""
+    global _reports
+    outer, _reports = _reports, []
+    try:
+        yield _reports
+    finally:
+        _reports = outer
@@ -0,0 +1,145 @@
+"""TrueType font resolution for the ReportLab backend.
+
+Font files are looked up by file name in FONT_DIRS, which cover the
+repository's own ``fonts/`` directory, the usual Linux locations (searched
+recursively, e.g. ``/usr/share/fonts/truetype/inter``) and the macOS ones.
+Extra directories can be put in front with ``BUILD_FONT_PATH`` (separated
+like PATH).
+
+Finding a font only stats files; parsing happens in register(), on first
+use. Parsed fonts are kept in a pickle in the build cache keyed on each
+file's mtime and size, so rendering dozens of decks does not re-parse the
+same TTFs; it holds ReportLab objects, so only the ReportLab version that
+wrote it reads it back. ReportLab already embeds only the glyphs a document
+uses (as subsets), so a cached font costs nothing extra in the output.
+"""
+
+import copy
+import os
+import pickle
+from weakref import WeakKeyDictionary
+
+import reportlab
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+
+import cache
+
+FONT_DIRS = [d for d in os.environ.get("BUILD_FONT_PATH", "").split(os.pathsep) if d] + [
+    os.path.join(cache.ROOT, "fonts"),
+    os.path.expanduser("~/.local/share/fonts"),
+    os.path.expanduser("~/.fonts"),
+    "/usr/local/share/fonts",
+    "/usr/share/fonts",
+    os.path.expanduser("~/Library/Fonts"),
+    "/Library/Fonts",
+    "/System/Library/Fonts",
+]
+CACHE_PATH = os.path.join(cache.CACHE_DIR, "fonts.pickle")
+CACHE_VERSION = (1, reportlab.Version)
+
+_dir_index = {}
+_registered = {}
+
+
+def _index(directory):
+    """{file name: path} of every font file under directory (first one wins)."""
+    if directory not in _dir_index:
+        found = {}
+        for dirpath, dirnames, filenames in os.walk(directory):
+            dirnames.sort()
+            for f in sorted(filenames):
+                if f.lower().endswith(".ttf"):
+                    found.setdefault(f, os.path.join(dirpath, f))
+        _dir_index[directory] = found
+    return _dir_index[directory]
+
+
+def find(filenames, dirs=None):
+    """Path of the first of filenames found in dirs (default FONT_DIRS), or None."""
+    for directory in FONT_DIRS if dirs is None else dirs:
+        index = _index(directory)
+        for filename in filenames:
+            if filename in index:
+                return index[filename]
+    return None
+
+
+def resolve(faces, dirs=None):
+    """{font name: path} for faces {font name: (file name, ...)}.
+
+    All or nothing: a family with a missing weight would mix fonts, so None
+    is returned unless every face is found.
+    """
+    paths = {name: find(filenames, dirs) for name, filenames in faces.items()}
+    return paths if all(paths.values()) else None
+
+
+class _Scale:
+    """Picklable stand-in for the per-font lambda TTFontFile keeps in _pdfScale."""
+
+    def __init__(self, units_per_em):
+        self.factor = 1000 / units_per_em
+
+    def __call__(self, x):
+        return x if self.factor == 1 else x * self.factor
+
+
+def _parse(name, path):
+    font = TTFont(name, path)
+    # TTFontFile keeps a lambda in _pdfScale, which pickle cannot store.
+    # Replacing it is safe: ReportLab reads it only through TTFont.pdfScale()
+    # (to scale HarfBuzz advances); the advance widths in face.charWidths
+    # are already scaled when the file is parsed, and _Scale computes the
+    # same x * (1000 / unitsPerEm). CACHE_VERSION includes the ReportLab
+    # version, so a release that changes this gets a fresh cache;
+    # test_fonts.py checks that a cached font measures and draws the same.
+    font.face._pdfScale = _Scale(font.face.unitsPerEm)
+    return font
+
+
+def _load_cache():
+    try:
+        with open(CACHE_PATH, "rb") as f:
+            version, fonts = pickle.load(f)
+        return fonts if version == CACHE_VERSION else {}
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError, TypeError):
+        return {}
+
+
+def _save_cache(fonts):
+    # Per-document subset state (a WeakKeyDictionary) is never cached.
+    stored = {}
+    for key, (stamp, font) in fonts.items():
+        font = copy.copy(font)
+        font.state = {}
+        stored[key] = (stamp, font)
+    os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+    tmp = "%s.%d.tmp" % (CACHE_PATH, os.getpid())  # workers may save concurrently
+    with open(tmp, "wb") as f:
+        pickle.dump((CACHE_VERSION, stored), f, pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, CACHE_PATH)
+
+
+def register(paths):
+    """Register {font name: path} with ReportLab once per process."""
+    todo = {n: p for n, p in paths.items() if _registered.get(n) != p}
+    if not todo:
+        return
+    fonts = _load_cache()
+    dirty = False
+    for name, path in todo.items():
+        st = os.stat(path)
+        key = (name, path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        if key in fonts and fonts[key][0] == stamp:
+            font = fonts[key][1]
+        else:
+            font = _parse(name, path)
+            fonts[key] = (stamp, font)
+            dirty = True
+        font.state = WeakKeyDictionary()
+        pdfmetrics.registerFont(font)
+        _registered[name] = path
+    if dirty:
+        _save_cache(fonts)
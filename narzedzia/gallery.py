@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Slide gallery for the mobile landing of docs/trening-wechowy/.
+
+The Aromagic PDF is rasterized page by page with PyMuPDF into
+``slides/slide-NN.jpg`` and ``.webp``. Each page is keyed on the digest of
+the slide it belongs to (cover = page 1; a slide continued on "(cd.)" pages
+has several), its page number, the backend's theme digest and the raster
+settings, so only pages whose content changed are re-rendered; those are
+spread over worker processes. The PDF itself goes through the usual build cache first.
+The page source in strona/ is updated; sitebuild.py publishes it.
+
+    python3 narzedzia/gallery.py            # refresh changed pages
+    python3 narzedzia/gallery.py --force    # re-render every page
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pymupdf
+from PIL import Image
+
+import build_all
+import cache
+import sitebuild
+
+ROOT = cache.ROOT
+PROJECT = "trening-wechowy"
+THEME = "Aromagic"
+PAGE = os.path.join(sitebuild.SOURCE_DIR, PROJECT, "index.html")
+SLIDES_DIR = os.path.join(ROOT, "docs", PROJECT, "slides")
+
+WIDTH = 1280  # px; the gallery is shown at phone width, 2× for retina
+QUALITY = {"jpg": 82, "webp": 78}
+
+_SLIDE_RE = re.compile(r"slide-(\d+)\.(?:jpg|webp)$")
+_SCROLL_RE = re.compile(r'(<div class="slide-scroll">\n)(.*?)(\n\s*</div>)', re.S)
+
+
+def slide_name(page, ext):
+    return f"slide-{page + 1:02d}.{ext}"
+
+
+def page_key(slide_digest, theme_key, page):
+    return cache.digest(slide_digest, theme_key, page, WIDTH, sorted(QUALITY.items()))
+
+
+def rasterize(pdf_path, page, out_dir):
+    """Worker: render one PDF page to JPEG and WebP; returns written paths."""
+    with pymupdf.open(pdf_path) as doc:
+        p = doc[page]
+        pix = p.get_pixmap(matrix=pymupdf.Matrix(WIDTH / p.rect.width, WIDTH / p.rect.width),
+                           alpha=False)
+    im = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+    paths = []
+    for ext, quality in QUALITY.items():
+        path = os.path.join(out_dir, slide_name(page, ext))
+        tmp = path + ".tmp"
+        if ext == "jpg":
+            im.save(tmp, "JPEG", quality=quality, optimize=True, progressive=True)
+        else:
+            im.save(tmp, "WEBP", quality=quality)
+        os.replace(tmp, path)
+        paths.append(path)
+    return paths
+
+
+def gallery_html(count, indent="      "):
+    """Markup of the .slide-scroll list for count pages."""
+    return "\n".join(
+        f'{indent}<picture class="asset"><source type="image/webp" '
+        f'srcset="slides/{slide_name(i, "webp")}" />'
+        f'<img src="slides/{slide_name(i, "jpg")}" alt="Slajd {i + 1}" loading="lazy" /></picture>'
+        for i in range(count))
+
+
+def update_page(count, page=PAGE):
+    """Point the mobile gallery at exactly count slides; True if the page changed."""
+    with open(page, encoding="utf-8") as f:
+        text = f.read()
+    new = _SCROLL_RE.sub(lambda m: m.group(1) + gallery_html(count) + m.group(3), text, count=1)
+    if new == text:
+        return False
+    tmp = page + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(new)
+    os.replace(tmp, page)
+    return True
+
+
+def build(jobs=None, force=False, build_cache=None):
+    """Refresh the gallery; returns (pages, rendered page indices)."""
+    if build_cache is None:
+        build_cache = cache.BuildCache()
+    source = os.path.join(build_all.PROJECTS_DIR, PROJECT, build_all.DECK_SOURCE)
+    deck = build_all.load_deck(PROJECT, source)
+    backend = build_all.load_backend(THEME)
+
+    pdf_path = backend.output_path(deck)
+    key = cache.artifact_key(deck, backend)
+    if force or not build_cache.is_fresh(pdf_path, key):
+        pdf_path, _ = backend.render(deck, pdf_path)
+        build_cache.record(pdf_path, key, deck)
+
+    theme_key = cache.digest(cache.theme_digest(backend),
+                             [cache.file_digest(p) for p in getattr(backend, "ASSETS", ())])
+    # A slide that overflows continues on "(cd.)" pages: one digest per page.
+    counts = [part.count for part in backend.deck_pages(deck)]
+    digests = [d for d, n in zip(cache.slide_digests(deck), counts) for _ in range(n)]
+    keys = [page_key(d, theme_key, i) for i, d in enumerate(digests)]
+    os.makedirs(SLIDES_DIR, exist_ok=True)
+    stale = [i for i, k in enumerate(keys)
+             if force or not all(build_cache.is_fresh(os.path.join(SLIDES_DIR, slide_name(i, ext)), k)
+                                 for ext in QUALITY)]
+
+    if stale:
+        with ProcessPoolExecutor(max_workers=min(jobs or os.cpu_count() or 1, len(stale))) as pool:
+            for i, paths in zip(stale, pool.map(rasterize, [pdf_path] * len(stale), stale,
+                                                [SLIDES_DIR] * len(stale))):
+                for path in paths:
+                    build_cache.record_file(path, keys[i])
+
+    # Pages dropped from the deck.
+    for f in os.listdir(SLIDES_DIR):
+        m = _SLIDE_RE.match(f)
+        if m and int(m.group(1)) > len(keys):
+            os.remove(os.path.join(SLIDES_DIR, f))
+            build_cache.forget(os.path.join(SLIDES_DIR, f))
+    build_cache.save()
+    update_page(len(keys))
+    return len(keys), stale
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Galeria slajdów (JPEG/WebP) z PDF Aromagic.")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="liczba procesów (domyślnie: liczba rdzeni)")
+    parser.add_argument("--force", action="store_true", help="renderuj wszystkie strony")
+    args = parser.parse_args(argv)
+    t0 = time.perf_counter()
+    pages, rendered = build(max(1, args.jobs), args.force)
+    print(f"{os.path.relpath(SLIDES_DIR, ROOT)}: {pages} stron, "
+          f"wyrenderowano {len(rendered)} ({time.perf_counter() - t0:.2f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
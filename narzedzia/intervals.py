@@ -0,0 +1,45 @@
+"""Static index of time intervals for overlap and point queries.
+
+Items are anything with ``start`` and ``end`` attributes in ms (srt.Cue,
+srt.Sentence, captions.Caption), taken as half-open ``[start, end)``. They
+are sorted by start once; alongside the starts the index keeps the running
+maximum of the ends, which never decreases, so both sides of a query are
+found by bisection. A query costs O(log n) plus the items returned, plus any
+item skipped because it ends early while an earlier one is still running;
+transcript timelines overlap at most a cue or two deep, so that is next to
+nothing.
+"""
+
+import bisect
+import itertools
+
+
+class IntervalIndex:
+    def __init__(self, items):
+        self.items = sorted(items, key=lambda it: (it.start, it.end))
+        self.starts = [it.start for it in self.items]
+        self.max_ends = list(itertools.accumulate((it.end for it in self.items), max))
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def overlapping(self, start, end):
+        """Items that share some time with [start, end), in order."""
+        if end <= start:
+            return self.at(start)
+        lo = bisect.bisect_right(self.max_ends, start)
+        hi = bisect.bisect_left(self.starts, end)
+        return [it for it in self.items[lo:hi] if it.end > start]
+
+    def at(self, t):
+        """Items running at time t, in order."""
+        lo = bisect.bisect_right(self.max_ends, t)
+        hi = bisect.bisect_right(self.starts, t)
+        return [it for it in self.items[lo:hi] if it.end > t]
+
+    def span(self):
+        """(first start, last end), or None when empty."""
+        return (self.starts[0], self.max_ends[-1]) if self.items else None
@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""Markdown -> deck.Deck compiler.
+
+The instruction and lecture notes in ``projekty/<projekt>/*.md`` already have
+the shape of a deck: ``# Title``, one ``## N. Section: title`` per topic,
+``###`` subheadings, lists, checklists (``- [ ]``), tables and blockquotes.
+This module turns them into the same ``Deck`` that slides.py builds by hand,
+so any backend can render them.
+
+The file is read line by line and split into ``##`` sections as it streams.
+Each section is parsed into a small AST and compiled into slides on its
+own; both are cached by the section's content hash in
+``.build-cache/markdown/``, so after an edit only the sections that
+changed are parsed and paginated again.
+
+A section becomes one slide, or several when its blocks would not fit
+(estimated with deck.estimate_lines). Hints in HTML comments, invisible in
+rendered Markdown, override the defaults:
+
+    <!-- slajd -->               start a new slide here
+    <!-- układ: karty -->        next list as cards ("**Tytuł:** treść"),
+    <!-- układ: karty 3 -->      optionally with a column count (> 0)
+    <!-- układ: wyróżnienie -->  next paragraph as a callout
+    <!-- układ: dzienniczek -->  next table as a fill-in form (export.py)
+    <!-- pomiń -->               leave the next block out of the deck
+
+Before the first section, ``<!-- podtytuł: ... -->`` and likewise
+``etykieta``, ``autor``, ``źródło`` and ``nazwa`` fill the cover fields.
+
+    python3 narzedzia/md.py "projekty/trening-wechowy/Domowa Instrukcja Treningu Węchowego.md"
+"""
+
+import os
+import pickle
+import re
+import sys
+from typing import NamedTuple
+
+import cache
+import deck as dk
+
+CACHE_DIR = os.path.join(cache.CACHE_DIR, "markdown")  # one pickle per source file
+
+# Rough content budget of one slide in points, and the text geometry used to
+# estimate block heights; both follow the Aromagic PDF (A4 landscape).
+SLIDE_BUDGET = 380
+CONTENT_W = 760
+COVER_FIELDS = {"nazwa": "name", "podtytuł": "subtitle", "etykieta": "label",
+                "autor": "author", "źródło": "credit"}
+
+_HINT_RE = re.compile(r"^<!--\s*([^:]+?)\s*(?::\s*(.*?))?\s*-->$")
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*$")
+_NUMBER_RE = re.compile(r"^(\d+|[A-Z])[.)]\s+(.*)$")
+_BULLET_RE = re.compile(r"^\s*[-*+]\s+(.*)$")
+_ORDERED_RE = re.compile(r"^\s*\d+[.)]\s+(.*)$")
+_CHECK_RE = re.compile(r"^\[[ xX]\]\s+(.*)$")
+_RULE_RE = re.compile(r"^(?:-{3,}|\*{3,}|_{3,})$")
+_TABLE_SEP_RE = re.compile(r"^\|?\s*:?-+:?\s*(?:\|\s*:?-+:?\s*)*\|?$")
+_CARD_RE = re.compile(r"^<b>(.+?):?</b>:?\s*(.*)$")
+_CARDS_HINT_RE = re.compile(r"^karty(?:\s+(\d+))?$")
+
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*|__(.+?)__")
+_ITALIC_RE = re.compile(r"(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*(?![\w*])|(?<!\w)_(?!\s)(.+?)(?<!\s)_(?!\w)")
+_CODE_RE = re.compile(r"`([^`]*)`")
+_LINK_RE = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+_QUOTES_RE = re.compile(r'"([^"\n]+)"')
+
+
+class ParseError(ValueError):
+    """A hint md cannot follow; the message starts with "file:line:"."""
+
+
+# === AST ===
+
+class Block(NamedTuple):
+    kind: str        # heading, para, bullets, steps, checklist, table, quote, break
+    data: object     # text, tuple of items, or (headers, rows)
+    hint: str = ""   # layout hint from the preceding <!-- układ: ... --> comment
+
+
+class Section(NamedTuple):
+    heading: str     # "## " text; "" for the part before the first section
+    blocks: tuple
+    meta: tuple = ()  # ((key, value), ...) from key: value hints
+
+
+def inline(text):
+    """Markdown inline markup -> deck markup (<b> only)."""
+    text = _LINK_RE.sub(r"\1", text)
+    text = _CODE_RE.sub(r"\1", text)
+    text = _BOLD_RE.sub(lambda m: "<b>" + (m.group(1) or m.group(2)) + "</b>", text)
+    text = _ITALIC_RE.sub(lambda m: m.group(1) or m.group(2), text)
+    return _QUOTES_RE.sub("„\\1”", text)
+
+
+def iter_sections(lines):
+    """Yield (heading, [lines]) per ``##`` section; heading "" for the preamble."""
+    heading, body = "", []
+    for line in lines:
+        line = line.rstrip("\r\n")
+        m = _HEADING_RE.match(line)
+        if m and len(m.group(1)) == 2:
+            yield heading, body
+            heading, body = m.group(2), []
+        else:
+            body.append(line)
+    yield heading, body
+
+
+def card_columns(hint):
+    """Column count of a "karty [N]" layout hint, or None unless N > 0."""
+    m = _CARDS_HINT_RE.match(hint)
+    columns = int(m.group(1) or 2) if m else 0
+    return columns or None
+
+
+def parse_section(heading, lines, path="", first_line=1):
+    """Section AST of one ``##`` section's body lines, which start at
+    first_line of path (for ParseError messages)."""
+    blocks, meta = [], []
+    hint = ""
+    para, items, kind, table, quote = [], [], None, [], []
+
+    def flush():
+        nonlocal para, items, kind, table, quote, hint
+        if para:
+            blocks.append(Block("para", inline(" ".join(para)), hint))
+        elif items:
+            blocks.append(Block(kind, tuple(inline(i) for i in items), hint))
+        elif table:
+            rows = [tuple(inline(c.strip()) for c in row.strip().strip("|").split("|"))
+                    for row in table if not _TABLE_SEP_RE.match(row.strip())]
+            blocks.append(Block("table", (rows[0], tuple(rows[1:])), hint))
+        elif quote:
+            text = inline(" ".join(quote)).strip()
+            blocks.append(Block("quote", text, hint))
+        else:
+            return
+        para, items, kind, table, quote, hint = [], [], None, [], [], ""
+
+    for no, line in enumerate(lines, first_line):
+        stripped = line.strip()
+        m = _HINT_RE.match(stripped)
+        if m:
+            flush()
+            key, value = m.group(1).lower(), m.group(2) or ""
+            if key == "slajd":
+                blocks.append(Block("break", None))
+            elif key in ("układ", "pomiń"):
+                hint = value.lower() if key == "układ" else "pomiń"
+                if hint.startswith("karty") and card_columns(hint) is None:
+                    raise ParseError("%s:%d: układ „%s”: liczba kolumn musi być dodatnią liczbą całkowitą"
+                                     % (path, no, value))
+            else:
+                meta.append((key, value))
+            continue
+        if not stripped or _RULE_RE.match(stripped):
+            flush()
+            continue
+        m = _HEADING_RE.match(stripped)
+        if m:
+            flush()
+            if len(m.group(1)) == 1:
+                meta.append(("tytuł", inline(m.group(2))))
+            else:
+                blocks.append(Block("heading", dk.plain(inline(m.group(2))), hint))
+                hint = ""
+            continue
+        if stripped.startswith("|"):
+            if not table:
+                flush()
+            table.append(stripped)
+            continue
+        if stripped.startswith(">"):
+            if not quote:
+                flush()
+            quote.append(stripped.lstrip(">").strip())
+            continue
+        m = _BULLET_RE.match(line) or _ORDERED_RE.match(line)
+        if m and not para:
+            item_kind = "steps" if _ORDERED_RE.match(line) else "bullets"
+            text = m.group(1)
+            c = _CHECK_RE.match(text)
+            if c:
+                item_kind, text = "checklist", c.group(1)
+            if items and item_kind != kind:
+                flush()
+            kind = item_kind
+            items.append(text)
+            continue
+        if items and line[:1].isspace():  # continuation of a list item
+            items[-1] += " " + stripped
+            continue
+        if items or table or quote:
+            flush()
+        para.append(stripped)
+    flush()
+    return Section(heading, tuple(blocks), tuple(meta))
+
+
+# === COMPILING ===
+
+def section_titles(heading):
+    """'1. Wstęp: Co się stało?' -> ('1 · Wstęp', 'Co się stało?')."""
+    m = _NUMBER_RE.match(heading)
+    number, text = m.groups() if m else ("", heading)
+    text = dk.plain(inline(text))
+    name, sep, title = text.partition(": ")
+    if not sep:
+        name = title = text
+    title = title[:1].upper() + title[1:]
+    return (number + " · " + name if number else name), title
+
+
+def _lines(text, size, width=CONTENT_W):
+    return dk.estimate_lines(text, size, width)
+
+
+def block_height(block):
+    """Estimated height in points, mirroring build_pdf_aromagic.block_height."""
+    if isinstance(block, dk.Lead):
+        return _lines(block.text, 14) * 21 + 12
+    if isinstance(block, dk.Paragraph):
+        return _lines(block.text, 13) * 19.5 + 4
+    if isinstance(block, dk.Heading):
+        return 28
+    if isinstance(block, dk.Callout):
+        return _lines(block.text, 12, CONTENT_W - 36) * 18 + 34
+    if isinstance(block, dk.Quote):
+        return _lines(block.text, 14, CONTENT_W - 50) * 22.4 + 52
+    if isinstance(block, (dk.Bullets, dk.Steps, dk.Checklist)):
+        return sum(max(_lines(i, 14, CONTENT_W - 34) * 21, 20) + 8 for i in block.items) + 6
+    if isinstance(block, dk.Table):
+        return sum(table_row_heights(block)) + 10
+    if isinstance(block, dk.Cards):
+        col_w = (CONTENT_W - 14 * (block.columns - 1)) / block.columns
+        per_row = [block.cards[i:i + block.columns]
+                   for i in range(0, len(block.cards), block.columns)]
+        return sum(max(_lines(c.body, 13, col_w - 32) * 19.5 + (24 if c.title else 0)
+                       for c in row) + 36 + 14 for row in per_row)
+    return 0
+
+
+def table_row_heights(block):
+    """Heights of the header row and each body row of a table block."""
+    widths = block.widths or [1 / len(block.headers)] * len(block.headers)
+    return [max(_lines(c, 12, CONTENT_W * w - 24) for c, w in zip(row, widths)) * 14.4 + 16
+            for row in (block.headers,) + block.rows]
+
+
+def column_widths(rows, minimum=0.15):
+    """Width fractions proportional to the longest cell of each column."""
+    longest = [max(len(row[i]) if i < len(row) else 0 for row in rows) for i in range(len(rows[0]))]
+    raw = [max(n / sum(longest), minimum) for n in longest]
+    return tuple(round(w / sum(raw), 3) for w in raw)
+
+
+def to_deck_block(block, first):
+    """Deck block for an AST block; first = first block of the section."""
+    kind, data, hint = block
+    if kind == "para":
+        if hint == "wyróżnienie":
+            return dk.Callout(data)
+        return dk.Lead(data) if first else dk.Paragraph(data)
+    if kind == "heading":
+        return dk.Heading(data)
+    if kind == "quote":
+        text = data.strip("*_ ")
+        return dk.Quote(text)
+    if kind == "table":
+        # Slide tables are plain text; the markup is kept for documents.
+        headers = tuple(map(dk.plain, data[0]))
+        rows = tuple(tuple(map(dk.plain, row)) for row in data[1])
+        return dk.Table(headers, rows, column_widths((headers,) + rows))
+    if kind in ("bullets", "steps") and hint.startswith("karty"):
+        columns = card_columns(hint)
+        cards = []
+        for item in data:
+            m = _CARD_RE.match(item)
+            cards.append(dk.Card(m.group(1), m.group(2)) if m else dk.Card(None, item))
+        return dk.Cards(tuple(cards), columns=columns)
+    return {"bullets": dk.Bullets, "steps": dk.Steps, "checklist": dk.Checklist}[kind](data)
+
+
+def _split(block, room):
+    """(head, tail) of a list or table that does not fit, or None."""
+    if isinstance(block, dk.Table):
+        head, tail = dk.split_table(block, table_row_heights(block), room - 10)
+        return (head, tail) if head and tail else None
+    if isinstance(block, (dk.Bullets, dk.Checklist)):
+        items = block.items
+        for n in range(len(items) - 1, 0, -1):
+            if block_height(type(block)(items[:n])) <= room:
+                return type(block)(items[:n]), type(block)(items[n:])
+    return None
+
+
+def compile_section(section, budget=SLIDE_BUDGET):
+    """Slides of one section, paginated to budget."""
+    if not section.heading:
+        return ()
+    label, title = section_titles(section.heading)
+    slides, blocks, used = [], [], 0
+    next_title = title
+
+    def emit():
+        nonlocal blocks, used, next_title
+        if blocks:
+            slides.append(dk.Slide(label, next_title, tuple(blocks)))
+            next_title = title + dk.CONTINUED
+        blocks, used = [], 0
+
+    first = True
+    for block in section.blocks:
+        if block.hint == "pomiń":
+            continue
+        if block.kind == "break":
+            emit()
+            continue
+        item = to_deck_block(block, first)
+        first = False
+        height = block_height(item)
+        while used + height > budget:
+            parts = _split(item, budget - used)
+            if parts:
+                blocks.append(parts[0])
+                item = parts[1]
+                height = block_height(item)
+            elif not blocks:
+                break  # a single block taller than a slide
+            carried = blocks.pop() if isinstance(blocks[-1], dk.Heading) else None
+            emit()
+            if carried:
+                next_title = carried.text
+        if not blocks and slides and isinstance(item, dk.Heading):
+            # A subheading that opens a continuation slide becomes its title.
+            next_title = item.text
+            continue
+        blocks.append(item)
+        used += height
+    emit()
+    return tuple(slides)
+
+
+# === LOADING ===
+
+def _store_path(path):
+    name = cache.digest(os.path.relpath(os.path.abspath(path), cache.ROOT))[:16]
+    return os.path.join(CACHE_DIR, name + ".pickle")
+
+
+def _load_store(path):
+    try:
+        with open(_store_path(path), "rb") as f:
+            version, store = pickle.load(f)
+        return store if version == _compiler_version() else {}
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError, TypeError):
+        return {}
+
+
+def _save_store(path, store):
+    target = _store_path(path)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp = "%s.%d.tmp" % (target, os.getpid())  # workers may save concurrently
+    with open(tmp, "wb") as f:
+        pickle.dump((_compiler_version(), store), f, pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, target)
+
+
+def _compiler_version():
+    # Cached ASTs and slides are only valid for this compiler and deck model.
+    return cache.digest(cache.file_digest(os.path.abspath(__file__)),
+                        cache.file_digest(os.path.abspath(dk.__file__)))
+
+
+def parse_file(path, store=None):
+    """([(Section, slides)] in file order, number of sections parsed).
+
+    store maps section digest -> (Section, slides) for this file and is
+    replaced in place; by default it is kept in CACHE_DIR. ParseError if a
+    hint cannot be followed.
+    """
+    own_store = store is None
+    old = _load_store(path) if own_store else dict(store)
+    new, parsed = {}, 0
+    sections = []
+    with open(path, encoding="utf-8-sig") as f:
+        first_line = 1
+        for heading, lines in iter_sections(f):
+            if heading:
+                first_line += 1  # the "## " line
+            digest = cache.digest(heading, lines)
+            if digest in old:
+                entry = old[digest]
+            else:
+                section = parse_section(heading, lines, path, first_line)
+                entry = (section, compile_section(section))
+                parsed += 1
+            new[digest] = entry
+            sections.append(entry)
+            first_line += len(lines)
+    if own_store:
+        if parsed or new.keys() != old.keys():
+            _save_store(path, new)
+    else:
+        store.clear()
+        store.update(new)
+    return sections, parsed
+
+
+def cover_fields(path, sections):
+    """Deck cover fields from the file name and the document-level hints."""
+    fields = {"name": os.path.splitext(os.path.basename(path))[0], "title": ""}
+    for section in sections:
+        for k, v in section.meta:
+            if k == "tytuł" and not fields["title"]:
+                fields["title"] = dk.plain(v)
+            elif k in COVER_FIELDS:
+                fields[COVER_FIELDS[k]] = v
+    return fields
+
+
+def make_deck(path, entries):
+    """Deck from parse_file() entries."""
+    slides = tuple(s for _, compiled in entries for s in compiled)
+    return dk.Deck(slides=slides, **cover_fields(path, [s for s, _ in entries]))
+
+
+def compile_file(path, store=None):
+    """(Deck, number of sections parsed) for a Markdown file."""
+    entries, parsed = parse_file(path, store)
+    return make_deck(path, entries), parsed
+
+
+def load_deck(path):
+    return compile_file(path)[0]
+
+
+def main(argv=None):
+    paths = sys.argv[1:] if argv is None else argv
+    if not paths:
+        print("Użycie: md.py PLIK.md [...]", file=sys.stderr)
+        return 2
+    for path in paths:
+        try:
+            deck, parsed = compile_file(path)
+        except ParseError as e:
+            print(f"BŁĄD: {e}", file=sys.stderr)
+            return 1
+        print(f"{deck.name}: {len(deck.slides)} slajdów, przetworzono {parsed} sekcji")
+        for no, s in enumerate(deck.slides, 2):
+            used = sum(block_height(b) for b in s.blocks)
+            kinds = " ".join(type(b).__name__ for b in s.blocks)
+            print(f"{no:3d} [{s.section}] {s.title}  ({used:.0f} pt: {kinds})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
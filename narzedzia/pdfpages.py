@@ -0,0 +1,152 @@
+"""Content-addressed cache of rendered PDF pages.
+
+A backend that draws slides one at a time (build_pdf_aromagic) renders each
+deck slide, with any "(cd.)" pages it runs onto, into a PDF of its own under
+``.build-cache/pages/<backend>/<key>.pdf``. The key digests the slide and
+everything its drawing depends on, so after editing one slide only that
+slide is drawn again; a document is then assembled by copying the cached
+page objects with PyMuPDF. sheets() places the same cached pages, scaled,
+as Form XObjects on A4 portrait sheets (handouts with note lines, printable
+forms), so those formats are an assembly step too.
+
+Text-fit diagnostics (fit.py) reported while a slide is drawn are stored in
+a JSON file beside its pages and replayed, renumbered, on every assembly.
+"""
+
+import json
+import os
+from typing import NamedTuple
+
+import pymupdf
+
+import cache
+import fit
+
+CACHE_DIR = os.path.join(cache.CACHE_DIR, "pages")
+
+# === SHEETS ===
+SHEET_W, SHEET_H = 595.28, 841.89  # A4 portrait, pt
+SHEET_MARGIN = 36
+SHEET_GAP = 18
+NOTE_SPACING = 20  # between note lines
+NOTES_BESIDE = 0.55  # share of a one-column cell the slide takes, lines beside it
+
+
+class Pages(NamedTuple):
+    path: str          # PDF with the pages of one slide
+    count: int
+    diagnostics: list  # fit.Overflow fields, slide numbered from 1 in this file
+
+
+def cached(backend, key, draw):
+    """Pages of one slide: cached under key, or drawn by draw(path), which
+    writes a PDF there and returns its page count."""
+    directory = os.path.join(CACHE_DIR, backend)
+    path = os.path.join(directory, key + ".pdf")
+    meta = os.path.join(directory, key + ".json")
+    try:
+        with open(meta, encoding="utf-8") as f:
+            count, diagnostics = json.load(f)
+        if os.path.exists(path):
+            return Pages(path, count, diagnostics)
+    except (OSError, ValueError):
+        pass
+    os.makedirs(directory, exist_ok=True)
+    tmp = "%s.%d.tmp" % (path, os.getpid())  # workers may draw the same slide
+    try:
+        with fit.captured() as reports:
+            count = draw(tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):  # draw failed part way
+            os.remove(tmp)
+    diagnostics = [o._asdict() for o in reports]
+    tmp = "%s.%d.tmp" % (meta, os.getpid())
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump([count, diagnostics], f, ensure_ascii=False)
+    os.replace(tmp, meta)
+    return Pages(path, count, diagnostics)
+
+
+def replay(parts, deck_name):
+    """Report the diagnostics of parts, numbered as pages of one document."""
+    first = 0
+    for part in parts:
+        for d in part.diagnostics:
+            fit.report(**dict(d, deck=deck_name, slide=first + d["slide"]))
+        first += part.count
+
+
+def assemble(parts, out_path, title):
+    """Write the pages of parts, in order, to out_path; returns the page count."""
+    doc = pymupdf.open()
+    for part in parts:
+        with pymupdf.open(part.path) as src:
+            doc.insert_pdf(src)
+    doc.set_metadata({"title": title, "producer": "pdfpages (PyMuPDF)"})
+    count = doc.page_count
+    tmp = "%s.%d.tmp" % (out_path, os.getpid())
+    doc.save(tmp, garbage=4, deflate=True)
+    doc.close()
+    os.replace(tmp, out_path)
+    return count
+
+
+def _cell(cell, page, notes):
+    """(slide rect, notes rect or None) of a cell holding page, aspect kept."""
+    aspect = page.height / page.width
+    if notes == "beside":
+        w = min(cell.width * NOTES_BESIDE, cell.height / aspect)
+        slide = pymupdf.Rect(cell.x0, cell.y0, cell.x0 + w, cell.y0 + w * aspect)
+        return slide, pymupdf.Rect(slide.x1 + SHEET_GAP, cell.y0, cell.x1, cell.y1)
+    w = min(cell.width, cell.height / aspect)
+    x = cell.x0 + (cell.width - w) / 2
+    slide = pymupdf.Rect(x, cell.y0, x + w, cell.y0 + w * aspect)
+    if notes == "below":
+        return slide, pymupdf.Rect(cell.x0, slide.y1, cell.x1, cell.y1)
+    return slide, None
+
+
+def sheets(parts, out_path, title, columns, rows, notes=True, line_color=(0.9, 0.9, 0.9)):
+    """Place the pages of parts, scaled, columns × rows per A4 portrait sheet;
+    returns the sheet count.
+
+    With notes, each page gets ruled lines beside it (one column) or below
+    it. Every placement of a cached page reuses one Form XObject.
+    """
+    pages = [(part.path, number) for part in parts for number in range(part.count)]
+    per_sheet = columns * rows
+    cell_w = (SHEET_W - 2 * SHEET_MARGIN - SHEET_GAP * (columns - 1)) / columns
+    cell_h = (SHEET_H - 2 * SHEET_MARGIN - SHEET_GAP * (rows - 1)) / rows
+    layout = ("beside" if columns == 1 else "below") if notes else None
+    doc, sources = pymupdf.open(), {}
+    try:
+        for first in range(0, len(pages), per_sheet):
+            sheet = doc.new_page(width=SHEET_W, height=SHEET_H)
+            for i, (path, number) in enumerate(pages[first:first + per_sheet]):
+                if path not in sources:
+                    sources[path] = pymupdf.open(path)
+                x = SHEET_MARGIN + (i % columns) * (cell_w + SHEET_GAP)
+                y = SHEET_MARGIN + (i // columns) * (cell_h + SHEET_GAP)
+                page = sources[path][number]
+                slide, lines = _cell(pymupdf.Rect(x, y, x + cell_w, y + cell_h), page.rect, layout)
+                sheet.show_pdf_page(slide, sources[path], number)
+                sheet.draw_rect(slide, color=line_color, width=0.5)
+                if lines is not None:
+                    y = lines.y0 + NOTE_SPACING
+                    while y <= lines.y1:
+                        sheet.draw_line((lines.x0, y), (lines.x1, y), color=line_color, width=0.5)
+                        y += NOTE_SPACING
+            sheet.insert_text((SHEET_W - SHEET_MARGIN - 24, SHEET_H - SHEET_MARGIN / 2),
+                              "%d / %d" % (first // per_sheet + 1, -(-len(pages) // per_sheet)),
+                              fontsize=8, color=(0.6, 0.6, 0.6))
+        doc.set_metadata({"title": title, "producer": "pdfpages (PyMuPDF)"})
+        count = doc.page_count
+        tmp = "%s.%d.tmp" % (out_path, os.getpid())
+        doc.save(tmp, garbage=4, deflate=True)
+    finally:
+        doc.close()
+        for src in sources.values():
+            src.close()
+    os.replace(tmp, out_path)
+    return count
@@ -0,0 +1,46 @@
+"""Polish text normalization for search: diacritic folding and light stemming.
+
+The stemmer only strips common inflectional suffixes, which is enough to make
+"węch", "węchu" and "węchowy" (or "istota szara" / "istoty szarej") meet at
+the same index term. It is deliberately crude; it must be identical at index
+and query time, not linguistically correct.
+"""
+
+import re
+
+_FOLD = str.maketrans("ąćęłńóśźżĄĆĘŁŃÓŚŹŻ", "acelnoszzACELNOSZZ")
+_WORD_RE = re.compile(r"\w+")
+_FILLER_RE = re.compile(r"^(?:y+m*|e+m*|h?m+)$")  # y, yyy, eee, hmm: caption hesitations
+
+# Folded suffixes, longest first. Stems are kept at least MIN_STEM long.
+SUFFIXES = sorted([
+    "owego", "owych", "owymi", "owemu", "owej", "owym", "owy", "owa", "owe", "owi",
+    "ami", "ach", "ego", "emu", "ich", "ych", "ymi", "imi", "iej", "ow", "om",
+    "ej", "em", "ie", "ia", "iu", "ii", "a", "e", "i", "o", "u", "y",
+], key=len, reverse=True)
+MIN_STEM = 3
+
+
+def fold(text):
+    """Lowercase and strip Polish diacritics."""
+    return text.lower().translate(_FOLD)
+
+
+def stem(word):
+    """Folded word -> stem."""
+    for suffix in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM:
+            return word[:-len(suffix)]
+    return word
+
+
+def terms(text):
+    """Index terms of text in order, fillers dropped."""
+    return [stem(w) for w in _WORD_RE.findall(fold(text)) if not _FILLER_RE.match(w)]
+
+
+def term_spans(text):
+    """(start, end, term) for each word of text; offsets index into text."""
+    for m in _WORD_RE.finditer(fold(text)):
+        if not _FILLER_RE.match(m.group()):
+            yield m.start(), m.end(), stem(m.group())
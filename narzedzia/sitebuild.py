@@ -0,0 +1,744 @@
+#!/usr/bin/env python3
+"""Static site build: strona/ -> docs/.
+
+The pages are edited in ``strona/`` (assets.py and gallery.py update them
+there too) and published from ``docs/``. For every ``strona/**/*.html`` the
+build writes ``docs/**/*.html`` with:
+
+* third-party assets self-hosted: the reveal.js files and Google Fonts
+  families listed in VENDOR and FONTS are read from ``strona/vendor/`` and
+  copied, minified, into ``docs/assets/``; CSS ``@import`` is inlined and
+  ``url()`` references are copied along. Fonts are subset to the characters
+  the pages use when fontTools (with brotli, for WOFF2) is installed;
+* critical CSS inline: the rules of each external stylesheet whose selectors
+  can match the page (its markup and the names its scripts may add) go into
+  a ``<style>`` in place of the ``<link>``; the full sheet is still loaded,
+  without blocking the first paint;
+* HTML, inline CSS and inline JS minified;
+* output names fingerprinted (``reveal.3f2a9c81de.css``), so everything in
+  ``docs/assets/`` can be cached forever. Files there that the build no
+  longer writes are removed;
+* for the pages in OFFLINE_PAGES, a service worker ``sw.js`` next to the
+  page (from ``strona/service-worker.js``) with a precache manifest: every
+  local file the page uses and the hash of its content. Repeat visits are
+  served from the cache, offline too, and a file is fetched again only when
+  its hash changes.
+
+Nothing is fetched: the build runs offline. The vendored files are added to
+the repository once, from the reveal.js 5.1.0 npm package (``dist/``) and
+the Inter release (``InterVariable.woff2``). A page never keeps a CDN
+reference: if a vendored file (or one a vendored stylesheet refers to) is
+missing, the build lists them all and fails without writing anything.
+
+    python3 narzedzia/sitebuild.py
+    python3 narzedzia/sitebuild.py --vendor ~/vendor
+"""
+
+import argparse
+import hashlib
+import html
+import io
+import json
+import os
+import re
+import shutil
+import sys
+
+import cache
+
+try:
+    import brotli  # noqa: F401  (fontTools needs it for WOFF2)
+    from fontTools import subset
+except ImportError:
+    subset = None
+
+ROOT = cache.ROOT
+SOURCE_DIR = os.path.join(ROOT, "strona")
+SITE_DIR = os.path.join(ROOT, "docs")
+VENDOR_DIR = os.path.join(SOURCE_DIR, "vendor")
+ASSETS_DIR = os.path.join(SITE_DIR, "assets")
+
+# CDN URL -> vendored copy (relative to VENDOR_DIR). Relative references in
+# a vendored stylesheet resolve against VENDOR_DIR the same way.
+REVEAL = "https://cdn.jsdelivr.net/npm/reveal.js@5.1.0/dist/"
+VENDOR = {
+    REVEAL + "reveal.css": "reveal.js-5.1.0/reveal.css",
+    REVEAL + "theme/white.css": "reveal.js-5.1.0/theme/white.css",
+    REVEAL + "reveal.js": "reveal.js-5.1.0/reveal.js",
+}
+# Google Fonts family -> variable font covering all the weights we ask for.
+FONTS = {
+    "Inter": "inter/InterVariable.woff2",
+}
+# Pages (relative to strona/) that register an offline service worker.
+OFFLINE_PAGES = ["trening-wechowy/index.html"]
+SERVICE_WORKER = os.path.join(SOURCE_DIR, "service-worker.js")
+SW_NAME = "sw.js"
+REGISTER_SW = ('<script>if ("serviceWorker" in navigator) addEventListener("load", function () '
+               '{ navigator.serviceWorker.register("%s"); });</script>' % SW_NAME)
+
+# Always kept in a subset font, whatever the pages say today.
+FONT_CHARS = ("".join(map(chr, range(0x20, 0x7F)))
+              + "ąćęłńóśźżĄĆĘŁŃÓŚŹŻ„”“‚’–—…·•×→✓✔")
+
+_LINK_RE = re.compile(r"<link\b[^>]*>")
+_SCRIPT_RE = re.compile(r"<script\b([^>]*)>(.*?)</script>", re.S)
+_STYLE_RE = re.compile(r"<style\b[^>]*>(.*?)</style>", re.S)
+_ATTR_RE = re.compile(r'([\w-]+)="([^"]*)"')
+_GOOGLE_FONTS_RE = re.compile(r"^https://fonts\.googleapis\.com/css2\?family=([\w+]+)(?::wght@([\d;]+))?")
+_CSS_REF_RE = re.compile(r"""@import\s+(?:url\()?\s*["']?([^"')\s]+)["']?\s*\)?[^;]*;"""
+                         r"""|url\(\s*["']?([^"')]+?)["']?\s*\)""")
+_OUTPUT_RE = re.compile(r"\.[0-9a-f]{10}\.\w+$")
+MINIFIED_LINE = 200  # mean line length above which a script counts as minified
+
+
+class BuildError(Exception):
+    pass
+
+
+def fingerprint(data):
+    return hashlib.sha256(data).hexdigest()[:10]
+
+
+def output_path(source):
+    """Path under docs/ that a page (or anything else) under strona/ is published to."""
+    return os.path.join(SITE_DIR, os.path.relpath(source, SOURCE_DIR))
+
+
+def _write(path, data):
+    """Write bytes if they differ from what is there; True if written."""
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    tmp = "%s.%d.tmp" % (path, os.getpid())
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return True
+
+
+# === MINIFY ===
+_CSS_TOKEN_RE = re.compile(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|/\*.*?\*/', re.S)
+
+
+def _protect(text, token_re, keep):
+    """text with the matches of token_re replaced by \\0N\\0 placeholders.
+
+    keep(match) returns the text to restore, or None to drop the match.
+    """
+    saved = []
+
+    def stash(m):
+        kept = keep(m)
+        if kept is None:
+            return " "
+        saved.append(kept)
+        return "\0%d\0" % (len(saved) - 1)
+    return token_re.sub(stash, text), saved
+
+
+def _restore(text, saved):
+    return re.sub(r"\0(\d+)\0", lambda m: saved[int(m.group(1))], text)
+
+
+def minify_css(css):
+    """Whitespace and comments out; strings and /*! licence */ comments kept."""
+    css, saved = _protect(css, _CSS_TOKEN_RE, lambda m: (
+        None if m.group(0).startswith("/*") and not m.group(0).startswith("/*!") else m.group(0)))
+    css = re.sub(r"\s+", " ", css)
+    # Not around ":" (".a :hover" differs from ".a:hover") or "+"/"-" (calc()).
+    css = re.sub(r" ?([{};,>~]) ?", r"\1", css)
+    css = re.sub(r": ", ":", css)
+    css = css.replace(";}", "}")
+    return _restore(css.strip(), saved)
+
+
+_JS_REGEX_AFTER = set("(,=:[!&|?{};+-*%<>~^") | {
+    "return", "typeof", "case", "do", "else", "in", "of", "new", "delete", "void",
+    "throw", "yield", "await", "instanceof"}
+_JS_WORD_RE = re.compile(r"[\w$]+|\s+|.", re.S)
+
+
+def _literal_end(js, i):
+    """Index just past the string or template literal starting at i."""
+    quote, j, n = js[i], i + 1, len(js)
+    while j < n and js[j] != quote:
+        if js[j] == "\\":
+            j += 2
+        elif quote == "`" and js.startswith("${", j):
+            j, depth = j + 2, 1
+            while j < n and depth:
+                if js[j] in "'\"`":
+                    j = _literal_end(js, j)
+                    continue
+                depth += {"{": 1, "}": -1}.get(js[j], 0)
+                j += 1
+        else:
+            j += 1
+    return j + 1
+
+
+def js_tokens(js):
+    """Split js into (kind, text) with kind "str", "regex", "comment" or "code".
+
+    Only what minify_js needs: literals and comments are found exactly (a
+    "/" is a regex where an expression can start), code is left in runs.
+    """
+    out, code, last, i, n = [], [], "", 0, len(js)
+
+    def flush():
+        if code:
+            out.append(("code", "".join(code)))
+            code.clear()
+    while i < n:
+        c = js[i]
+        if c in "'\"`":
+            j = _literal_end(js, i)
+            flush()
+            out.append(("str", js[i:j]))
+            last, i = c, j
+        elif js.startswith("//", i):
+            j = js.find("\n", i)
+            j = n if j < 0 else j
+            flush()
+            out.append(("comment", js[i:j]))
+            i = j
+        elif js.startswith("/*", i):
+            j = js.find("*/", i + 2)
+            j = n if j < 0 else j + 2
+            flush()
+            out.append(("comment", js[i:j]))
+            i = j
+        elif c == "/" and (last in _JS_REGEX_AFTER or last == ""):
+            j, in_class = i + 1, False
+            while j < n and (in_class or js[j] != "/") and js[j] != "\n":
+                if js[j] == "\\":
+                    j += 1
+                elif js[j] in "[]":
+                    in_class = js[j] == "["
+                j += 1
+            j += 1
+            while j < n and js[j].isalpha():  # flags
+                j += 1
+            flush()
+            out.append(("regex", js[i:j]))
+            last, i = "/", j
+        else:
+            word = _JS_WORD_RE.match(js, i).group(0)
+            code.append(word)
+            if not word.isspace():
+                last = word
+            i += len(word)
+    flush()
+    return out
+
+
+def minify_js(js):
+    """Comments (but /*! licences) and indentation out; line breaks are kept,
+    so automatic semicolon insertion works as before. Already minified code
+    (a vendored dist file) is returned as is."""
+    if len(js) > MINIFIED_LINE * (js.count("\n") + 1):
+        return js
+    parts = []
+    for kind, text in js_tokens(js):
+        if kind == "comment":
+            if text.startswith("/*!"):
+                parts.append(text)
+            elif text.startswith("//"):
+                parts.append("\n")
+            else:
+                parts.append(" ")
+        elif kind == "code":
+            parts.append(re.sub(r"[ \t]+", " ", re.sub(r"\s*\n\s*", "\n", text)))
+        else:
+            parts.append(text)
+    return re.sub(r"\n+", "\n", "".join(parts)).strip()
+
+
+# Elements around which whitespace never renders.
+_BLOCK = ("html|head|body|div|section|p|ul|ol|li|h[1-6]|meta|link|title|style|script|noscript|"
+          "header|footer|nav|main|article|aside|table|thead|tbody|tr|td|th|figure|figcaption|"
+          "br|hr|source|!DOCTYPE")
+_BLOCK_RE = re.compile(r"\s*(</?(?:%s)\b[^>]*>)\s*" % _BLOCK, re.I)
+_RAW_RE = re.compile(r"<(pre|textarea|script|style)\b[^>]*>.*?</\1>|<!--.*?-->", re.S | re.I)
+
+
+def minify_html(text):
+    """Comments out, whitespace collapsed and dropped around block elements;
+    <script> and <style> contents minified, <pre>/<textarea> untouched."""
+    def keep(m):
+        raw = m.group(0)
+        if raw.startswith("<!--"):
+            return None
+        tag = m.group(1).lower()
+        if tag == "style":
+            s = _STYLE_RE.match(raw)
+            return raw[:s.start(1)] + minify_css(s.group(1)) + raw[s.end(1):]
+        if tag == "script":
+            s = _SCRIPT_RE.match(raw)
+            return raw[:s.start(2)] + minify_js(s.group(2)) + raw[s.end(2):]
+        return raw
+    text, saved = _protect(text, _RAW_RE, keep)
+    text = re.sub(r"\s+", " ", text)
+    text = _BLOCK_RE.sub(r"\1", text)
+    text = re.sub(r"\s*(\0\d+\0)\s*", lambda m: m.group(1) if saved[int(m.group(1)[1:-1])][:7].lower()
+                  in ("<script", "<style>", "<style ") else m.group(0), text)
+    return _restore(text.strip(), saved) + "\n"
+
+
+# === CRITICAL CSS ===
+def _blocks(css):
+    """Top-level (prelude, body) pairs of minified css; body None for statements."""
+    out, i, start, n = [], 0, 0, len(css)
+    while i < n:
+        c = css[i]
+        if c in "'\"":
+            i = css.find(c, i + 1) + 1 or n
+            continue
+        if c == ";":
+            out.append((css[start:i], None))
+            start = i + 1
+        elif c == "{":
+            depth, j = 1, i + 1
+            while j < n and depth:
+                if css[j] in "'\"":
+                    j = css.find(css[j], j + 1) + 1 or n
+                    continue
+                depth += {"{": 1, "}": -1}.get(css[j], 0)
+                j += 1
+            out.append((css[start:i], css[i + 1:j - 1]))
+            start = i = j
+            continue
+        i += 1
+    if css[start:].strip():
+        out.append((css[start:], None))
+    return out
+
+
+def _selectors(prelude):
+    """Split a selector list at top-level commas."""
+    out, depth, start = [], 0, 0
+    for i, c in enumerate(prelude):
+        depth += {"(": 1, "[": 1, ")": -1, "]": -1}.get(c, 0)
+        if c == "," and not depth:
+            out.append(prelude[start:i])
+            start = i + 1
+    return out + [prelude[start:]]
+
+
+def _matches(selector, used):
+    """Whether selector can match a page that uses the names in used.
+
+    Attribute selectors and pseudo-classes are taken to match, so this errs
+    on the side of keeping a rule.
+    """
+    s = re.sub(r"\[[^\]]*\]|::?[\w-]+(?:\([^)]*\))?", "", selector)
+    names = re.findall(r"[.#]([\w-]+)", s)
+    names += [t.lower() for t in re.findall(r"(?:^|[\s>+~])([a-zA-Z][\w-]*)", s)]
+    return all(name in used or name in ("html", "body") for name in names)
+
+
+def critical(css, used):
+    """The rules of minified css that can apply to a page using used names."""
+    out = []
+    for prelude, body in _blocks(_CSS_TOKEN_RE.sub(lambda m: "" if m.group(0).startswith("/*") else m.group(0), css)):
+        if body is None:
+            out.append(prelude + ";")
+        elif prelude.startswith(("@media", "@supports")):
+            inner = critical(body, used)
+            if inner:
+                out.append("%s{%s}" % (prelude, inner))
+        elif prelude.startswith("@"):  # @font-face, @keyframes: cheap, and unused ones cost nothing
+            out.append("%s{%s}" % (prelude, body))
+        else:
+            selectors = [s for s in _selectors(prelude) if _matches(s, used)]
+            if selectors:
+                out.append("%s{%s}" % (",".join(selectors), body))
+    return "".join(out)
+
+
+def used_names(text, scripts):
+    """Tags, classes and ids of a page, with every name-like word in the
+    string literals of its scripts (classes they add, markup they create)."""
+    names = {t.lower() for t in re.findall(r"<([a-zA-Z][\w-]*)", text)}
+    for _, value in re.findall(r'\b(class|id)="([^"]*)"', text):
+        names.update(value.split())
+    for js in scripts:
+        for kind, literal in js_tokens(js):
+            if kind == "str":
+                names.update(re.findall(r"[A-Za-z][\w-]*", literal))
+    return names
+
+
+# === ASSETS ===
+class Site:
+    """Assets written to docs/assets/ during one build, and what was missing.
+
+    Output is kept in memory until flush(), so a build that fails on a
+    missing file leaves docs/assets/ as it was.
+    """
+
+    def __init__(self, vendor_dir=VENDOR_DIR, chars=""):
+        self.vendor_dir = vendor_dir
+        self.chars = "".join(sorted(set(chars + FONT_CHARS)))
+        self.written = {}   # vendored path -> output name
+        self.missing = []   # (vendored path, CDN URL)
+        self.pending = {}   # output name -> bytes not yet written
+        self.css = {}       # output name -> stylesheet text, urls relative to docs/assets/
+        self.js = {}        # output name -> script text
+
+    def local(self, rel):
+        """Path of a vendored file, None if it is not there."""
+        path = os.path.join(self.vendor_dir, rel)
+        return path if os.path.exists(path) else None
+
+    def _emit(self, name, data):
+        stem, ext = os.path.splitext(name)
+        out = "%s.%s%s" % (stem, fingerprint(data), ext)
+        self.pending[out] = data
+        return out
+
+    def flush(self):
+        """Write the assets of this build to docs/assets/."""
+        if self.pending:
+            os.makedirs(ASSETS_DIR, exist_ok=True)
+        for name, data in self.pending.items():
+            _write(os.path.join(ASSETS_DIR, name), data)
+        self.pending.clear()
+
+    def copy(self, rel):
+        """Output name of a vendored binary (fonts, images)."""
+        if rel not in self.written:
+            with open(os.path.join(self.vendor_dir, rel), "rb") as f:
+                self.written[rel] = self._emit(os.path.basename(rel), f.read())
+        return self.written[rel]
+
+    def font(self, rel):
+        """Output name of a vendored font, subset to self.chars if possible."""
+        if rel in self.written:
+            return self.written[rel]
+        source = os.path.join(self.vendor_dir, rel)
+        if subset is None:
+            return self.copy(rel)
+        stem = os.path.splitext(os.path.basename(rel))[0]
+        # Named after the inputs, so the (slow) subsetting runs only when they change.
+        out = "%s.%s.woff2" % (stem, cache.digest(cache.file_digest(source), self.chars)[:10])
+        if not os.path.exists(os.path.join(ASSETS_DIR, out)):
+            options = subset.Options()
+            options.flavor = "woff2"
+            options.layout_features = ["*"]
+            font = subset.load_font(source, options)
+            subsetter = subset.Subsetter(options)
+            subsetter.populate(text=self.chars)
+            subsetter.subset(font)
+            data = io.BytesIO()
+            subset.save_font(font, data, options)
+            self.pending[out] = data.getvalue()
+        self.written[rel] = out
+        return out
+
+    def stylesheet(self, rel, url):
+        """Output name of a vendored stylesheet: @import inlined, url()s copied."""
+        if rel in self.written:
+            return self.written[rel]
+        css = minify_css(self._resolve(rel, url))
+        self.written[rel] = name = self._emit(os.path.basename(rel), css.encode())
+        self.css[name] = css
+        return name
+
+    def _resolve(self, rel, url):
+        with open(os.path.join(self.vendor_dir, rel), encoding="utf-8") as f:
+            css = f.read()
+        base_rel, base_url = os.path.dirname(rel), url.rsplit("/", 1)[0]
+
+        def target(ref):
+            local = os.path.normpath(os.path.join(base_rel, ref)).replace(os.sep, "/")
+            remote = "%s/%s" % (base_url, ref[2:] if ref.startswith("./") else ref)
+            return local, remote
+
+        def import_(m):
+            local, remote = target(m.group(1))
+            if self.local(local) is None:
+                self.missing.append((local, remote))
+                return '@import url("%s");' % remote
+            return self._resolve(local, remote)
+
+        def url_(m):
+            ref = m.group(2)
+            if re.match(r"[a-z]+:|/|#", ref):
+                return m.group(0)
+            suffix = re.search(r"[?#].*$", ref)
+            ref = ref[:suffix.start()] if suffix else ref
+            local, remote = target(ref)
+            if self.local(local) is None:
+                self.missing.append((local, remote))
+                return "url(%s)" % remote
+            name = self.font(local) if local.endswith((".woff2", ".woff", ".ttf", ".otf")) else self.copy(local)
+            return "url(%s%s)" % (name, suffix.group(0) if suffix and suffix.group(0).startswith("#") else "")
+
+        # One pass, so the url()s of an inlined @import are not resolved twice.
+        return _CSS_REF_RE.sub(lambda m: import_(m) if m.group(1) else url_(m), css)
+
+    def script(self, rel):
+        if rel not in self.written:
+            with open(os.path.join(self.vendor_dir, rel), encoding="utf-8") as f:
+                js = minify_js(f.read())
+            self.written[rel] = name = self._emit(os.path.basename(rel), js.encode())
+            self.js[name] = js
+        return self.written[rel]
+
+
+# === PAGES ===
+def _attrs(tag):
+    return dict(_ATTR_RE.findall(tag))
+
+
+def _font_face(family, name, weights, prefix):
+    low, high = (min(weights), max(weights)) if weights else (400, 400)
+    weight = str(low) if low == high else "%d %d" % (low, high)
+    return ('@font-face{font-family:"%s";font-style:normal;font-weight:%s;font-display:swap;'
+            'src:url(%s%s) format("woff2")}' % (family, weight, prefix, name))
+
+
+def _prefixed(css, prefix, names):
+    """css with url(NAME) of our assets made relative to the page."""
+    return re.sub(r"url\(([^)]+)\)", lambda m: "url(%s%s)" % (prefix, m.group(1))
+                  if m.group(1).split("#")[0] in names else m.group(0), css)
+
+
+def build_page(source, site):
+    """Published HTML of one page under strona/."""
+    with open(source, encoding="utf-8") as f:
+        text = f.read()
+    page = os.path.relpath(source, ROOT)
+    prefix = os.path.relpath(ASSETS_DIR, os.path.dirname(output_path(source))).replace(os.sep, "/") + "/"
+
+    scripts = []
+    for attrs, body in _SCRIPT_RE.findall(text):
+        src = _attrs(attrs).get("src")
+        if src in VENDOR and site.local(VENDOR[src]):
+            name = site.script(VENDOR[src])
+            scripts.append(site.js[name])
+        scripts.append(body)
+    used = used_names(text, scripts)
+
+    def script(m):
+        src = _attrs(m.group(1)).get("src")
+        if src not in VENDOR:
+            return m.group(0)
+        if not site.local(VENDOR[src]):
+            site.missing.append((VENDOR[src], src))
+            return m.group(0)
+        return m.group(0).replace(src, prefix + site.script(VENDOR[src]))
+
+    def link(m):
+        attrs = _attrs(m.group(0))
+        href, rel = attrs.get("href", ""), attrs.get("rel")
+        if rel != "stylesheet":
+            return m.group(0)
+        font = _GOOGLE_FONTS_RE.match(href)
+        if font and font.group(1).replace("+", " ") in FONTS:
+            family = font.group(1).replace("+", " ")
+            if not site.local(FONTS[family]):
+                site.missing.append((FONTS[family], href))
+                return m.group(0)
+            name = site.font(FONTS[family])
+            weights = [int(w) for w in (font.group(2) or "").split(";") if w]
+            return ('<link rel="preload" href="%s%s" as="font" type="font/woff2" crossorigin />'
+                    '<style>%s</style>' % (prefix, name, _font_face(family, name, weights, prefix)))
+        if href not in VENDOR:
+            return m.group(0)
+        if not site.local(VENDOR[href]):
+            site.missing.append((VENDOR[href], href))
+            return m.group(0)
+        name = site.stylesheet(VENDOR[href], href)
+        inline = _prefixed(critical(site.css[name], used), prefix, set(site.written.values()))
+        full = prefix + name
+        return ('<style>%s</style>'
+                '<link rel="preload" href="%s" as="style" onload="this.onload=null;this.rel=\'stylesheet\'" />'
+                '<noscript><link rel="stylesheet" href="%s" /></noscript>' % (inline, full, full))
+
+    out = _SCRIPT_RE.sub(script, _LINK_RE.sub(link, text))
+
+    # Preconnects to hosts nothing on the page loads from any more.
+    def preconnect(m):
+        attrs = _attrs(m.group(0))
+        if attrs.get("rel") == "preconnect" and out.count(attrs.get("href", "\0")) == 1:
+            return ""
+        return m.group(0)
+    out = _LINK_RE.sub(preconnect, out)
+    if os.path.relpath(source, SOURCE_DIR).replace(os.sep, "/") in OFFLINE_PAGES:
+        out = out.replace("</body>", REGISTER_SW + "\n</body>", 1)
+    return page, minify_html(out)
+
+
+# === OFFLINE ===
+_PICTURE_RE = re.compile(r"<picture\b.*?</picture>", re.S)
+_RESOURCE_RE = re.compile(r"<(?:img|source|link|script)\b[^>]*>")
+_CSS_URL_RE = re.compile(r"""url\(\s*["']?([^"')]+)""")
+_FONT_FACE_RE = re.compile(r"@font-face\s*\{([^}]*)\}")
+
+
+def _local_urls(tag):
+    """(url, candidate) for the local files a tag loads; candidate for the
+    srcset entries, of which the browser fetches one."""
+    attrs = _attrs(tag)
+    if tag.startswith("<link") and attrs.get("rel") not in ("stylesheet", "preload", "icon"):
+        return []
+    urls = [(attrs[a], False) for a in ("src", "href") if a in attrs]
+    urls += [(c.split()[0], True) for c in attrs.get("srcset", "").split(",") if c.strip()]
+    return [(u, c) for u, c in urls if not re.match(r"[a-z][\w+.-]*:|//|#", u)]
+
+
+def _css_urls(css):
+    """(url, candidate) for the local files a stylesheet loads; candidate for
+    the files of an @font-face offering several formats, of which the
+    browser fetches one."""
+    def local(text):
+        return [u for u in _CSS_URL_RE.findall(text) if not re.match(r"[a-z][\w+.-]*:|//|#|data:", u)]
+    urls = []
+
+    def face(m):
+        found = local(m.group(1))
+        several = len({u.split("?")[0].split("#")[0] for u in found}) > 1
+        urls.extend((u, several) for u in found)
+        return ""
+    rest = _FONT_FACE_RE.sub(face, css)
+    return urls + [(u, False) for u in local(rest)]
+
+
+def manifest(out):
+    """{"precache": [[url, revision]], "runtime": [[url, revision]]} of a
+    published page; urls are relative to the page's directory, revisions
+    hash the files. Everything inside a <picture>, every srcset entry and
+    the formats of a multi-format @font-face are runtime candidates;
+    stylesheets are followed to the fonts they load."""
+    directory = os.path.dirname(out)
+    with open(out, encoding="utf-8") as f:
+        text = f.read()
+    found = {}  # path -> candidate
+
+    def add(path, candidate):
+        path = os.path.normpath(path.split("?")[0].split("#")[0])
+        if path in found:
+            found[path] = found[path] and candidate
+            return
+        found[path] = candidate
+        if path.endswith(".css") and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for url, is_candidate in _css_urls(f.read()):
+                    add(os.path.join(os.path.dirname(path), url), is_candidate)
+
+    def picture(m):
+        for tag in _RESOURCE_RE.findall(m.group(0)):
+            for url, _ in _local_urls(tag):
+                add(os.path.join(directory, url), True)
+        return ""
+    for tag in _RESOURCE_RE.findall(_PICTURE_RE.sub(picture, text)):
+        for url, candidate in _local_urls(tag):
+            add(os.path.join(directory, url), candidate)
+    for css in _STYLE_RE.findall(text):
+        for url, candidate in _css_urls(css):
+            add(os.path.join(directory, url), candidate)
+
+    entries = {"precache": [["./", fingerprint(text.encode("utf-8"))]], "runtime": []}
+    for path, candidate in sorted(found.items()):
+        if not os.path.isfile(path):
+            print(f"UWAGA: {os.path.relpath(out, ROOT)}: brak {os.path.relpath(path, ROOT)}",
+                  file=sys.stderr)
+            continue
+        with open(path, "rb") as f:
+            revision = fingerprint(f.read())
+        url = os.path.relpath(path, directory).replace(os.sep, "/")
+        entries["runtime" if candidate else "precache"].append([url, revision])
+    return entries
+
+
+def service_worker(out):
+    """Write sw.js next to a published page; returns its manifest."""
+    entries = manifest(out)
+    with open(SERVICE_WORKER, encoding="utf-8") as f:
+        script = f.read()
+    text = "const MANIFEST = %s;\n%s\n" % (json.dumps(entries, separators=(",", ":")), minify_js(script))
+    _write(os.path.join(os.path.dirname(out), SW_NAME), text.encode("utf-8"))
+    return entries
+
+
+def sources():
+    for directory, dirs, files in os.walk(SOURCE_DIR):
+        dirs[:] = sorted(d for d in dirs if os.path.join(directory, d) != VENDOR_DIR)
+        for f in sorted(files):
+            if f.endswith(".html"):
+                yield os.path.join(directory, f)
+
+
+def page_text(path):
+    """Characters a page shows: its text content and CSS content: strings."""
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    strings = "".join(re.findall(r"content:\s*[\"']([^\"']*)", text))
+    text = re.sub(r"<(script|style)\b.*?</\1>|<[^>]*>", " ", text, flags=re.S)
+    return html.unescape(text) + strings
+
+
+def build(vendor_dir=VENDOR_DIR, verbose=True):
+    """Build every page; returns the number of pages written.
+
+    BuildError if any vendored file is missing; nothing is written then.
+    """
+    pages = list(sources())
+    site = Site(vendor_dir, "".join(page_text(p) for p in pages))
+    results = [(source, *build_page(source, site)) for source in pages]
+    missing = sorted(dict(reversed(site.missing)).items())
+    if missing:
+        raise BuildError(f"{len(missing)} plików nie ma w {os.path.relpath(vendor_dir, ROOT)}:\n"
+                         + "\n".join(f"  {rel}  ({url})" for rel, url in missing))
+    site.flush()
+
+    written = 0
+    for source, page, text in results:
+        out = output_path(source)
+        os.makedirs(os.path.dirname(out), exist_ok=True)
+        written += _write(out, text.encode("utf-8"))
+        if verbose:
+            print(f"{os.path.relpath(out, ROOT)}: {os.path.getsize(source) / 1e3:.1f} kB -> "
+                  f"{len(text.encode('utf-8')) / 1e3:.1f} kB")
+        if os.path.relpath(source, SOURCE_DIR).replace(os.sep, "/") in OFFLINE_PAGES:
+            entries = service_worker(out)
+            if verbose:
+                print(f"{os.path.relpath(os.path.join(os.path.dirname(out), SW_NAME), ROOT)}: "
+                      f"{len(entries['precache'])} plików na start, "
+                      f"{len(entries['runtime'])} wariantów obrazów przy pierwszym użyciu")
+
+    # Outputs are content-addressed: anything not written now is stale.
+    keep = set(site.written.values())
+    stale = [f for f in os.listdir(ASSETS_DIR) if _OUTPUT_RE.search(f) and f not in keep] \
+        if os.path.isdir(ASSETS_DIR) else []
+    for f in stale:
+        os.remove(os.path.join(ASSETS_DIR, f))
+    if os.path.isdir(ASSETS_DIR) and not os.listdir(ASSETS_DIR):
+        shutil.rmtree(ASSETS_DIR)
+    if verbose:
+        print(f"{os.path.relpath(ASSETS_DIR, ROOT)}: {len(keep)} plików, usunięto {len(stale)}"
+              + ("" if subset else " (bez fontTools: fonty bez podzbioru)"))
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Statyczna strona: strona/ -> docs/.")
+    parser.add_argument("--vendor", default=VENDOR_DIR,
+                        help="katalog z lokalnymi kopiami reveal.js i fontów (domyślnie: strona/vendor)")
+    args = parser.parse_args(argv)
+    try:
+        build(args.vendor)
+    except BuildError as e:
+        print(f"BŁĄD: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
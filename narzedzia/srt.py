@@ -0,0 +1,136 @@
+"""Streaming SubRip (.srt) parser.
+
+The lecture transcripts are auto-captions with rolling cues: every cue adds a
+new fragment while the previous one is still on screen, so cue N overlaps
+cue N+1 (``00:00:01,560 --> 00:00:07,040`` then ``00:00:03,759 --> ...``).
+``iter_cues`` streams raw cues line by line; ``merge_cues`` turns them into
+non-overlapping sentences with start/end times.
+"""
+
+import re
+from typing import NamedTuple
+
+
+class Cue(NamedTuple):
+    index: int
+    start: int  # ms
+    end: int    # ms
+    text: str
+
+
+class Sentence(NamedTuple):
+    start: int  # ms
+    end: int    # ms
+    text: str
+
+
+_TIME_RE = re.compile(r"(\d+):(\d\d):(\d\d)[,.](\d{1,3})")
+_NOISE_RE = re.compile(r"\[[^\]]*\]")  # [Muzyka], [Music], [Śmiech]...
+_SENTENCE_END_RE = re.compile(r"(?<=[.?!…])\s+")
+_TERMINAL = (".", "?", "!", "…")
+
+# Auto-captions sometimes go on for minutes without punctuation.
+MAX_SENTENCE_CHARS = 400
+
+
+def parse_timestamp(text):
+    """'00:01:02,345' -> 62345"""
+    m = _TIME_RE.match(text.strip())
+    if not m:
+        raise ValueError("Niepoprawny znacznik czasu: " + repr(text))
+    h, mi, s, ms = m.groups()
+    return ((int(h) * 60 + int(mi)) * 60 + int(s)) * 1000 + int(ms.ljust(3, "0"))
+
+
+def format_timestamp(ms, sep=","):
+    """62345 -> '00:01:02,345' (sep="." for WebVTT)"""
+    s, ms = divmod(int(ms), 1000)
+    m, s = divmod(s, 60)
+    h, m = divmod(m, 60)
+    return "%02d:%02d:%02d%s%03d" % (h, m, s, sep, ms)
+
+
+def clean_text(text):
+    return " ".join(_NOISE_RE.sub(" ", text).split())
+
+
+def iter_cues(path):
+    """Yield Cue objects from an .srt file without reading it whole."""
+    with open(path, encoding="utf-8-sig") as f:
+        yield from parse_cues(f)
+
+
+def parse_cues(lines):
+    """Yield Cue objects from an iterable of .srt lines."""
+    index, start, end, text = None, None, None, []
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if not line.strip():
+            if start is not None:
+                yield Cue(index, start, end, "\n".join(text))
+            index, start, end, text = None, None, None, []
+        elif start is None and "-->" in line:
+            a, b = line.split("-->", 1)
+            start, end = parse_timestamp(a), parse_timestamp(b)
+        elif index is None and start is None and line.strip().isdigit():
+            index = int(line)
+        elif start is not None:
+            text.append(line.strip())
+    if start is not None:
+        yield Cue(index, start, end, "\n".join(text))
+
+
+def fragments(cues):
+    """Yield (start, end, text) per cue with overlaps removed.
+
+    A rolling cue's own fragment is on screen from its start until the next
+    cue starts, so each fragment ends at min(end, next.start).
+    """
+    prev = None
+    for cue in cues:
+        if prev is not None:
+            yield _fragment(prev, cue.start)
+        prev = cue
+    if prev is not None:
+        yield _fragment(prev, None)
+
+
+def _fragment(cue, next_start):
+    end = cue.end
+    if next_start is not None and cue.start < next_start < end:
+        end = next_start
+    return cue.start, end, clean_text(cue.text)
+
+
+def merge_cues(cues, max_chars=MAX_SENTENCE_CHARS):
+    """Yield Sentence objects assembled from rolling cues.
+
+    Fragments are split at sentence-final punctuation; times inside a
+    fragment are interpolated by character position.
+    """
+    parts, start, length = [], None, 0
+    for f_start, f_end, text in fragments(cues):
+        if not text:
+            continue
+        pieces = _SENTENCE_END_RE.split(text)
+        span = f_end - f_start
+        pos = 0
+        for i, piece in enumerate(pieces):
+            p_start = f_start + span * pos // len(text)
+            pos += len(piece) + (1 if i < len(pieces) - 1 else 0)
+            p_end = f_start + span * min(pos, len(text)) // len(text)
+            if start is None:
+                start = p_start
+            parts.append(piece)
+            length += len(piece) + 1
+            if piece.endswith(_TERMINAL) or length >= max_chars:
+                yield Sentence(start, p_end, " ".join(parts))
+                parts, start, length = [], None, 0
+            last_end = p_end
+    if parts:
+        yield Sentence(start, last_end, " ".join(parts))
+
+
+def iter_sentences(path):
+    """Stream sentences straight from an .srt file."""
+    return merge_cues(iter_cues(path))
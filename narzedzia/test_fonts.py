@@ -0,0 +1,60 @@
+"""Round trip through the parsed-font cache of fonts.py.
+
+    python3 -m unittest discover -s narzedzia -p "test_*.py"
+"""
+
+import os
+import re
+import tempfile
+import unittest
+from io import BytesIO
+from unittest import mock
+from weakref import WeakKeyDictionary
+
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfgen import canvas
+
+import fonts
+
+SAMPLE = "Zażółć gęślą jaźń — „Trening węchowy” 0123456789 ĄĆĘŁŃÓŚŹŻ"
+FILES = ("Inter-Regular.ttf", "Inter_24pt-Regular.ttf", "DejaVuSans.ttf")
+
+
+def _widths(font):
+    """/Widths arrays of a one-line PDF drawn with font."""
+    pdfmetrics.registerFont(font)
+    out = BytesIO()
+    c = canvas.Canvas(out)
+    c.setFont(font.fontName, 12)
+    c.drawString(72, 720, SAMPLE)
+    c.save()
+    return re.findall(rb"/Widths\s*\[([^\]]*)\]", out.getvalue())
+
+
+class CacheRoundTrip(unittest.TestCase):
+    def setUp(self):
+        self.path = fonts.find(FILES)
+        if self.path is None:
+            self.skipTest("brak pliku TTF (%s)" % ", ".join(FILES))
+
+    def cached(self, name):
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(fonts, "CACHE_PATH", os.path.join(tmp, "fonts.pickle")):
+            fonts._save_cache({(name, self.path): ((0, 0), fonts._parse(name, self.path))})
+            (_, font), = fonts._load_cache().values()
+        font.state = WeakKeyDictionary()
+        return font
+
+    def test_same_widths(self):
+        fresh, cached = TTFont("RoundTrip-Fresh", self.path), self.cached("RoundTrip-Cached")
+        self.assertEqual(cached.stringWidth(SAMPLE, 12), fresh.stringWidth(SAMPLE, 12))
+        self.assertEqual(cached.face.charWidths, fresh.face.charWidths)
+        for v in (0, 1, 517, cached.face.unitsPerEm, 4096):
+            self.assertEqual(cached.pdfScale(v), fresh.pdfScale(v))
+        self.assertTrue(_widths(fresh))
+        self.assertEqual(_widths(cached), _widths(fresh))
+
+
+if __name__ == "__main__":
+    unittest.main()
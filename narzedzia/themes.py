@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Declarative presentation themes.
+
+A theme is a JSON style sheet in ``projekty/trening-wechowy/motywy/``: a
+``name``, the ``engine`` module that draws it (build_pptx or
+build_pdf_aromagic), the output ``suffix``, named ``colors`` and one style
+per element (section label, title, lists, boxes, tables, cover, side
+panel...). Any string value that names a color is replaced by its hex
+value, and a color may name another color. A theme can ``extends``
+another one and override only what differs, so a new client theme is a
+short data file.
+
+Loading merges the ``extends`` chain and resolves colors. The compiled
+theme is pickled in ``.build-cache/themes/`` together with the digests of
+the files it came from, so a build reads JSON only after a theme changed.
+
+    python3 narzedzia/themes.py          # list the themes
+"""
+
+import json
+import os
+import pickle
+import re
+import sys
+
+import cache
+
+THEMES_DIR = os.path.join(cache.ROOT, "projekty", "trening-wechowy", "motywy")
+CACHE_DIR = os.path.join(cache.CACHE_DIR, "themes")
+REQUIRED = ("name", "engine", "suffix", "colors")
+
+_SOURCE = os.path.abspath(__file__)
+_HEX_RE = re.compile(r"^#[0-9A-Fa-f]{6}$")
+_loaded = {}
+
+
+class Style(dict):
+    """A dict whose keys are also attributes: theme.title.size."""
+
+    def __getattr__(self, key):
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(key) from None
+
+
+def _path(name):
+    return os.path.join(THEMES_DIR, name.lower() + ".json")
+
+
+def _chain(name):
+    """[(path, data)] of a theme and the themes it extends, base first."""
+    chain, seen = [], set()
+    while name:
+        path = _path(name)
+        if path in seen:
+            raise ValueError("motyw %s: cykl w extends" % name)
+        seen.add(path)
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        chain.insert(0, (path, data))
+        name = data.get("extends")
+    return chain
+
+
+def _merge(base, over):
+    out = dict(base)
+    for key, value in over.items():
+        if isinstance(value, dict) and isinstance(out.get(key), dict):
+            value = _merge(out[key], value)
+        out[key] = value
+    return out
+
+
+def _resolve(value, colors):
+    if isinstance(value, dict):
+        return Style((k, _resolve(v, colors)) for k, v in value.items())
+    if isinstance(value, list):
+        return [_resolve(v, colors) for v in value]
+    return colors.get(value, value) if isinstance(value, str) else value
+
+
+def compile_theme(chain):
+    """Compiled Style from _chain() output."""
+    data = {}
+    for _, layer in chain:
+        data = _merge(data, layer)
+    data.pop("extends", None)
+    name = data.get("name", os.path.basename(chain[-1][0]))
+    missing = [k for k in REQUIRED if k not in data]
+    if missing:
+        raise ValueError("motyw %s: brak %s" % (name, ", ".join(missing)))
+    colors = {}
+    for key, value in data["colors"].items():
+        value = colors.get(value, value)  # a color may name an earlier one
+        if not _HEX_RE.match(value):
+            raise ValueError("motyw %s: kolor %s=%r nie jest #RRGGBB" % (name, key, value))
+        colors[key] = value.upper()
+    data["colors"] = colors
+    return _resolve(data, colors)
+
+
+def _cache_path(name):
+    return os.path.join(CACHE_DIR, name.lower() + ".pickle")
+
+
+def _stamps(paths):
+    return [(p, cache.file_digest(p)) for p in paths] + [(_SOURCE, cache.file_digest(_SOURCE))]
+
+
+def _load_cached(name):
+    try:
+        with open(_cache_path(name), "rb") as f:
+            stamps, theme = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError, TypeError):
+        return None
+    return theme if stamps == _stamps([p for p, _ in stamps[:-1]]) else None
+
+
+def _save_cached(name, paths, theme):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    target = _cache_path(name)
+    tmp = "%s.%d.tmp" % (target, os.getpid())  # workers may save concurrently
+    with open(tmp, "wb") as f:
+        pickle.dump((_stamps(paths), theme), f, pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, target)
+
+
+def load(name):
+    """Compiled theme by name (the file name, any case); memoized per process."""
+    key = name.lower()
+    if key not in _loaded:
+        theme = _load_cached(key)
+        if theme is None:
+            chain = _chain(key)
+            theme = compile_theme(chain)
+            _save_cached(key, [p for p, _ in chain], theme)
+        _loaded[key] = theme
+    return _loaded[key]
+
+
+def available():
+    """{theme name: engine} of every theme in THEMES_DIR, in file name order."""
+    names = sorted(os.path.splitext(f)[0] for f in os.listdir(THEMES_DIR) if f.endswith(".json"))
+    themes = [load(n) for n in names]
+    return {t.name: t.engine for t in themes}
+
+
+def main(argv=None):
+    for name, engine in available().items():
+        t = load(name)
+        print(f"{name:10s} {engine:20s} {len(t.colors):2d} kolorów  {os.path.relpath(_path(name), cache.ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
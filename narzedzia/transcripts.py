@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""Indexed store of the lecture transcripts in transkrypcje/.
+
+Each .srt file is streamed through srt.iter_sentences() once and persisted
+into a SQLite database (``.build-cache/transkrypcje.sqlite``) with start/end
+times per sentence, plus an inverted index of Polish-folded, stemmed terms
+(see polish.py) with token positions for phrase search. Files are re-indexed
+only when their content digest changes, so repeated queries never re-parse
+the subtitles. Time queries (between(), at(), clip()) go through an
+intervals.IntervalIndex of the lecture's sentences, loaded from the database
+once per store, so each one is a bisection.
+
+    python3 narzedzia/transcripts.py index
+    python3 narzedzia/transcripts.py list
+    python3 narzedzia/transcripts.py show 06 12:30 14:00
+    python3 narzedzia/transcripts.py at 06 00:41:10
+    python3 narzedzia/transcripts.py search "gruczoły Bowmana"
+"""
+
+import argparse
+import glob
+import os
+import re
+import sqlite3
+import sys
+
+import cache
+import intervals
+import polish
+import srt
+
+TRANSCRIPTS_DIR = os.path.join(cache.ROOT, "transkrypcje")
+INDEX_PATH = os.path.join(cache.CACHE_DIR, "transkrypcje.sqlite")
+
+# Bump when SCHEMA changes; an index with another version is rebuilt from scratch.
+SCHEMA_VERSION = 2
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS lectures (
+    id INTEGER PRIMARY KEY,
+    file TEXT UNIQUE NOT NULL,
+    number TEXT NOT NULL,
+    title TEXT NOT NULL,
+    lang TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sentences (
+    lecture_id INTEGER NOT NULL REFERENCES lectures(id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    start_ms INTEGER NOT NULL,
+    end_ms INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    PRIMARY KEY (lecture_id, seq)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS sentences_time ON sentences (lecture_id, start_ms);
+CREATE TABLE IF NOT EXISTS terms (
+    id INTEGER PRIMARY KEY,
+    term TEXT UNIQUE NOT NULL
+);
+-- pos counts tokens across the whole lecture, so phrases may span sentences
+CREATE TABLE IF NOT EXISTS postings (
+    term_id INTEGER NOT NULL,
+    lecture_id INTEGER NOT NULL REFERENCES lectures(id) ON DELETE CASCADE,
+    pos INTEGER NOT NULL,
+    seq INTEGER NOT NULL,
+    PRIMARY KEY (term_id, lecture_id, pos)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_lecture ON postings (lecture_id);
+"""
+
+_NAME_RE = re.compile(r"^(\w+)\.\s*(.*?)(\s*\((EN)\))?\.srt$")
+
+
+def lecture_meta(filename):
+    """'11. Epidemiologia ... (EN).srt' -> ('11', 'Epidemiologia ...', 'en')"""
+    m = _NAME_RE.match(filename)
+    if not m:
+        return "", os.path.splitext(filename)[0], "pl"
+    return m.group(1), m.group(2), "en" if m.group(4) else "pl"
+
+
+def parse_time(text):
+    """'12:30', '00:41:10' or '00:41:10,500' -> ms; ValueError otherwise."""
+    parts = text.replace(",", ".").split(":")
+    seconds = 0.0
+    try:
+        for part in parts:
+            seconds = seconds * 60 + float(part)
+    except ValueError:
+        raise ValueError("zły czas %r, np. 12:30 lub 00:41:10" % text) from None
+    return int(round(seconds * 1000))
+
+
+def shorten(text, phrase, width=240):
+    """Cut text to about width chars around the first word of phrase."""
+    if len(text) <= width:
+        return text
+    first = polish.terms(phrase)[:1]
+    at = next((start for start, _, term in polish.term_spans(text) if [term] == first), 0)
+    start = max(0, min(at - width // 3, len(text) - width))
+    return ("…" if start else "") + text[start:start + width] + ("…" if start + width < len(text) else "")
+
+
+class TranscriptStore:
+    def __init__(self, path=INDEX_PATH):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA foreign_keys = ON")
+        if self.db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self._drop_all()
+        self.db.executescript(SCHEMA)
+        self.db.execute("PRAGMA user_version = %d" % SCHEMA_VERSION)
+        self._term_ids = dict(self.db.execute("SELECT term, id FROM terms"))
+        self._timelines = {}
+
+    def _drop_all(self):
+        tables = [r[0] for r in self.db.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'")]
+        self.db.execute("PRAGMA foreign_keys = OFF")
+        for table in tables:
+            self.db.execute('DROP TABLE IF EXISTS "%s"' % table)
+        self.db.execute("PRAGMA foreign_keys = ON")
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- indexing ---
+
+    def update(self, directory=TRANSCRIPTS_DIR):
+        """Index new/changed .srt files, drop removed ones; returns changed file names."""
+        known = {row[0]: row[1:] for row in
+                 self.db.execute("SELECT file, digest, mtime_ns, size FROM lectures")}
+        present = set()
+        changed = []
+        for path in sorted(glob.glob(os.path.join(directory, "*.srt"))):
+            name = os.path.basename(path)
+            present.add(name)
+            st = os.stat(path)
+            old = known.get(name)
+            if old and old[1:] == (st.st_mtime_ns, st.st_size):
+                continue  # untouched since last index, skip hashing
+            digest = cache.file_digest(path)
+            if old and old[0] == digest:
+                self.db.execute("UPDATE lectures SET mtime_ns = ?, size = ? WHERE file = ?",
+                                (st.st_mtime_ns, st.st_size, name))
+                continue
+            self._index_file(path, name, digest, st)
+            changed.append(name)
+        for name in set(known) - present:
+            self.db.execute("DELETE FROM lectures WHERE file = ?", (name,))
+            changed.append(name)
+        self.db.commit()
+        if changed:
+            self._timelines.clear()  # ids of re-indexed lectures change
+        return changed
+
+    def _index_file(self, path, name, digest, st):
+        number, title, lang = lecture_meta(name)
+        self.db.execute("DELETE FROM lectures WHERE file = ?", (name,))
+        cur = self.db.execute(
+            "INSERT INTO lectures (file, number, title, lang, digest, mtime_ns, size) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (name, number, title, lang, digest, st.st_mtime_ns, st.st_size))
+        lecture_id = cur.lastrowid
+        sentences, postings = [], []
+        pos = 0
+        for seq, sent in enumerate(srt.iter_sentences(path)):
+            sentences.append((lecture_id, seq, sent.start, sent.end, sent.text))
+            for term in polish.terms(sent.text):
+                postings.append((self._term_id(term), lecture_id, pos, seq))
+                pos += 1
+        self.db.executemany(
+            "INSERT INTO sentences (lecture_id, seq, start_ms, end_ms, text) VALUES (?, ?, ?, ?, ?)",
+            sentences)
+        self.db.executemany(
+            "INSERT INTO postings (term_id, lecture_id, pos, seq) VALUES (?, ?, ?, ?)", postings)
+        return lecture_id
+
+    def _term_id(self, term):
+        term_id = self._term_ids.get(term)
+        if term_id is None:
+            term_id = self.db.execute("INSERT INTO terms (term) VALUES (?)", (term,)).lastrowid
+            self._term_ids[term] = term_id
+        return term_id
+
+    # --- queries ---
+
+    def lectures(self):
+        """[(id, file, number, title, lang)] in file order."""
+        return self.db.execute(
+            "SELECT id, file, number, title, lang FROM lectures ORDER BY file").fetchall()
+
+    def lecture_id(self, query, lang="pl"):
+        """Resolve '06', '6', a file name or a title fragment to a lecture id."""
+        q = query.strip().lower()
+        rows = self.lectures()
+        for lecture_id, file, number, title, l in rows:
+            if l == lang and number.lstrip("0") == q.lstrip("0") and number:
+                return lecture_id
+        for lecture_id, file, number, title, l in rows:
+            if q == file.lower() or (q in title.lower() and l == lang):
+                return lecture_id
+        raise KeyError("Nie znaleziono wykładu: " + query)
+
+    def sentences(self, lecture_id):
+        """[(start_ms, end_ms, text)] of a lecture, in order."""
+        return self.db.execute(
+            "SELECT start_ms, end_ms, text FROM sentences WHERE lecture_id = ? ORDER BY seq",
+            (lecture_id,)).fetchall()
+
+    def timeline(self, lecture_id):
+        """IntervalIndex of a lecture's sentences (srt.Sentence), loaded once."""
+        if lecture_id not in self._timelines:
+            self._timelines[lecture_id] = intervals.IntervalIndex(
+                srt.Sentence(*row) for row in self.sentences(lecture_id))
+        return self._timelines[lecture_id]
+
+    def between(self, lecture_id, start_ms, end_ms):
+        """Sentences (srt.Sentence) overlapping [start_ms, end_ms), in order."""
+        return self.timeline(lecture_id).overlapping(start_ms, end_ms)
+
+    def at(self, lecture_id, ms):
+        """Sentences (srt.Sentence) being said at ms."""
+        return self.timeline(lecture_id).at(ms)
+
+    def clip(self, lecture, start, end=None, lang="pl"):
+        """Sentences of a lecture ('06', a title fragment or an id) between two
+        times ('12:30', '00:41:10' or ms); without end, what is said at start."""
+        lecture_id = lecture if isinstance(lecture, int) else self.lecture_id(lecture, lang)
+        start = parse_time(start) if isinstance(start, str) else start
+        if end is None:
+            return self.at(lecture_id, start)
+        end = parse_time(end) if isinstance(end, str) else end
+        return self.between(lecture_id, start, end)
+
+    def search(self, phrase, lang=None, limit=50):
+        """Occurrences of phrase (folded, stemmed, consecutive terms).
+
+        Returns [(file, number, title, start_ms, context)] ordered by lecture
+        and time; context is the sentence(s) the match spans.
+        """
+        term_ids = [self._term_ids.get(t) for t in polish.terms(phrase)]
+        if not term_ids or None in term_ids:
+            return []
+        joins = "".join(
+            " JOIN postings p%d ON p%d.term_id = ? AND p%d.lecture_id = p0.lecture_id"
+            " AND p%d.pos = p0.pos + %d" % (i, i, i, i, i)
+            for i in range(1, len(term_ids)))
+        last = len(term_ids) - 1
+        sql = ("SELECT p0.lecture_id, p0.seq, p%d.seq FROM postings p0%s"
+               " JOIN lectures l ON l.id = p0.lecture_id"
+               " WHERE p0.term_id = ?%s ORDER BY l.file, p0.pos LIMIT ?"
+               % (last, joins, " AND l.lang = ?" if lang else ""))
+        params = term_ids[1:] + [term_ids[0]] + ([lang] if lang else []) + [limit]
+        hits = []
+        for lecture_id, first, last_seq in self.db.execute(sql, params).fetchall():
+            file, number, title = self.db.execute(
+                "SELECT file, number, title FROM lectures WHERE id = ?", (lecture_id,)).fetchone()
+            rows = self.db.execute(
+                "SELECT start_ms, text FROM sentences WHERE lecture_id = ? AND seq BETWEEN ? AND ?"
+                " ORDER BY seq", (lecture_id, first, last_seq)).fetchall()
+            hits.append((file, number, title, rows[0][0], " ".join(r[1] for r in rows)))
+        return hits
+
+
+def open_store(path=INDEX_PATH, directory=TRANSCRIPTS_DIR):
+    """Open the index and bring it up to date with the .srt files."""
+    store = TranscriptStore(path)
+    store.update(directory)
+    return store
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Indeks transkrypcji wykładów.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("index", help="zaktualizuj indeks")
+    sub.add_parser("list", help="lista wykładów")
+    show = sub.add_parser("show", help="tekst wykładu w przedziale czasu")
+    show.add_argument("lecture", help="numer lub fragment tytułu, np. 06")
+    show.add_argument("start", nargs="?", default="0")
+    show.add_argument("end", nargs="?", default="99:00:00")
+    show.add_argument("--lang", default="pl", choices=["pl", "en"])
+    at = sub.add_parser("at", help="co jest mówione w danym momencie wykładu")
+    at.add_argument("lecture", help="numer lub fragment tytułu, np. 06")
+    at.add_argument("time", help="np. 00:41:10")
+    at.add_argument("--lang", default="pl", choices=["pl", "en"])
+    find = sub.add_parser("search", help="wyszukaj frazę we wszystkich wykładach")
+    find.add_argument("phrase")
+    find.add_argument("--lang", choices=["pl", "en"])
+    find.add_argument("-n", "--limit", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    with TranscriptStore() as store:
+        changed = store.update()
+        if args.command == "index":
+            print(f"Zaktualizowano {len(changed)} plików.")
+            for name in changed:
+                print("  " + name)
+        elif args.command == "list":
+            for lecture_id, file, number, title, lang in store.lectures():
+                n = store.db.execute("SELECT COUNT(*) FROM sentences WHERE lecture_id = ?",
+                                     (lecture_id,)).fetchone()[0]
+                print(f"{number:>3s} {lang}  {n:5d} zdań  {title}")
+        elif args.command in ("show", "at"):
+            try:
+                sentences = (store.clip(args.lecture, args.start, args.end, args.lang)
+                             if args.command == "show" else store.clip(args.lecture, args.time, lang=args.lang))
+            except (KeyError, ValueError) as e:
+                print(f"BŁĄD: {e.args[0]}", file=sys.stderr)
+                return 1
+            for start, end, text in sentences:
+                print(f"[{srt.format_timestamp(start)}] {text}")
+            if not sentences:
+                print("Brak tekstu w tym miejscu.")
+                return 1
+        elif args.command == "search":
+            hits = store.search(args.phrase, args.lang, args.limit)
+            for file, number, title, start, context in hits:
+                print(f"{number:>3s} [{srt.format_timestamp(start)}] {title}")
+                print("     " + shorten(context, args.phrase))
+            if not hits:
+                print("Brak wyników.")
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Build every theme of the Trening Węchowy deck in one process.
+
+The deck model is built once from slides.py and handed to the backend of
+every theme in motywy/.
+Outputs whose inputs did not change since the last build are skipped
+(see narzedzia/cache.py); pass --force to rebuild anyway.
+"""
+
+import argparse
+import sys
+import time
+
+import build_pptx  # puts narzedzia/ on sys.path
+import cache
+import fit
+from build_all import THEMES, load_backend
+from slides import build_deck
+
+
+def build_all(deck=None, force=False, build_cache=None):
+    """Render every backend; returns [(theme, out_path, slides or None, seconds)].
+
+    slides is None for outputs skipped as up to date.
+    """
+    if deck is None:
+        deck = build_deck()
+    if build_cache is None:
+        build_cache = cache.BuildCache()
+    results = []
+    for theme in THEMES:
+        backend = load_backend(theme)
+        t0 = time.perf_counter()
+        out_path = backend.output_path(deck)
+        key = cache.artifact_key(deck, backend)
+        if not force and build_cache.is_fresh(out_path, key):
+            results.append((theme, out_path, None, time.perf_counter() - t0))
+            continue
+        out_path, count = backend.render(deck, out_path)
+        build_cache.record(out_path, key, deck)
+        results.append((theme, out_path, count, time.perf_counter() - t0))
+    build_cache.save()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--force", action="store_true", help="ignoruj cache, buduj wszystko")
+    args = parser.parse_args()
+    for theme, out_path, count, elapsed in build_all(force=args.force):
+        status = "bez zmian" if count is None else f"{count:3d} slajdów"
+        print(f"{theme:10s} {status:12s} {elapsed:6.2f}s  {out_path}")
+    for o in fit.drain():
+        if o.action == fit.OVERFLOW:
+            print("UWAGA: " + o.describe(), file=sys.stderr)
@@ -1,87 +1,167 @@
 #!/usr/bin/env python3
 """
-Generuje prezentacje Trening Wechowy w formacie PDF - styl Aromagic.
-Kazdy slajd to osobna strona A4 landscape.
+Generuje prezentacje w formacie PDF - styl Aromagic.
+Kazdy slajd to osobna strona A4 landscape. Tresc pochodzi z modelu deck.Deck
+(np. slides.py), ten modul odpowiada tylko za rysowanie. Kolory, marginesy,
+logo i czcionki sa w motywy/aromagic.json (narzedzia/themes.py).
+Kazdy slajd jest rysowany do osobnego pliku w .build-cache/pages/ i trafia
+tam ponownie tylko po zmianie; PDF jest skladany z tych stron
+(narzedzia/pdfpages.py), podobnie jak materialy do druku (2/4/6 slajdow na
+stronie A4 z liniami na notatki) i dzienniczek postepow.
+
+    python3 build_pdf_aromagic.py                  # slides.py
+    python3 build_pdf_aromagic.py --handout 4      # materialy, 4 slajdy na stronie
+    python3 build_pdf_aromagic.py --diary 28       # dzienniczek na 28 dni
+    python3 build_pdf_aromagic.py "Domowa Instrukcja Treningu Węchowego.md" --diary
 """
 
+import reportlab
+from reportlab import rl_config
 from reportlab.lib.pagesizes import landscape, A4
 from reportlab.lib.colors import HexColor
 from reportlab.lib.units import cm, mm
 from reportlab.pdfgen import canvas
 from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.lib.enums import TA_LEFT, TA_CENTER
 from reportlab.platypus import Paragraph, Table, TableStyle
 from reportlab.lib.styles import ParagraphStyle
+import argparse
+import functools
+import math
 import os
+import sys
+import warnings
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, "narzedzia"))
+
+import cache
+import deck as dk
+import fit
+import fonts
+import pdfpages
+import themes
+
+THEME = themes.load("Aromagic")
+
+# Every page is a document of its own (see PAGE CACHE), so images are
+# encoded once per page; skip ReportLab's pure-Python ASCII85 pass, which
+# only makes the (deflated) data printable.
+rl_config.useA85 = 0
 
 # === COLORS ===
-PURPLE = HexColor("#7E57C2")
-PURPLE_SOFT = HexColor("#F3EEFA")
-PURPLE_DARK = HexColor("#5E35B1")
-GREEN = HexColor("#4CAF50")
-GREEN_SOFT = HexColor("#E8F5E9")
-TEXT = HexColor("#111827")
-TEXT_SEC = HexColor("#6B7280")
-TEXT_MUTED = HexColor("#9CA3AF")
-BG = HexColor("#FFFFFF")
-BG_SOFT = HexColor("#F9FAFB")
-BORDER = HexColor("#E5E7EB")
+_C = {name: HexColor(value) for name, value in THEME.colors.items()}
+PURPLE = _C["purple"]
+PURPLE_SOFT = _C["purple_soft"]
+PURPLE_DARK = _C["purple_dark"]
+GREEN = _C["green"]
+GREEN_SOFT = _C["green_soft"]
+TEXT = _C["text"]
+TEXT_SEC = _C["text_sec"]
+TEXT_MUTED = _C["text_muted"]
+BG = _C["bg"]
+BG_SOFT = _C["bg_soft"]
+BORDER = _C["border"]
 
 # === PAGE ===
 W, H = landscape(A4)
-MARGIN = 40
+MARGIN = THEME.page.margin
 CONTENT_W = W - 2 * MARGIN
 
 # === OUTPUT ===
 OUTDIR = os.path.dirname(os.path.abspath(__file__))
-OUTFILE = os.path.join(OUTDIR, "Trening W\u0119chowy \u2014 Prezentacja \u2014 Aromagic.pdf")
-LOGO_PATH = os.path.join(OUTDIR, "aromagic_logo.png")
+SUFFIX = THEME.suffix
+EXT = "pdf"
+LOGO_PATH = os.path.join(OUTDIR, THEME.logo)
 
 # Polish quotes
 LQ = "\u201E"  # opening lower
 RQ = "\u201D"  # closing upper
 
 
+# === FONTS ===
+# The theme lists families in order of preference, each as role -> (font
+# name, file names). The first family whose files are all found (see
+# narzedzia/fonts.py) is used; Inter comes as static TTFs from the Inter
+# release or from distro packages, DejaVu Sans is on most Linux hosts and
+# covers Polish. The fallback is the built-in Type 1 fonts: no Polish
+# diacritics beyond ó.
+FONT_FAMILIES = THEME.fonts
+FALLBACK_FONTS = THEME.fallback_fonts
+
+
+def resolve_fonts():
+    """(role -> font name, font name -> path) of the first complete family.
+
+    Only looks files up; parsing is deferred to register_fonts().
+    """
+    for family in FONT_FAMILIES:
+        paths = fonts.resolve(dict(family.values()))
+        if paths:
+            return {role: name for role, (name, _) in family.items()}, paths
+    return dict(FALLBACK_FONTS), {}
+
+
+_ROLES, FONT_PATHS = resolve_fonts()
+FONT = _ROLES["regular"]
+FONT_BOLD = _ROLES["bold"]
+FONT_SEMI = _ROLES["semi"]
+FONT_MED = _ROLES["medium"]
+
+# Every page starts its font subsets with these characters, in this order,
+# so pages drawn into separate files (see PAGE CACHE) embed byte-identical
+# fonts that the assembled PDF stores once. Other characters still work;
+# they only add a subset to the pages that use them.
+GLYPHS = "".join(map(chr, range(32, 127))) + "ĄĆĘŁŃÓŚŹŻąćęłńóśźż„”“‘’–—…•·×→°"
+
+# Files the output depends on (see cache.artifact_key).
+ASSETS = [LOGO_PATH] + sorted(set(FONT_PATHS.values()))
+
+
 def register_fonts():
-    font_dir = os.path.expanduser("~/Library/Fonts")
-    inter_files = {
-        "Inter": "Inter_24pt-Regular.ttf",
-        "Inter-Bold": "Inter_28pt-Bold.ttf",
-        "Inter-SemiBold": "Inter_24pt-SemiBold.ttf",
-        "Inter-Medium": "Inter_24pt-Medium.ttf",
-    }
-    found = False
-    for name, filename in inter_files.items():
-        path = os.path.join(font_dir, filename)
-        if os.path.exists(path):
-            pdfmetrics.registerFont(TTFont(name, path))
-            found = True
-    if not found:
-        for base in ["/System/Library/Fonts", "/Library/Fonts"]:
-            for name, filename in inter_files.items():
-                path = os.path.join(base, filename)
-                if os.path.exists(path):
-                    pdfmetrics.registerFont(TTFont(name, path))
-                    found = True
-    return found
-
-
-HAS_INTER = register_fonts()
-FONT = "Inter" if HAS_INTER else "Helvetica"
-FONT_BOLD = "Inter-Bold" if HAS_INTER else "Helvetica-Bold"
-FONT_SEMI = "Inter-SemiBold" if HAS_INTER else "Helvetica-Bold"
-FONT_MED = "Inter-Medium" if HAS_INTER else "Helvetica"
+    """Register the resolved family with ReportLab; called before drawing."""
+    if FONT_PATHS:
+        fonts.register(FONT_PATHS)
+    else:
+        warnings.warn("Nie znaleziono Inter ani DejaVu Sans (ustaw BUILD_FONT_PATH); "
+                      "Helvetica nie ma polskich znaków.", stacklevel=2)
+
 
 # Bottom margin for content
 BOTTOM = MARGIN
 
+# === LAYOUT CACHE ===
+# Styles are shared per (font, size, color, leading) and wrapped paragraphs
+# per (text, style, width): measuring and drawing the same text, or
+# rendering several decks in one process, wraps it only once. A wrapped
+# Paragraph can be drawn any number of times with drawOn().
+WRAP_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=None)
+def paragraph_style(font, size, color=TEXT_SEC, leading=1.5):
+    return ParagraphStyle("%s-%g" % (font, size), fontName=font, fontSize=size,
+                          textColor=color, leading=size * leading)
+
+
+@functools.lru_cache(maxsize=WRAP_CACHE_SIZE)
+def wrap_paragraph(text, style, width):
+    """(Paragraph, height) of text wrapped to width.
+
+    A paragraph's height does not depend on the available height, so that
+    is not part of the key.
+    """
+    p = Paragraph(text, style)
+    return p, p.wrap(width, H)[1]
+
 
 class SlideBuilder:
-    def __init__(self):
-        self.c = canvas.Canvas(OUTFILE, pagesize=landscape(A4))
-        self.c.setTitle("Trening W\u0119chowy \u2014 Aromagic")
+    def __init__(self, outfile, title):
+        register_fonts()
+        self.c = canvas.Canvas(outfile, pagesize=landscape(A4))
+        self.c.setTitle(title + SUFFIX)
         self.slide_num = 0
+        for name in FONT_PATHS:
+            pdfmetrics.getFont(name).splitString(GLYPHS, self.c._doc)
 
     def new_slide(self, bg_color=BG):
         if self.slide_num > 0:
@@ -119,9 +199,7 @@ class SlideBuilder:
     def draw_sub(self, text, y, size=14, color=TEXT_SEC, max_width=None):
         if max_width is None:
             max_width = CONTENT_W
-        style = ParagraphStyle("sub", fontName=FONT, fontSize=size, textColor=color, leading=size * 1.5)
-        p = Paragraph(text, style)
-        pw, ph = p.wrap(max_width, 200)
+        p, ph = wrap_paragraph(text, paragraph_style(FONT, size, color), max_width)
         p.drawOn(self.c, MARGIN, y - ph)
         return y - ph - 6
 
@@ -130,9 +208,7 @@ class SlideBuilder:
             x = MARGIN
         if max_width is None:
             max_width = CONTENT_W
-        style = ParagraphStyle("body", fontName=FONT, fontSize=size, textColor=color, leading=size * 1.5)
-        p = Paragraph(text, style)
-        pw, ph = p.wrap(max_width, 300)
+        p, ph = wrap_paragraph(text, paragraph_style(FONT, size, color), max_width)
         p.drawOn(self.c, x, y - ph)
         return y - ph - 4
 
@@ -154,18 +230,14 @@ class SlideBuilder:
             self.c.drawString(inner_x, cy, title)
             cy -= 24
         if body:
-            style = ParagraphStyle("cb", fontName=FONT, fontSize=body_size, textColor=TEXT_SEC, leading=body_size * 1.5)
-            p = Paragraph(body, style)
-            pw, ph = p.wrap(inner_w, 200)
+            p, ph = wrap_paragraph(body, paragraph_style(FONT, body_size, TEXT_SEC), inner_w)
             p.drawOn(self.c, inner_x, cy - ph)
         return y - h - 10
 
     def draw_accent_box(self, text, y, bg=PURPLE_SOFT, text_color=TEXT, max_width=None, font_size=12):
         if max_width is None:
             max_width = CONTENT_W
-        style = ParagraphStyle("ab", fontName=FONT, fontSize=font_size, textColor=text_color, leading=font_size * 1.5)
-        p = Paragraph(text, style)
-        pw, ph = p.wrap(max_width - 36, 200)
+        p, ph = wrap_paragraph(text, paragraph_style(FONT, font_size, text_color), max_width - 36)
         box_h = ph + 24
         self.c.setFillColor(bg)
         self.c.roundRect(MARGIN, y - box_h, max_width, box_h, 8, fill=1, stroke=0)
@@ -173,9 +245,7 @@ class SlideBuilder:
         return y - box_h - 10
 
     def draw_blockquote(self, text, cite, y, font_size=13):
-        style = ParagraphStyle("bq", fontName=FONT, fontSize=font_size, textColor=TEXT, leading=font_size * 1.6)
-        p = Paragraph("<i>" + text + "</i>", style)
-        pw, ph = p.wrap(CONTENT_W - 50, 200)
+        p, ph = wrap_paragraph("<i>" + text + "</i>", paragraph_style(FONT, font_size, TEXT, 1.6), CONTENT_W - 50)
         box_h = ph + 36
         self.c.setFillColor(PURPLE_SOFT)
         self.c.roundRect(MARGIN, y - box_h, CONTENT_W, box_h, 8, fill=1, stroke=0)
@@ -187,33 +257,10 @@ class SlideBuilder:
         self.c.drawRightString(MARGIN + CONTENT_W - 18, y - box_h + 8, cite)
         return y - box_h - 10
 
-    def draw_table(self, headers, rows, y, col_widths=None, font_size=11):
-        if col_widths is None:
-            col_widths = [CONTENT_W / len(headers)] * len(headers)
-        data = [headers] + rows
-        style_cmds = [
-            ("FONTNAME", (0, 0), (-1, 0), FONT_SEMI),
-            ("FONTSIZE", (0, 0), (-1, 0), font_size),
-            ("FONTNAME", (0, 1), (-1, -1), FONT),
-            ("FONTSIZE", (0, 1), (-1, -1), font_size),
-            ("TEXTCOLOR", (0, 0), (-1, 0), TEXT),
-            ("TEXTCOLOR", (0, 1), (-1, -1), TEXT_SEC),
-            ("BACKGROUND", (0, 0), (-1, 0), BG_SOFT),
-            ("BACKGROUND", (0, 1), (-1, -1), BG),
-            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-            ("TOPPADDING", (0, 0), (-1, -1), 8),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
-            ("LEFTPADDING", (0, 0), (-1, -1), 12),
-            ("RIGHTPADDING", (0, 0), (-1, -1), 12),
-            ("LINEBELOW", (0, 0), (-1, -2), 0.5, BORDER),
-            ("ROUNDEDCORNERS", [8, 8, 8, 8]),
-            ("BOX", (0, 0), (-1, -1), 0.5, BORDER),
-        ]
-        t = Table(data, colWidths=col_widths)
-        t.setStyle(TableStyle(style_cmds))
-        tw, th = t.wrap(CONTENT_W, 300)
-        t.drawOn(self.c, MARGIN, y - th)
+    def draw_table(self, table, y):
+        """Draw a Table flowable from make_table(), already wrapped."""
+        th = table.wrap(CONTENT_W, H)[1]
+        table.drawOn(self.c, MARGIN, y - th)
         return y - th - 10
 
     def draw_checklist(self, items, y, font_size=14):
@@ -224,22 +271,18 @@ class SlideBuilder:
             self.c.setFont(FONT_BOLD, 11)
             self.c.setFillColor(PURPLE)
             self.c.drawString(x + 3, y - 8, "\u2713")
-            style = ParagraphStyle("cl", fontName=FONT, fontSize=font_size, textColor=TEXT_SEC, leading=font_size * 1.5)
-            p = Paragraph(item, style)
-            pw, ph = p.wrap(CONTENT_W - 34, 60)
+            p, ph = wrap_paragraph(item, paragraph_style(FONT, font_size, TEXT_SEC), CONTENT_W - 34)
             p.drawOn(self.c, x + 26, y - ph + 2)
             y -= max(ph, 20) + 8
         return y
 
-    def draw_ordered_list(self, items, y, font_size=14):
+    def draw_ordered_list(self, items, y, font_size=14, start=1):
         x = MARGIN
-        for i, item in enumerate(items, 1):
+        for i, item in enumerate(items, start):
             self.c.setFont(FONT_BOLD, 13)
             self.c.setFillColor(PURPLE)
             self.c.drawString(x, y - 2, str(i) + ".")
-            style = ParagraphStyle("ol", fontName=FONT, fontSize=font_size, textColor=TEXT_SEC, leading=font_size * 1.5)
-            p = Paragraph(item, style)
-            pw, ph = p.wrap(CONTENT_W - 34, 60)
+            p, ph = wrap_paragraph(item, paragraph_style(FONT, font_size, TEXT_SEC), CONTENT_W - 34)
             p.drawOn(self.c, x + 26, y - ph + 2)
             y -= max(ph, 20) + 8
         return y
@@ -257,283 +300,440 @@ class SlideBuilder:
         self.c.drawCentredString(x + w / 2, y - num_size - 34, label)
         return y - h - 10
 
+    def draw_bullets(self, items, y, font_size=14):
+        x = MARGIN
+        for item in items:
+            self.c.setFillColor(PURPLE)
+            self.c.circle(x + 6, y - 4, 3, fill=1, stroke=0)
+            p, ph = wrap_paragraph(item, paragraph_style(FONT, font_size, TEXT_SEC), CONTENT_W - 34)
+            p.drawOn(self.c, x + 26, y - ph + 2)
+            y -= max(ph, 20) + 8
+        return y
+
+    def draw_heading(self, text, y, size=16):
+        self.c.setFont(FONT_SEMI, size)
+        self.c.setFillColor(TEXT)
+        self.c.drawString(MARGIN, y - size, text)
+        return y - size - 12
+
     def save(self):
         self.c.save()
 
 
-def build():
-    s = SlideBuilder()
-
-    # SLIDE 1: Tytul
+# === DECK RENDERING ===
+
+CARD_GAP = THEME.page.card_gap
+STAT_W = THEME.page.stat_w
+STAT_H = THEME.page.stat_h
+
+
+def _paragraph_height(text, width, size, leading=1.5):
+    return wrap_paragraph(text, paragraph_style(FONT, size, TEXT_SEC, leading), width)[1]
+
+
+def _list_height(items, size=14):
+    return sum(max(_paragraph_height(i, CONTENT_W - 34, size), 20) + 8 for i in items)
+
+
+def block_height(block):
+    """Vertical space a non-card block takes, mirroring the draw_* methods."""
+    if isinstance(block, dk.Lead):
+        return _paragraph_height(block.text, CONTENT_W, 14) + (14 if block.emphasis else 12)
+    if isinstance(block, dk.Paragraph):
+        return _paragraph_height(block.text, CONTENT_W, 13) + 4
+    if isinstance(block, dk.Heading):
+        return 28
+    if isinstance(block, dk.Callout):
+        return _paragraph_height(block.text, CONTENT_W - 36, 12) + 34
+    if isinstance(block, dk.Quote):
+        return _paragraph_height(block.text, CONTENT_W - 50, 14, 1.6) + 52
+    if isinstance(block, dk.Table):
+        return sum(table_row_heights(block)) + 10
+    if isinstance(block, dk.Stats):
+        return STAT_H + 14
+    if isinstance(block, (dk.Bullets, dk.Steps, dk.Checklist)):
+        return _list_height(block.items) + 6
+    return 0
+
+
+def _card_rows(block):
+    return math.ceil(len(block.cards) / block.columns)
+
+
+def _table_widths(block):
+    if block.widths:
+        return [CONTENT_W * f for f in block.widths]
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def table_style(font_size):
+    """One TableStyle per font size, shared by every table drawn at it."""
+    return TableStyle([
+        ("FONTNAME", (0, 0), (-1, 0), FONT_SEMI),
+        ("FONTSIZE", (0, 0), (-1, 0), font_size),
+        ("FONTNAME", (0, 1), (-1, -1), FONT),
+        ("FONTSIZE", (0, 1), (-1, -1), font_size),
+        ("TEXTCOLOR", (0, 0), (-1, 0), TEXT),
+        ("TEXTCOLOR", (0, 1), (-1, -1), TEXT_SEC),
+        ("BACKGROUND", (0, 0), (-1, 0), BG_SOFT),
+        ("BACKGROUND", (0, 1), (-1, -1), BG),
+        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        ("TOPPADDING", (0, 0), (-1, -1), 8),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
+        ("LEFTPADDING", (0, 0), (-1, -1), 12),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 12),
+        ("LINEBELOW", (0, 0), (-1, -2), 0.5, BORDER),
+        ("ROUNDEDCORNERS", [8, 8, 8, 8]),
+        ("BOX", (0, 0), (-1, -1), 0.5, BORDER),
+    ])
+
+
+def make_table(headers, rows, col_widths=None, font_size=12):
+    """Table flowable for a header row and a row matrix (any sequence of rows)."""
+    if col_widths is None:
+        col_widths = [CONTENT_W / len(headers)] * len(headers)
+    data = [list(headers)]
+    data.extend(map(list, rows))
+    return Table(data, colWidths=col_widths, style=table_style(font_size))
+
+
+# Table blocks are measured for card stretching and pagination, then drawn:
+# the wrapped flowable is built once per block.
+@functools.lru_cache(maxsize=64)
+def block_table(block):
+    t = make_table(block.headers, block.rows, _table_widths(block))
+    t.wrap(CONTENT_W, H)
+    return t
+
+
+def table_row_heights(block):
+    # _rowHeights is what Table.split() itself uses after wrap().
+    return block_table(block)._rowHeights
+
+
+TONE_COLORS = {"accent": PURPLE, "success": GREEN}
+
+
+def draw_cards(s, block, y, card_h):
+    card_w = (CONTENT_W - CARD_GAP * (block.columns - 1)) / block.columns
+    for i, card in enumerate(block.cards):
+        col = i % block.columns
+        row = i // block.columns
+        cx = MARGIN + col * (card_w + CARD_GAP)
+        cy = y - row * (card_h + CARD_GAP)
+        s.draw_card(cx, cy, card_w, card_h, card.title, card.body,
+                    accent_color=TONE_COLORS.get(card.tone))
+    return y - _card_rows(block) * (card_h + CARD_GAP)
+
+
+def draw_block(s, block, y):
+    if isinstance(block, dk.Lead):
+        if block.emphasis:
+            text = "<b><font color='" + PURPLE.hexval().replace("0x", "#") + "'>" + block.text + "</font></b>"
+            return s.draw_body(text, y, size=14) - 10
+        return s.draw_sub(block.text, y) - 6
+    if isinstance(block, dk.Paragraph):
+        return s.draw_body(block.text, y)
+    if isinstance(block, dk.Heading):
+        return s.draw_heading(block.text, y)
+    if isinstance(block, dk.Callout):
+        bg = GREEN_SOFT if block.tone == "success" else PURPLE_SOFT
+        return s.draw_accent_box(block.text, y, bg=bg, font_size=12)
+    if isinstance(block, dk.Quote):
+        return s.draw_blockquote(block.text, block.cite, y, font_size=14) - 6
+    if isinstance(block, dk.Table):
+        return s.draw_table(block_table(block), y) - 4
+    if isinstance(block, dk.Stats):
+        n = len(block.items)
+        sx = MARGIN + (CONTENT_W - n * STAT_W - (n - 1) * 20) / 2
+        for i, (number, label) in enumerate(block.items):
+            s.draw_stat_card(sx + i * (STAT_W + 20), y, STAT_W, STAT_H, number, label, num_size=40)
+        return y - STAT_H - 14
+    if isinstance(block, dk.Steps):
+        return s.draw_ordered_list(list(block.items), y, start=block.start) - 8
+    if isinstance(block, dk.Checklist):
+        return s.draw_checklist(list(block.items), y) - 8
+    if isinstance(block, dk.Bullets):
+        return s.draw_bullets(list(block.items), y) - 8
+    raise TypeError("Nieobslugiwany blok: " + type(block).__name__)
+
+
+def draw_cover(s, deck):
     s.new_slide()
     y = s.draw_logo(H - MARGIN)
-    y = s.draw_pill("Aromapsychologia", MARGIN, y)
+    if deck.label:
+        y = s.draw_pill(deck.label, MARGIN, y)
     y -= 20
-    s.c.setFont(FONT_BOLD, 42)
+    title_size = fit_title(deck.title, 42, deck, s.slide_num)
+    s.c.setFont(FONT_BOLD, title_size)
     s.c.setFillColor(PURPLE)
-    s.c.drawString(MARGIN, y, "Trening w\u0119chowy")
-    y -= 50
-    s.c.setFont(FONT_BOLD, 42)
-    s.c.setFillColor(TEXT)
-    s.c.drawString(MARGIN, y, "w warunkach domowych")
+    s.c.drawString(MARGIN, y, deck.title)
     y -= 50
+    if deck.subtitle:
+        s.c.setFont(FONT_BOLD, fit_title(deck.subtitle, 42, deck, s.slide_num))
+        s.c.setFillColor(TEXT)
+        s.c.drawString(MARGIN, y, deck.subtitle)
+        y -= 50
     s.c.setFont(FONT, 14)
     s.c.setFillColor(TEXT_SEC)
-    s.c.drawString(MARGIN, y, "Opracowanie: Emilia Chodorowska")
+    s.c.drawString(MARGIN, y, deck.author)
     y -= 22
     s.c.setFont(FONT, 12)
     s.c.setFillColor(TEXT_MUTED)
-    s.c.drawString(MARGIN, y, "na podstawie kursu Aromapsychologia Anny Bober")
+    s.c.drawString(MARGIN, y, deck.credit)
 
-    # SLIDE 2: Dlaczego nos zamilkl
-    s.new_slide(BG_SOFT)
-    y = s.draw_logo()
-    y = s.draw_pill("1 \u00b7 Wst\u0119p", MARGIN, y)
-    y = s.draw_title("Dlaczego Tw\u00f3j nos " + LQ + "zamilk\u0142" + RQ + "?", y, size=28)
-    y = s.draw_sub("Utrata w\u0119chu w COVID-19 to zjawisko inne ni\u017c zatkany nos przy grypie.", y)
-    y -= 6
-    card_w = (CONTENT_W - 14) / 2
-    avail = y - BOTTOM
-    card_top_h = int(avail * 0.48)
-    card_bot_h = int(avail * 0.42)
-    s.draw_card(MARGIN, y, card_w, card_top_h, "Grypa",
-                "Obrz\u0119k tkanek fizycznie blokuje dost\u0119p aromat\u00f3w do nab\u0142onka w\u0119chowego. Nos jest zatkany \u2014 powietrze nie przechodzi.")
-    s.draw_card(MARGIN + card_w + 14, y, card_w, card_top_h, "COVID-19",
-                "Dro\u017cne przewody nosowe, ale wirus atakuje <b>kom\u00f3rki podporowe</b> i <b>gruczo\u0142y Bowmana</b>. Zapach nie dociera mimo wolnych dr\u00f3g oddechowych.")
-    y -= card_top_h + 12
-    s.draw_card(MARGIN, y, CONTENT_W, card_bot_h, None,
-                "Neurony trac\u0105 " + LQ + "system podtrzymywania \u017cycia" + RQ + " \u2014 jak sprawne odbiorniki, kt\u00f3rym odci\u0119to zasilanie. Brak stymulacji prowadzi do <b>atrofii opuszki w\u0119chowej</b> i zmian w hipokampie, co wp\u0142ywa na pami\u0119\u0107 i emocje.")
-
-    # SLIDE 3: Dlaczego to minie
-    s.new_slide()
-    y = s.draw_logo()
-    y = s.draw_pill("1 \u00b7 Wst\u0119p", MARGIN, y)
-    y = s.draw_title("Dlaczego to minie?", y, size=28)
-    y = s.draw_body("<b><font color='#7E57C2'>Neurony w\u0119chowe maj\u0105 unikaln\u0105 zdolno\u015b\u0107 do regeneracji \u2014 jako jedyne w organizmie odnawiaj\u0105 si\u0119 przez ca\u0142e \u017cycie.</font></b>", y, size=14)
-    y -= 10
-    y = s.draw_blockquote(
-        LQ + "Systematyczny trening w\u0119chowy wykazuje skuteczno\u015b\u0107 por\u00f3wnywaln\u0105 z terapi\u0105 sterydow\u0105. Regularna stymulacja zwi\u0119ksza obj\u0119to\u015b\u0107 istoty szarej w m\u00f3zgu. Tw\u00f3j m\u00f3zg jest plastyczny \u2014 trening to proces jego fizycznej odbudowy." + RQ,
-        "\u2014 metaanalizy prof. Thomasa Hummela",
-        y, font_size=14
-    )
-    y -= 6
-    s.draw_accent_box(
-        "\U0001f4a1 <b>Kluczowy wniosek:</b> Trening w\u0119chowy to nie " + LQ + "alternatywna medycyna" + RQ + " \u2014 to metoda poparta setkami bada\u0144 naukowych, w tym badaniami obrazowania m\u00f3zgu (fMRI/MRI).",
-        y, font_size=12
-    )
-
-    # SLIDE 4: Co przygotowac
-    s.new_slide(BG_SOFT)
-    y = s.draw_logo()
-    y = s.draw_pill("2 \u00b7 Warsztat zapachowy", MARGIN, y)
-    y = s.draw_title("Co przygotowa\u0107?", y, size=28)
-    y = s.draw_sub("Potrzebujemy stworzy\u0107 <b>headspace</b> \u2014 nasycon\u0105 cz\u0105steczkami przestrze\u0144 nad \u017ar\u00f3d\u0142em zapachu.", y)
-    y -= 6
-    cw = (CONTENT_W - 28) / 3
-    avail = y - BOTTOM
-    card_h = int(avail * 0.92)
-    items = [
-        ("S\u0142oiczki z ciemnego szk\u0142a", "15\u201330 ml pojemno\u015bci. Chroni\u0105 olejki przed \u015bwiat\u0142em i koncentruj\u0105 opary wewn\u0105trz. Najlepiej z zakr\u0119tkami \u2014 szczelno\u015b\u0107 jest kluczowa."),
-        ("Papier akwarelowy", "Porowato\u015b\u0107 idealnie trzyma aromat wewn\u0105trz s\u0142oiczka. Wycinamy pasek dopasowany do wielko\u015bci s\u0142oiczka."),
-        ("Olejki eteryczne", "Wy\u0142\u0105cznie naturalne koncentraty wysokiej jako\u015bci. Syntetyczne odpowiedniki nie aktywuj\u0105 w\u0142a\u015bciwych receptor\u00f3w."),
-    ]
-    for i, (title, body) in enumerate(items):
-        s.draw_card(MARGIN + i * (cw + 14), y, cw, card_h, title, body)
-
-    # SLIDE 5: Przygotowanie sloiczka
-    s.new_slide()
-    y = s.draw_logo()
-    y = s.draw_pill("2 \u00b7 Warsztat zapachowy", MARGIN, y)
-    y = s.draw_title("Jak przygotowa\u0107 s\u0142oiczek?", y, size=28)
-    y -= 6
-    y = s.draw_ordered_list([
-        "W\u0142\u00f3\u017c do s\u0142oiczka pasek papieru akwarelowego",
-        "Nas\u0105cz go <b>4\u20138 kroplami</b> wybranego olejku eterycznego",
-        "Szczelnie zakr\u0119\u0107 i odczekaj <b>minimum godzin\u0119</b> na nasycenie",
-        "<b>Co tydzie\u0144</b> wymieniaj papier i dolewaj \u015bwie\u017cego olejku",
-        "Popro\u015b kogo\u015b ze sprawnym w\u0119chem o <b>weryfikacj\u0119 intensywno\u015bci</b>",
-    ], y)
-    y -= 8
-    s.draw_accent_box(
-        "\U0001f4a1 <b>Cytrusy szybko oksyduj\u0105</b> \u2014 myj s\u0142oiczki po nich dok\u0142adnie myd\u0142em, poniewa\u017c utlenione olejki trac\u0105 w\u0142a\u015bciwo\u015bci terapeutyczne i mog\u0105 podra\u017cnia\u0107 sk\u00f3r\u0119.",
-        y, font_size=12
-    )
-
-    # SLIDE 6: Jakie zapachy wybrac
-    s.new_slide(BG_SOFT)
-    y = s.draw_logo()
-    y = s.draw_pill("3 \u00b7 Wyb\u00f3r zapach\u00f3w", MARGIN, y)
-    y = s.draw_title("Jakie zapachy wybra\u0107?", y, size=28)
-    y -= 6
-    y = s.draw_table(
-        ["Grupa zapachowa", "Zamienniki", "Dlaczego?"],
-        [
-            ["Kwiatowa (R\u00f3\u017ca)", "Geranium, ylang-ylang", "Pobudza subtelne receptory"],
-            ["Owocowa (Cytryna)", "Pomara\u0144cza, grejpfrut", "Wysoka intensywno\u015b\u0107"],
-            ["Korzenna (Go\u017adziki)", "Cynamon, wanilia", "Zakotwiczenie w pami\u0119ci"],
-            ["\u017bywicza (Eukaliptus)", "Mi\u0119ta, rozmaryn", "Nerw tr\u00f3jdzielny (ch\u0142\u00f3d)"],
-        ],
-        y,
-        col_widths=[CONTENT_W * 0.35, CONTENT_W * 0.35, CONTENT_W * 0.30],
-        font_size=12,
-    )
-    y -= 4
-    s.draw_accent_box(
-        "\U0001f9e0 <b>Pami\u0119\u0107 w\u0119chowa:</b> Wybieraj aromaty budz\u0105ce silne wspomnienia \u2014 emocjonalny \u015blad u\u0142atwia regeneracj\u0119 po\u0142\u0105cze\u0144 synaptycznych. Im silniejsze skojarzenie, tym lepszy efekt terapeutyczny.",
-        y, font_size=12
-    )
-
-    # SLIDE 7: Technika malych wdechow
-    s.new_slide()
-    y = s.draw_logo()
-    y = s.draw_pill("4 \u00b7 Technika oddechowa", MARGIN, y)
-    y = s.draw_title("Technika " + LQ + "ma\u0142ych wdech\u00f3w" + RQ, y, size=28)
-    y = s.draw_sub("<b>G\u0142\u0119boki wdech omija nab\u0142onek w\u0119chowy</b> \u2014 kieruje powietrze prosto do p\u0142uc, zamiast do pola w\u0119chowego.", y)
-    y -= 8
-    card_w = (CONTENT_W - 14) / 2
-    avail = y - BOTTOM
-    card_h = int(avail * 0.92)
-    s.draw_card(MARGIN, y, card_w, card_h, "Prawid\u0142owa technika",
-                "Kr\u00f3tkie, ma\u0142e wdechy \u2014 jak pies na spacerze. Tworzysz <b>zawirowania powietrza</b>, kt\u00f3re kieruj\u0105 headspace bezpo\u015brednio na pole w\u0119chowe w g\u00f3rnej cz\u0119\u015bci jamy nosowej.",
-                accent_color=PURPLE)
-    s.draw_card(MARGIN + card_w + 14, y, card_w, card_h, "B\u0142\u0105d do unikania",
-                "G\u0142\u0119boki, d\u0142ugi wdech nosem \u2014 powietrze omija nab\u0142onek w\u0119chowy i trafia wprost do p\u0142uc. <b>Nie stymuluje receptor\u00f3w</b> i nie przynosi efektu terapeutycznego.")
-
-    # SLIDE 8: Sesja treningowa
-    s.new_slide(BG_SOFT)
-    y = s.draw_logo()
-    y = s.draw_pill("4 \u00b7 Sesja treningowa", MARGIN, y)
-    y = s.draw_title("Jak wygl\u0105da sesja treningowa?", y, size=28)
-    y -= 6
-    y = s.draw_checklist([
-        "Wybierz spokojne miejsce, wycisz telefon",
-        "Otw\u00f3rz s\u0142oiczek i zbli\u017c go do nosa (ok. 2\u20133 cm)",
-        "<b>20 sekund</b> w\u0105chania technik\u0105 ma\u0142ych wdech\u00f3w",
-        "Zamknij s\u0142oiczek \u2014 <b>10\u201315 sekund przerwy</b> mi\u0119dzy zapachami",
-        "Przejd\u017a do kolejnego zapachu (4 zapachy = 1 sesja)",
-        "Powtarzaj <b>2\u00d7 dziennie: rano i wieczorem</b>",
-    ], y, font_size=14)
-
-    # SLIDE 9: Wachaj wyobraznia
-    s.new_slide()
-    y = s.draw_logo()
-    y = s.draw_pill("5 \u00b7 Praca mentalna", MARGIN, y)
-    y = s.draw_title("W\u0105chaj wyobra\u017ani\u0105", y, size=28)
-    y = s.draw_sub("Trening w\u0119chowy to w po\u0142owie praca umys\u0142u. Kora w\u0119chowa wykazuje aktywno\u015b\u0107 nawet przy braku fizycznego bod\u017aca.", y)
-    y -= 8
-    card_w = (CONTENT_W - 14) / 2
-    avail = y - BOTTOM
-    card_h = int(avail * 0.92)
-    s.draw_card(MARGIN, y, card_w, card_h, "Wizualizacja",
-                "<b>Zamknij oczy</b> i przywo\u0142aj obraz obiektu \u2014 kolor cytryny, porowato\u015b\u0107 sk\u00f3rki, kwa\u015bny smak na j\u0119zyku, ch\u0142\u00f3d z lod\u00f3wki. Anga\u017cuj <b>wszystkie zmys\u0142y</b> naraz.")
-    s.draw_card(MARGIN + card_w + 14, y, card_w, card_h, "Wsparcie wizualne",
-                "Patrz na <b>zdj\u0119cia</b> w\u0105chanych obiekt\u00f3w podczas sesji. Medytacja sensoryczna zapobiega degradacji neuron\u00f3w i <b>wzmacnia \u015bcie\u017cki pami\u0119ciowe</b>.")
-
-    # SLIDE 10: Jak sledzic postepy
-    s.new_slide(BG_SOFT)
-    y = s.draw_logo()
-    y = s.draw_pill("6 \u00b7 Dzienniczek post\u0119p\u00f3w", MARGIN, y)
-    y = s.draw_title("Jak \u015bledzi\u0107 post\u0119py?", y, size=28)
-    y -= 6
-    stat_w = 240
-    stat_h = 90
-    sx = MARGIN + (CONTENT_W - 2 * stat_w - 20) / 2
-    s.draw_stat_card(sx, y, stat_w, stat_h, "4 mies.", "Pierwsze efekty", num_size=40)
-    s.draw_stat_card(sx + stat_w + 20, y, stat_w, stat_h, "14\u201324", "Miesi\u0105ce rehabilitacji", num_size=40)
-    y -= stat_h + 14
-    y = s.draw_accent_box(
-        "\u2705 <b>Parosmia = dobry znak!</b> Zniekszta\u0142cone zapachy (np. zapach gumy zamiast kawy) to dow\u00f3d, \u017ce neurony nawi\u0105zuj\u0105 nowe po\u0142\u0105czenia synaptyczne.",
-        y, bg=GREEN_SOFT, font_size=12
-    )
-    y -= 4
-    y = s.draw_table(
-        ["Pole", "Wpis"],
-        [
-            ["Data", ".................."],
-            ["Zapach", ".................."],
-            ["Odczucia", "nic / ch\u0142\u00f3d / zniekszta\u0142cony / czysty"],
-            ["Intensywno\u015b\u0107", "0 \u2013 1 \u2013 2 \u2013 3 \u2013 4 \u2013 5"],
-        ],
-        y,
-        col_widths=[CONTENT_W * 0.3, CONTENT_W * 0.7],
-        font_size=11,
-    )
-
-    # SLIDE 11: Nie tylko po wirusie
-    s.new_slide()
-    y = s.draw_logo()
-    y = s.draw_pill("7 \u00b7 Szersze korzy\u015bci", MARGIN, y)
-    y = s.draw_title("Nie tylko po wirusie", y, size=28)
-    y = s.draw_sub("Trening w\u0119chowy przynosi szersze korzy\u015bci dla m\u00f3zgu i zdrowia psychicznego:", y)
-    y -= 6
-    card_w = (CONTENT_W - 14) / 2
-    avail = y - BOTTOM
-    card_h = int((avail - 14) / 2)
-    cards = [
-        ("Funkcje poznawcze", "Udowodniona poprawa pami\u0119ci i koncentracji, szczeg\u00f3lnie u os\u00f3b starszych i po urazach."),
-        ("P\u0142ynno\u015b\u0107 werbalna", "Badania potwierdzaj\u0105 popraw\u0119 p\u0142ynno\u015bci semantycznej i zdolno\u015bci nazywania."),
-        ("Istota szara", "Zwi\u0119kszenie obj\u0119to\u015bci istoty szarej \u2014 odwraca skutki anosmii potwierdzone w MRI."),
-        ("Nastr\u00f3j i emocje", "Poprawa nastroju i redukcja objaw\u00f3w depresji potwierdzona klinicznie."),
-    ]
-    for i, (title, body) in enumerate(cards):
-        col = i % 2
-        row = i // 2
-        cx = MARGIN + col * (card_w + 14)
-        cy = y - row * (card_h + 14)
-        s.draw_card(cx, cy, card_w, card_h, title, body)
-
-    # SLIDE 12: Neuroplastycznosc
-    s.new_slide(BG_SOFT)
-    y = s.draw_logo()
-    y = s.draw_pill("7 \u00b7 Neuroplastyczno\u015b\u0107", MARGIN, y)
-    y = s.draw_title("Jak m\u00f3zg si\u0119 odbudowuje?", y, size=28)
-    y -= 4
-    avail = y - BOTTOM
-    card_h = int((avail - 24) / 3)
-    y = s.draw_card(MARGIN, y, CONTENT_W, card_h, "Istota szara",
-                    "Anosmia powoduje utrat\u0119 istoty szarej w obszarach odpowiedzialnych za w\u0119ch. Systematyczny trening <b>fizycznie zwi\u0119ksza jej obj\u0119to\u015b\u0107</b>, odwracaj\u0105c negatywne skutki utraty powonienia. Potwierdzone w badaniach MRI.",
-                    accent_color=PURPLE)
-    y -= 2
-    y = s.draw_card(MARGIN, y, CONTENT_W, card_h, "\u0141\u0105czno\u015b\u0107 strukturalna",
-                    "D\u0142ugoterminowa ekspozycja na bod\u017ace w\u0119chowe <b>przebudowuje szlaki nerwowe</b>. Nawet nocna ekspozycja (2h/noc przez 6 miesi\u0119cy) poprawia fizyczn\u0105 \u0142\u0105czno\u015b\u0107 mi\u0119dzy uk\u0142adem limbicznym a kor\u0105 m\u00f3zgow\u0105.",
-                    accent_color=PURPLE)
-    y -= 2
-    s.draw_accent_box(
-        "\U0001f9d3 Trening w\u0119chowy to tak\u017ce skuteczny <b>trening umys\u0142u i pami\u0119ci dla senior\u00f3w</b> \u2014 niezale\u017cnie od tego, czy dosz\u0142o do utraty w\u0119chu.",
-        y, font_size=13
-    )
-
-    # SLIDE 13: Zapamietaj te zasady
-    s.new_slide()
-    y = s.draw_logo()
-    y = s.draw_pill("8 \u00b7 Podsumowanie", MARGIN, y)
-    y = s.draw_title("Zapami\u0119taj te zasady", y, size=28)
-    y -= 6
-    card_w = (CONTENT_W - 14) / 2
-    avail = y - BOTTOM
-    top_card_h = int((avail - 24) * 0.38)
-    bot_card_h = int((avail - 24) * 0.28)
-    zasady = [
-        ("1. Systematyczno\u015b\u0107", "2\u00d7 dziennie, codziennie \u2014 rano i wieczorem. To Twoje lekarstwo."),
-        ("2. Technika oddechu", "Kr\u00f3tkie, " + LQ + "w\u0119sz\u0105ce" + RQ + " wdechy jak pies. Nie omijaj receptor\u00f3w."),
-        ("3. Wyobra\u017ania", "M\u00f3zg reaguje na wspomnienie zapachu tak samo intensywnie jak na prawdziwy."),
-        ("4. Stymulacja tr\u00f3jdzielna", "Zawsze mi\u0119ta lub eukaliptus w zestawie \u2014 aktywuj\u0105 nerw tr\u00f3jdzielny."),
-    ]
-    for i, (title, body) in enumerate(zasady):
-        col = i % 2
-        row = i // 2
-        cx = MARGIN + col * (card_w + 14)
-        cy = y - row * (top_card_h + 14)
-        s.draw_card(cx, cy, card_w, top_card_h, title, body, accent_color=PURPLE)
-    y -= 2 * (top_card_h + 14)
-    s.draw_card(MARGIN, y, CONTENT_W, bot_card_h, "5. Czas i cierpliwo\u015b\u0107",
-                "Daj sobie minimum 4 miesi\u0105ce na pierwszy sygna\u0142 powrotu. Pe\u0142na rehabilitacja to 14\u201324 miesi\u0105ce \u2014 ale ka\u017cdy dzie\u0144 treningu przybli\u017ca Ci\u0119 do celu.",
-                accent_color=GREEN)
 
+# === FITTING ===
+
+TITLE_MIN_SCALE = 0.7
+METRICS = fit.Metrics(FONT, FONT_BOLD)
+
+
+def fit_title(text, size, deck=None, slide_num=0):
+    """Largest size up to size at which a one-line title fits CONTENT_W."""
+    fitted, ok = fit.fit_size(METRICS, "<b>" + text + "</b>", size, CONTENT_W, size * 1.2,
+                              int(size * TITLE_MIN_SCALE))
+    if deck is not None and fitted < size:
+        fit.report(deck.name, THEME.name, slide_num, text, fit.SHRINK if ok else fit.OVERFLOW,
+                   "tytuł %d → %d pt" % (size, fitted))
+    return fitted
+
+
+def _card_height(card, card_w, accent):
+    inner_w = card_w - 32 - (6 if accent else 0)
+    body = _paragraph_height(card.body, inner_w, 13) if card.body else 0
+    return 18 + (24 if card.title else 0) + body + 14
+
+
+def min_height(block):
+    """block_height(), and for cards the least height their text needs."""
+    if not isinstance(block, dk.Cards):
+        return block_height(block)
+    card_w = (CONTENT_W - CARD_GAP * (block.columns - 1)) / block.columns
+    cards = block.cards
+    return sum(max(_card_height(c, card_w, c.tone in TONE_COLORS) for c in cards[i:i + block.columns])
+               + CARD_GAP for i in range(0, len(cards), block.columns))
+
+
+def split_block(block, room, at_top):
+    if isinstance(block, dk.Table):
+        head, tail = dk.split_table(block, table_row_heights(block), room - 10, at_top)
+        return (head, tail) if head and tail else None
+    return fit.split_items(block, room, block_height, at_top)
+
+
+# === SLIDES ===
+
+def start_slide(s, slide, index, deck=None):
+    s.new_slide(BG_SOFT if index % 2 == 0 else BG)
+    y = s.draw_logo()
+    y = s.draw_pill(slide.section, MARGIN, y)
+    y = s.draw_title(slide.title, y, size=fit_title(slide.title, 28, deck, s.slide_num))
+    return y - 6
+
+
+def content_top(slide):
+    """y returned by start_slide() for slide, computed without drawing."""
+    y = H - MARGIN - (26 if os.path.exists(LOGO_PATH) else 10) - 28
+    return y - fit_title(slide.title, 28) - 10 - 6
+
+
+def layout_slide(slide):
+    """[(page, blocks)] of slide: blocks that do not fit above BOTTOM
+    continue on "(cd.)" pages."""
+    pages, current, blocks = [], slide, list(slide.blocks)
+    while True:
+        page, blocks = fit.paginate(blocks, content_top(current) - BOTTOM, min_height, split_block)
+        pages.append((current, page))
+        if not blocks:
+            return pages
+        current = dk.continued(slide, ())
+
+
+def draw_slide(s, slide, index, deck=None):
+    """Draw the pages of layout_slide(). With deck, splits and overflows
+    are reported to fit."""
+    pages = layout_slide(slide)
+    for n, (current, page) in enumerate(pages):
+        y = start_slide(s, current, index, deck)
+        excess = sum(min_height(b) for b in page) - (y - BOTTOM)
+        if deck is not None and excess > 0:
+            fit.report(deck.name, THEME.name, s.slide_num, current.title, fit.OVERFLOW,
+                       type(page[0]).__name__, excess)
+        draw_blocks(s, page, y)
+        if deck is not None and n < len(pages) - 1:
+            fit.report(deck.name, THEME.name, s.slide_num, slide.title, fit.SPLIT,
+                       "ciąg dalszy na następnym slajdzie")
+
+
+def draw_blocks(s, blocks, y):
+    for i, block in enumerate(blocks):
+        if isinstance(block, dk.Cards):
+            # Cards stretch to share whatever the remaining blocks leave free.
+            rest = blocks[i + 1:]
+            rows = sum(_card_rows(b) for b in rest if isinstance(b, dk.Cards)) + _card_rows(block)
+            reserved = sum(block_height(b) for b in rest)
+            avail = y - BOTTOM - reserved - CARD_GAP * (rows - 1)
+            y = draw_cards(s, block, y, int(avail / rows)) + CARD_GAP - 12
+        else:
+            y = draw_block(s, block, y)
+    return y
+
+
+def backend(theme):
+    """build_all.py hook. This engine draws the Aromagic theme only: its
+    layout is tied to the constants above, bound when the module loads."""
+    if theme.name != THEME.name:
+        raise ValueError("build_pdf_aromagic rysuje tylko motyw " + THEME.name)
+    return sys.modules[__name__]
+
+
+def output_path(deck, outdir=OUTDIR):
+    return os.path.join(outdir, deck.output_name(SUFFIX, EXT))
+
+
+# === PAGE CACHE ===
+# Every slide is drawn into a PDF of its own, cached by content (see
+# narzedzia/pdfpages.py); render() only draws slides whose key is new and
+# assembles the document from the cached pages.
+
+@functools.lru_cache(maxsize=None)
+def _base_key():
+    """Digest of what every page depends on besides its own content."""
+    assets = [(os.path.basename(p), cache.file_digest(p)) for p in ASSETS]
+    sources = [cache.file_digest(p) for p in cache.SOURCES]
+    # SlideBuilder and table_row_heights() use ReportLab internals
+    # (splitString, _rowHeights): another ReportLab version redraws every page.
+    return cache.digest(cache.theme_digest(sys.modules[__name__]), assets, sources, reportlab.Version)
+
+
+def _draw_pages(path, draw):
+    s = SlideBuilder(path, "")  # the assembled document gets the title
+    draw(s)
     s.save()
-    print("PDF zapisany: " + OUTFILE)
-    print("   " + str(s.slide_num) + " slajdow")
+    return s.slide_num
+
+
+def cover_pages(deck):
+    key = cache.digest(_base_key(), cache.slide_digests(deck)[0])
+    return pdfpages.cached(THEME.name.lower(), key,
+                           lambda path: _draw_pages(path, lambda s: draw_cover(s, deck)))
+
+
+def slide_pages(deck, slide, index):
+    # Only the parity of index shows: slides alternate two backgrounds.
+    key = cache.digest(_base_key(), cache.digest(slide), index % 2)
+    return pdfpages.cached(THEME.name.lower(), key,
+                           lambda path: _draw_pages(path, lambda s: draw_slide(s, slide, index, deck)))
+
+
+def deck_pages(deck):
+    """[pdfpages.Pages] of the cover and every slide, drawing only new ones."""
+    return [cover_pages(deck)] + [slide_pages(deck, slide, i) for i, slide in enumerate(deck.slides)]
+
+
+def page_counts(deck):
+    """Pages of the cover and of every slide, laid out but not drawn."""
+    register_fonts()
+    return [1] + [len(layout_slide(slide)) for slide in deck.slides]
+
+
+def render(deck, out_path=None):
+    if out_path is None:
+        out_path = output_path(deck)
+    parts = deck_pages(deck)
+    pdfpages.replay(parts, deck.name)
+    return out_path, pdfpages.assemble(parts, out_path, deck.name + SUFFIX)
+
+
+# === HANDOUTS ===
+# Print formats place the cached slide pages, scaled, on A4 portrait sheets
+# instead of laying the content out again.
+
+HANDOUT_LAYOUTS = {2: (1, 2), 4: (2, 2), 6: (2, 3)}  # slides per sheet: (columns, rows)
+DIARY_PER_SHEET = 2
+DIARY_DAYS = 14
+
+
+def handout_path(deck, per_sheet, outdir=OUTDIR):
+    return os.path.join(outdir, "%s — Materiały %d na stronie%s.%s" % (deck.name, per_sheet, SUFFIX, EXT))
+
+
+def diary_path(deck, outdir=OUTDIR):
+    return os.path.join(outdir, "%s — Dzienniczek%s.%s" % (deck.name, SUFFIX, EXT))
+
+
+def render_handout(deck, per_sheet=4, out_path=None):
+    """Handout with per_sheet slides (2, 4 or 6) and note lines per sheet."""
+    if per_sheet not in HANDOUT_LAYOUTS:
+        raise ValueError("materiały: %d slajdów na stronie, dostępne %s"
+                         % (per_sheet, ", ".join(map(str, HANDOUT_LAYOUTS))))
+    if out_path is None:
+        out_path = handout_path(deck, per_sheet)
+    columns, rows = HANDOUT_LAYOUTS[per_sheet]
+    count = pdfpages.sheets(deck_pages(deck), out_path, deck.name + SUFFIX, columns, rows,
+                            line_color=BORDER.rgb())
+    return out_path, count
+
+
+def diary_slide(deck):
+    """The progress diary table ("Dzienniczek postępów") alone on its slide."""
+    for slide in deck.slides:
+        if "dzienniczek" in (slide.section + " " + slide.title).lower():
+            tables = [b for b in slide.blocks if isinstance(b, dk.Table)]
+            if tables:
+                return dk.Slide(slide.section, slide.title, (tables[0],))
+    raise ValueError(deck.name + ": brak slajdu z tabelą dzienniczka")
+
+
+def render_diary(deck, days=DIARY_DAYS, out_path=None):
+    """Printable diary: one copy of the diary table per day, DIARY_PER_SHEET per sheet."""
+    if out_path is None:
+        out_path = diary_path(deck)
+    part = slide_pages(deck, diary_slide(deck), 1)
+    count = pdfpages.sheets([part] * days, out_path, deck.name + SUFFIX, 1, DIARY_PER_SHEET,
+                            notes=False, line_color=BORDER.rgb())
+    return out_path, count
+
+
+def load_deck(source=None):
+    if source is None:
+        from slides import build_deck
+        return build_deck()
+    import md
+    return md.load_deck(source)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PDF Aromagic: prezentacja, materiały, dzienniczek.")
+    parser.add_argument("source", nargs="?", help="plik Markdown (domyślnie slides.py)")
+    parser.add_argument("--handout", type=int, metavar="N", choices=sorted(HANDOUT_LAYOUTS),
+                        help="materiały: N slajdów na stronie A4 z miejscem na notatki")
+    parser.add_argument("--diary", type=int, metavar="DNI", nargs="?", const=DIARY_DAYS,
+                        help="dzienniczek do druku na DNI dni (domyślnie %d)" % DIARY_DAYS)
+    args = parser.parse_args(argv)
+    if args.diary is not None and args.diary < 1:
+        parser.error("--diary: co najmniej 1 dzień")
+    deck = load_deck(args.source)
+    try:
+        if args.handout:
+            out_path, count = render_handout(deck, args.handout)
+        elif args.diary is not None:
+            out_path, count = render_diary(deck, args.diary)
+        else:
+            out_path, count = render(deck)
+    except ValueError as e:
+        print("BŁĄD: %s" % e, file=sys.stderr)
+        return 1
+    for o in fit.drain():
+        if o.action == fit.OVERFLOW:
+            print("UWAGA: " + o.describe(), file=sys.stderr)
+    print("PDF zapisany: " + out_path)
+    print("   " + str(count) + " stron")
+    return 0
 
 
 if __name__ == "__main__":
-    build()
+    sys.exit(main())
@@ -1,474 +1,583 @@
 #!/usr/bin/env python3
-"""Generate PPTX presentation: Trening Węchowy w warunkach domowych"""
+"""Generate PPTX presentations from a deck.Deck model in any PPTX theme.
+
+Themes are data files in motywy/ (see narzedzia/themes.py): Offerflow,
+doTERRA (split layout with a colored right panel) and Wellness. This
+module only lays the blocks out; every color, size and position comes
+from the theme. backend(theme) gives the object build_all.py and build.py
+render with.
+
+Every deck starts from a master template built once per theme and kept in
+.build-cache/pptx/: only the blank layout, the slide size, and the theme's
+font and text color as the master's minor font and dk1. Runs inherit both,
+so a run only carries its size, weight and any other color. Text boxes
+and filled shapes are styled once as prototypes and then copied, instead
+of being set property by property on every shape.
+"""
 
 from pptx import Presentation
-from pptx.util import Inches, Pt, Emu
+from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from lxml import etree
+import copy
+import functools
+import glob
+import io
+import math
 import os
-
-# --- Colors (Offerflow palette) ---
-FG = RGBColor(0x17, 0x17, 0x17)       # hsl(0 0% 9%)
-MUTED = RGBColor(0x73, 0x73, 0x73)    # hsl(0 0% 45%)
-FAINT = RGBColor(0xA3, 0xA3, 0xA3)    # hsl(0 0% 64%)
-BG = RGBColor(0xFF, 0xFF, 0xFF)       # white
-BG_SEC = RGBColor(0xF7, 0xF7, 0xF7)   # hsl(0 0% 96.5%)
-BORDER = RGBColor(0xEB, 0xEB, 0xEB)   # hsl(0 0% 92%)
-
-FONT_NAME = "Inter"
-
-prs = Presentation()
-prs.slide_width = Inches(13.333)
-prs.slide_height = Inches(7.5)
-
-# Layout constants
-LEFT = Inches(1.2)
-TOP_SECTION = Inches(0.6)
-TOP_TITLE = Inches(1.0)
-TOP_BODY = Inches(1.8)
-CONTENT_W = Inches(10.9)
-
-
-def add_blank_slide():
-    layout = prs.slide_layouts[6]  # blank
-    return prs.slides.add_slide(layout)
-
-
-def add_section_label(slide, text):
-    txBox = slide.shapes.add_textbox(LEFT, TOP_SECTION, CONTENT_W, Inches(0.35))
-    tf = txBox.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = text.upper()
-    p.font.size = Pt(11)
-    p.font.color.rgb = FAINT
-    p.font.name = FONT_NAME
-    p.font.bold = False
-    p.space_after = Pt(0)
-
-
-def add_title(slide, text, top=None):
-    t = top or TOP_TITLE
-    txBox = slide.shapes.add_textbox(LEFT, t, CONTENT_W, Inches(0.7))
-    tf = txBox.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = text
-    p.font.size = Pt(32)
-    p.font.color.rgb = FG
-    p.font.name = FONT_NAME
-    p.font.bold = True
-    p.space_after = Pt(8)
-
-
-def add_subtitle(slide, text, top=None):
-    t = top or Inches(1.7)
-    txBox = slide.shapes.add_textbox(LEFT, t, CONTENT_W, Inches(0.5))
-    tf = txBox.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = text
-    p.font.size = Pt(14)
-    p.font.color.rgb = FAINT
-    p.font.name = FONT_NAME
-
-
-def add_body_text(slide, text, top=None, bold_prefix=None):
-    t = top or TOP_BODY
-    txBox = slide.shapes.add_textbox(LEFT, t, CONTENT_W, Inches(0.6))
-    tf = txBox.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    if bold_prefix:
-        run_b = p.add_run()
-        run_b.text = bold_prefix
-        run_b.font.bold = True
-        run_b.font.color.rgb = FG
-        run_b.font.size = Pt(18)
-        run_b.font.name = FONT_NAME
-        run_r = p.add_run()
-        run_r.text = text
-        run_r.font.color.rgb = MUTED
-        run_r.font.size = Pt(18)
-        run_r.font.name = FONT_NAME
-    else:
-        p.text = text
-        p.font.size = Pt(18)
-        p.font.color.rgb = MUTED
-        p.font.name = FONT_NAME
-    p.line_spacing = Pt(28)
-    return txBox
-
-
-def add_bullets(slide, items, top=None, numbered=False):
-    """items: list of (bold_part, rest_text) tuples or plain strings"""
-    t = top or TOP_BODY
-    txBox = slide.shapes.add_textbox(LEFT, t, CONTENT_W, Inches(4.5))
-    tf = txBox.text_frame
-    tf.word_wrap = True
-
-    for i, item in enumerate(items):
-        p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
-        p.space_after = Pt(6)
-        p.line_spacing = Pt(26)
-
-        if numbered:
-            prefix = f"{i+1}. "
-            run_n = p.add_run()
-            run_n.text = prefix
-            run_n.font.size = Pt(17)
-            run_n.font.color.rgb = FG
-            run_n.font.name = FONT_NAME
-            run_n.font.bold = True
-
-        if isinstance(item, tuple):
-            bold_part, rest = item
-            if not numbered:
-                bullet_run = p.add_run()
-                bullet_run.text = "  \u2022  "
-                bullet_run.font.size = Pt(17)
-                bullet_run.font.color.rgb = FAINT
-                bullet_run.font.name = FONT_NAME
-            run_b = p.add_run()
-            run_b.text = bold_part
-            run_b.font.bold = True
-            run_b.font.color.rgb = FG
-            run_b.font.size = Pt(17)
-            run_b.font.name = FONT_NAME
-            if rest:
-                run_r = p.add_run()
-                run_r.text = rest
-                run_r.font.color.rgb = MUTED
-                run_r.font.size = Pt(17)
-                run_r.font.name = FONT_NAME
+import sys
+from xml.sax.saxutils import escape
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, "narzedzia"))
+
+import cache
+import deck as dk
+import fit
+import themes
+
+EXT = "pptx"
+OUTDIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_THEME = "Offerflow"
+
+SLIDE_W = Inches(13.333)
+SLIDE_H = Inches(7.5)
+TEMPLATE_DIR = os.path.join(cache.CACHE_DIR, "pptx")
+BLANK_LAYOUT = "Blank"
+TITLE_MIN_SCALE = 0.7  # titles shrink to fit one line, down to this fraction
+
+
+@functools.lru_cache(maxsize=None)
+def rgb(hex_color):
+    return RGBColor.from_string(hex_color[1:])
+
+
+def build_template(theme):
+    """Bytes of a .pptx master for theme: blank layout only, theme font and text color."""
+    prs = Presentation()
+    prs.slide_width = SLIDE_W
+    prs.slide_height = SLIDE_H
+    layouts = prs.slide_layouts
+    for layout in list(layouts):
+        if layout.name != BLANK_LAYOUT:
+            layouts.remove(layout)
+    part = prs.slide_master.part.part_related_by(RT.THEME)
+    root = etree.fromstring(part.blob)
+    root.set("name", theme.name)
+    for latin in root.iter(qn("a:latin")):
+        if latin.getparent().tag in (qn("a:majorFont"), qn("a:minorFont")):
+            latin.set("typeface", theme.font)
+    dk1 = root.find(".//" + qn("a:dk1"))
+    dk1[:] = [parse_xml('<a:srgbClr %s val="%s"/>' % (nsdecls("a"), theme.colors.text[1:]))]
+    part.blob = etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+    out = io.BytesIO()
+    prs.save(out)
+    return out.getvalue()
+
+
+def template(theme):
+    """Master template bytes for theme, from the build cache when up to date."""
+    key = cache.digest(theme.font, theme.colors.text, SLIDE_W, SLIDE_H,
+                       cache.file_digest(os.path.abspath(__file__)))[:12]
+    path = os.path.join(TEMPLATE_DIR, "%s-%s.pptx" % (theme.name.lower(), key))
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        pass
+    blob = build_template(theme)
+    os.makedirs(TEMPLATE_DIR, exist_ok=True)
+    for stale in glob.glob(os.path.join(TEMPLATE_DIR, theme.name.lower() + "-*.pptx")):
+        os.remove(stale)
+    tmp = "%s.%d.tmp" % (path, os.getpid())  # workers may build it concurrently
+    with open(tmp, "wb") as f:
+        f.write(blob)
+    os.replace(tmp, path)
+    return blob
+
+
+def stat_items(block):
+    return ["<b>" + number + "</b> — " + label for number, label in block.items]
+
+
+class Backend:
+    """One PPTX theme, with the interface of a backend module
+    (SUFFIX, EXT, output_path, render) and the drawing primitives."""
+
+    EXT = EXT
+    OUTDIR = OUTDIR
+
+    def __init__(self, theme):
+        # Upper-case attributes are what cache.theme_digest() keys on.
+        self.THEME = self.t = theme
+        self.SUFFIX = theme.suffix
+        self.font = theme.font
+        self.left = Inches(theme.layout.left)
+        self.width = Inches(theme.layout.width)
+        self.top_body = Inches(theme.layout.top_body)
+        self.gap = Inches(theme.layout.gap)
+        self.bottom = SLIDE_H - Inches(theme.layout.bottom)
+        self.metrics = fit.metrics(theme.font)
+        self.ASSETS = list(self.metrics.paths)  # see cache.artifact_key
+        self._template = None
+        self._prototypes = {}
+
+    def new_presentation(self):
+        if self._template is None:
+            self._template = template(self.t)
+        return Presentation(io.BytesIO(self._template))
+
+    def add_blank_slide(self, prs):
+        return prs.slides.add_slide(prs.slide_layouts[0])
+
+    # === PRIMITIVES ===
+
+    def _clone(self, slide, key, make, left, top, width, height):
+        """Shape from the prototype for key; make(slide, ...) draws the first one."""
+        proto = self._prototypes.get(key)
+        if proto is None:
+            shape = make(slide, left, top, width, height)
+            self._prototypes[key] = copy.deepcopy(shape.element)
+            return shape
+        tree = slide.shapes.element
+        el = copy.deepcopy(proto)
+        shape_id = tree.max_shape_id + 1
+        c_nv_pr = el.nvSpPr.cNvPr
+        c_nv_pr.id = shape_id
+        c_nv_pr.name = "%s %d" % (c_nv_pr.name.rsplit(" ", 1)[0], shape_id - 1)
+        tree.insert_element_before(el, "p:extLst")
+        shape = slide.shapes[-1]  # el, now the last shape of the tree
+        shape.left, shape.top, shape.width, shape.height = left, top, width, height
+        return shape
+
+    def _rpr_xml(self, size, color, bold):
+        """<a:rPr> markup; the theme's text color and font are inherited."""
+        fill = "" if color == self.t.colors.text else \
+            '<a:solidFill><a:srgbClr val="%s"/></a:solidFill>' % color[1:]
+        return '<a:rPr sz="%d"%s>%s</a:rPr>' % (round(size * 100), ' b="1"' if bold else "", fill)
+
+    def add_runs(self, p, text, size, color=None, bold_color=None):
+        """Add runs for text with <b> markup: bold parts in bold_color."""
+        for chunk, is_bold in dk.spans(text):
+            if is_bold:
+                self.add_text(p, chunk, size, bold_color or self.t.colors.strong, True)
+            else:
+                self.add_text(p, chunk, size, color or self.t.colors.text, False)
+
+    def add_text(self, p, text, size, color, bold):
+        """One run; like _rpr_xml, only what differs from the theme is set."""
+        run = p.add_run()
+        run.text = text
+        run.font.size = Pt(size)
+        if bold:
+            run.font.bold = True
+        if color != self.t.colors.text:
+            run.font.color.rgb = rgb(color)
+
+    def add_textbox(self, slide, left, top, width, height):
+        def make(slide, *box):
+            shape = slide.shapes.add_textbox(*box)
+            shape.text_frame.word_wrap = True
+            return shape
+        return self._clone(slide, "textbox", make, left, top, width, height)
+
+    def add_shape(self, slide, kind, left, top, width, height, fill):
+        def make(slide, *box):
+            shape = slide.shapes.add_shape(kind, *box)
+            shape.fill.solid()
+            shape.fill.fore_color.rgb = rgb(fill)
+            shape.line.fill.background()
+            shape.shadow.inherit = False
+            # Fill, line and effects are explicit; without the default style
+            # text falls back to the master's text color instead of white.
+            style = shape.element.find(qn("p:style"))
+            shape.element.remove(style)
+            return shape
+        return self._clone(slide, (kind, fill), make, left, top, width, height)
+
+    def add_panel(self, slide, color):
+        panel = self.t.panel
+        return self.add_shape(slide, MSO_SHAPE.RECTANGLE, Inches(panel.left), Inches(0),
+                              Inches(panel.width), SLIDE_H, color)
+
+    def add_section_label(self, slide, text):
+        style = self.t.label
+        pill = style.get("pill")
+        if pill:
+            box = self.add_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, self.left, Inches(style.top),
+                                 Inches(pill.width), Inches(style.height), pill.fill)
+            tf = box.text_frame
+            tf.margin_left = tf.margin_right = Pt(pill.pad_x)
+            tf.margin_top = tf.margin_bottom = Pt(pill.pad_y)
+        else:
+            tf = self.add_textbox(slide, self.left, Inches(style.top), self.width,
+                                  Inches(style.height)).text_frame
+        p = tf.paragraphs[0]
+        p.alignment = PP_ALIGN.LEFT
+        p.space_after = Pt(0)
+        self.add_text(p, text.upper(), style.size, style.color, style.bold)
+
+    def title_size(self, text, size, height, where=None):
+        """Largest size up to size at which text fits a title box height tall;
+        where = (deck, slide number) reports shrinking and overflow."""
+        fitted, ok = fit.fit_size(self.metrics, "<b>%s</b>" % text, size, self.width / 12700,
+                                  height / 12700, math.ceil(size * TITLE_MIN_SCALE))
+        if where and fitted != size:
+            deck, number = where
+            fit.report(deck.name, self.t.name, number, text.replace("\n", " / "),
+                       fit.SHRINK if ok else fit.OVERFLOW, "tytuł %g → %g pt" % (size, fitted))
+        return fitted
+
+    def add_title(self, slide, text, where=None):
+        style = self.t.title
+        height = Inches(style.height)
+        tf = self.add_textbox(slide, self.left, Inches(style.top), self.width, height).text_frame
+        p = tf.paragraphs[0]
+        self.add_text(p, text, self.title_size(text, style.size, height, where), style.color, True)
+        p.space_after = Pt(style.space_after)
+
+    # === MEASURING ===
+    # Heights in EMU, computed the way the add_* methods lay text out.
+
+    def text_height(self, text, size, line_spacing, width):
+        return Pt(line_spacing) * self.metrics.lines(text, size, width / 12700)
+
+    @staticmethod
+    def body_markup(text, emphasis):
+        return "<b>" + dk.plain(text) + "</b>" if emphasis else text
+
+    def body_height(self, text, emphasis=False):
+        style = self.t.body
+        return self.text_height(self.body_markup(text, emphasis), style.size, style.line, self.width)
+
+    def list_prefix(self, number, numbered, marker):
+        return f"<b>{number}. </b>" if numbered else marker or self.t.list.marker
+
+    def list_height(self, items, numbered=False, marker=None, start=1):
+        style = self.t.list
+        return sum(self.text_height(self.list_prefix(n, numbered, marker) + item,
+                                    style.size, style.line, self.width) + Pt(style.space)
+                   for n, item in enumerate(items, start))
+
+    def box_height(self, text, cite=None):
+        style = self.t.box
+        h = self.text_height(text, style.size, style.line, self.width - Pt(2 * style.pad_x))
+        return h + Pt(2 * style.pad_y) + (Pt(style.cite_space) if cite else 0)
+
+    def card_items(self, block):
+        # A narrow content column: cards collapse into bullets.
+        return [("<b>" + c.title + "</b> — " if c.title else "") + c.body for c in block.cards]
+
+    def card_rows(self, block):
+        """[(cards, row height)] of a grid, and the card width."""
+        cols = block.columns
+        card_w = int((self.width - self.gap * (cols - 1)) / cols)
+        rows = [block.cards[i:i + cols] for i in range(0, len(block.cards), cols)]
+        return [(row, max(self.card_height(c, card_w) for c in row)) for row in rows], card_w
+
+    def block_height(self, block):
+        """Space add_block() takes for block, including the gap after it."""
+        gap = self.gap
+        if isinstance(block, (dk.Lead, dk.Paragraph)):
+            return self.body_height(block.text, getattr(block, "emphasis", False)) + gap
+        if isinstance(block, dk.Heading):
+            return Inches(self.t.heading.advance)
+        if isinstance(block, dk.Bullets):
+            return self.list_height(block.items) + gap
+        if isinstance(block, dk.Steps):
+            return self.list_height(block.items, numbered=True, start=block.start) + gap
+        if isinstance(block, dk.Checklist):
+            return self.list_height(block.items, marker=self.t.list.checkbox) + gap
+        if isinstance(block, dk.Stats):
+            return self.list_height(stat_items(block)) + gap
+        if isinstance(block, dk.Callout):
+            return self.box_height(block.text) + gap
+        if isinstance(block, dk.Quote):
+            return self.box_height(block.text, block.cite) + gap
+        if isinstance(block, dk.Table):
+            return sum(self.table_layout(block)[1]) + gap
+        if isinstance(block, dk.Cards):
+            if self.t.cards.layout != "grid":
+                return self.list_height(self.card_items(block)) + gap
+            return sum(h + gap for _, h in self.card_rows(block)[0])
+        raise TypeError("Unsupported block: " + type(block).__name__)
+
+    def split_block(self, block, room, at_top):
+        if isinstance(block, dk.Table):
+            head, tail = dk.split_table(block, self.table_layout(block)[1], room - self.gap, at_top)
+            return (head, tail) if head and tail else None
+        return fit.split_items(block, room, self.block_height, at_top)
+
+    # === BLOCKS ===
+
+    def add_body_text(self, slide, text, top, emphasis=False):
+        """text may contain <b> markup; emphasis renders all of it bold."""
+        style = self.t.body
+        h = self.body_height(text, emphasis)
+        tf = self.add_textbox(slide, self.left, top, self.width, h).text_frame
+        p = tf.paragraphs[0]
+        self.add_runs(p, self.body_markup(text, emphasis), style.size)
+        p.line_spacing = Pt(style.line)
+        return h
+
+    def add_bullets(self, slide, items, top, numbered=False, marker=None, start=1):
+        """items: list of strings with optional <b> markup"""
+        style = self.t.list
+        h = self.list_height(items, numbered, marker, start)
+        tf = self.add_textbox(slide, self.left, top, self.width, h).text_frame
+        for i, item in enumerate(items):
+            p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
+            p.space_after = Pt(style.space)
+            p.line_spacing = Pt(style.line)
+            if numbered:
+                self.add_text(p, f"{start + i}. ", style.size, style.number_color, True)
+            else:
+                self.add_text(p, marker or style.marker, style.size, style.marker_color, False)
+            self.add_runs(p, item, style.size)
+        return h
+
+    def add_box(self, slide, text, top, look, cite=None):
+        """Filled box (callout or quote); look is the theme's style for it."""
+        style = self.t.box
+        h = self.box_height(text, cite)
+        box = self.add_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, self.left, top, self.width, h, look.fill)
+        tf = box.text_frame
+        tf.word_wrap = True
+        tf.margin_left = tf.margin_right = Pt(style.pad_x)
+        tf.margin_top = tf.margin_bottom = Pt(style.pad_y)
+        p = tf.paragraphs[0]
+        self.add_runs(p, text, style.size, look.color, look.strong)
+        p.line_spacing = Pt(style.line)
+        if cite:
+            p2 = tf.add_paragraph()
+            p2.alignment = PP_ALIGN.RIGHT
+            self.add_runs(p2, cite, style.cite_size, look.cite, look.strong)
+        return h
+
+    def card_height(self, card, width):
+        style, pad = self.t.cards, self.t.box
+        h = self.text_height(card.body, style.size, style.line, width - Pt(2 * pad.pad_x)) + Pt(2 * pad.pad_y)
+        if card.title:
+            h += Pt(style.title_space)
+        return h
+
+    def add_card(self, slide, left, top, width, height, title, body):
+        style, pad = self.t.cards, self.t.box
+        box = self.add_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, left, top, width, height, style.fill)
+        tf = box.text_frame
+        tf.word_wrap = True
+        tf.vertical_anchor = MSO_ANCHOR.TOP
+        tf.margin_left = tf.margin_right = Pt(pad.pad_x)
+        tf.margin_top = tf.margin_bottom = Pt(pad.pad_y)
+        p = tf.paragraphs[0]
+        if title:
+            self.add_runs(p, "<b>" + title + "</b>", style.title_size)
+            p.space_after = Pt(6)
+            p = tf.add_paragraph()
+        self.add_runs(p, body, style.size)
+        p.line_spacing = Pt(style.line)
+        return box
+
+    def add_cards(self, slide, block, top):
+        if self.t.cards.layout != "grid":
+            return top + self.add_bullets(slide, self.card_items(block), top) + self.gap
+        rows, card_w = self.card_rows(block)
+        for row, row_h in rows:
+            for c, card in enumerate(row):
+                self.add_card(slide, self.left + c * (card_w + self.gap), top, card_w, row_h,
+                              card.title, card.body)
+            top += row_h + self.gap
+        return top
+
+    def add_h3(self, slide, text, top):
+        style = self.t.heading
+        tf = self.add_textbox(slide, self.left, top, self.width, Inches(style.height)).text_frame
+        self.add_text(tf.paragraphs[0], text, style.size, style.color, True)
+        return Inches(style.advance)
+
+    def table_layout(self, block):
+        """(column widths, row heights, small) of a table block, in EMU."""
+        style = self.t.table
+        n_cols = len(block.headers)
+        if block.widths:
+            widths = [int(self.width * f) for f in block.widths]
         else:
-            if not numbered:
-                bullet_run = p.add_run()
-                bullet_run.text = "  \u2022  "
-                bullet_run.font.size = Pt(17)
-                bullet_run.font.color.rgb = FAINT
-                bullet_run.font.name = FONT_NAME
-            run = p.add_run()
-            run.text = item
-            run.font.size = Pt(17)
-            run.font.color.rgb = MUTED
-            run.font.name = FONT_NAME
-
-    return txBox
-
-
-def add_highlight_box(slide, text, top, bold_prefix=None):
-    box = slide.shapes.add_shape(
-        MSO_SHAPE.ROUNDED_RECTANGLE, LEFT, top, CONTENT_W, Inches(0.9)
-    )
-    box.fill.solid()
-    box.fill.fore_color.rgb = BG_SEC
-    box.line.fill.background()
-    box.shadow.inherit = False
-
-    tf = box.text_frame
-    tf.word_wrap = True
-    tf.margin_left = Pt(16)
-    tf.margin_right = Pt(16)
-    tf.margin_top = Pt(12)
-    tf.margin_bottom = Pt(12)
-    p = tf.paragraphs[0]
-    if bold_prefix:
-        run_b = p.add_run()
-        run_b.text = bold_prefix
-        run_b.font.bold = True
-        run_b.font.color.rgb = FG
-        run_b.font.size = Pt(16)
-        run_b.font.name = FONT_NAME
-        run_r = p.add_run()
-        run_r.text = text
-        run_r.font.color.rgb = MUTED
-        run_r.font.size = Pt(16)
-        run_r.font.name = FONT_NAME
-    else:
-        p.text = text
-        p.font.size = Pt(16)
-        p.font.color.rgb = MUTED
-        p.font.name = FONT_NAME
-    p.line_spacing = Pt(24)
-    return box
-
-
-def add_h3(slide, text, top):
-    txBox = slide.shapes.add_textbox(LEFT, top, CONTENT_W, Inches(0.4))
-    tf = txBox.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = text
-    p.font.size = Pt(20)
-    p.font.color.rgb = FG
-    p.font.name = FONT_NAME
-    p.font.bold = True
-    return txBox
-
-
-def add_table(slide, headers, rows, top, col_widths=None, small=False):
-    n_rows = len(rows) + 1
-    n_cols = len(headers)
-    w = sum(col_widths) if col_widths else CONTENT_W
-    tbl_shape = slide.shapes.add_table(n_rows, n_cols, LEFT, top, int(w), Inches(0.4 * n_rows))
-    tbl = tbl_shape.table
-
-    if col_widths:
-        for i, cw in enumerate(col_widths):
-            tbl.columns[i].width = int(cw)
-
-    font_size = Pt(13) if small else Pt(14)
-    header_size = Pt(11) if small else Pt(12)
-
-    for i, h in enumerate(headers):
-        cell = tbl.cell(0, i)
-        cell.text = h
-        cell.fill.solid()
-        cell.fill.fore_color.rgb = BG_SEC
-        for p in cell.text_frame.paragraphs:
-            p.font.size = header_size
-            p.font.color.rgb = MUTED
-            p.font.name = FONT_NAME
-            p.font.bold = True
-
-    for r_idx, row in enumerate(rows):
-        for c_idx, val in enumerate(row):
-            cell = tbl.cell(r_idx + 1, c_idx)
-            cell.text = val
-            cell.fill.solid()
-            cell.fill.fore_color.rgb = BG
-            for p in cell.text_frame.paragraphs:
-                p.font.size = font_size
-                p.font.color.rgb = MUTED
-                p.font.name = FONT_NAME
-
-    return tbl_shape
-
-
-# ===== SLIDES =====
-
-# 1. Tytuł
-s = add_blank_slide()
-txBox = s.shapes.add_textbox(LEFT, Inches(2.2), CONTENT_W, Inches(1.5))
-tf = txBox.text_frame
-tf.word_wrap = True
-p = tf.paragraphs[0]
-p.text = "Trening Węchowy"
-p.font.size = Pt(48)
-p.font.color.rgb = FG
-p.font.name = FONT_NAME
-p.font.bold = True
-p2 = tf.add_paragraph()
-p2.text = "w warunkach domowych"
-p2.font.size = Pt(48)
-p2.font.color.rgb = FG
-p2.font.name = FONT_NAME
-p2.font.bold = True
-p2.space_before = Pt(0)
-
-txBox2 = s.shapes.add_textbox(LEFT, Inches(4.0), CONTENT_W, Inches(0.5))
-tf2 = txBox2.text_frame
-p3 = tf2.paragraphs[0]
-p3.text = "Opracowanie: Emilia Chodorowska \u00b7 na podstawie kursu Aromapsychologia Anny Bober"
-p3.font.size = Pt(14)
-p3.font.color.rgb = FAINT
-p3.font.name = FONT_NAME
-
-
-# 2. Wstęp — mechanizm
-s = add_blank_slide()
-add_section_label(s, "1 \u00b7 Wst\u0119p")
-add_title(s, 'Dlaczego Tw\u00f3j nos \u201ezamilk\u0142\u201d?')
-add_bullets(s, [
-    ("Grypa", " \u2192 obrz\u0119k tkanek fizycznie blokuje dost\u0119p aromat\u00f3w"),
-    ("COVID-19", " \u2192 dro\u017cne przewody nosowe, ale wirus atakuje kom\u00f3rki podporowe i gruczo\u0142y Bowmana"),
-    ("", "Neurony w\u0119chowe trac\u0105 \u201esystem podtrzymywania \u017cycia\u201d \u2014 jak sprawne odbiorniki bez zasilania"),
-    ("", "Brak stymulacji \u2192 atrofia opuszki w\u0119chowej i zmiany w hipokampie"),
-])
-
-
-# 3. Wstęp — nadzieja
-s = add_blank_slide()
-add_section_label(s, "1 \u00b7 Wst\u0119p")
-add_title(s, "Dlaczego to minie?")
-add_body_text(s, "Neurony w\u0119chowe maj\u0105 unikaln\u0105 zdolno\u015b\u0107 do regeneracji.")
-add_highlight_box(s,
-    ' Systematyczny trening w\u0119chowy wykazuje skuteczno\u015b\u0107 por\u00f3wnywaln\u0105 z terapi\u0105 sterydow\u0105. '
-    'Regularna stymulacja zwi\u0119ksza obj\u0119to\u015b\u0107 istoty szarej w m\u00f3zgu, odwracaj\u0105c negatywne skutki anosmii. '
-    'Tw\u00f3j m\u00f3zg jest plastyczny \u2014 trening to proces jego fizycznej odbudowy.',
-    Inches(2.8),
-    bold_prefix='\u201e'
-)
-
-
-# 4. Warsztat zapachowy
-s = add_blank_slide()
-add_section_label(s, "2 \u00b7 Warsztat zapachowy")
-add_title(s, "Co przygotowa\u0107?")
-add_body_text(s, "Potrzebujemy stworzy\u0107 headspace \u2014 nasycon\u0105 cz\u0105steczkami przestrze\u0144 nad \u017ar\u00f3d\u0142em zapachu.")
-add_h3(s, "Niezb\u0119dne wyposa\u017cenie", Inches(2.7))
-add_bullets(s, [
-    ("S\u0142oiczki z ciemnego szk\u0142a (15-30 ml)", " \u2014 chroni\u0105 olejki, koncentruj\u0105 opary"),
-    ("Papier akwarelowy", " \u2014 porowato\u015b\u0107 idealnie trzyma aromat"),
-    ("Olejki eteryczne", " \u2014 wy\u0142\u0105cznie naturalne, wysokiej jako\u015bci"),
-], top=Inches(3.2))
-
-
-# 5. Przygotowanie słoiczka
-s = add_blank_slide()
-add_section_label(s, "2 \u00b7 Warsztat zapachowy")
-add_title(s, "Przygotowanie s\u0142oiczka")
-add_bullets(s, [
-    "W\u0142\u00f3\u017c do s\u0142oiczka pasek papieru akwarelowego",
-    "Nas\u0105cz go 4-8 kroplami wybranego olejku",
-    "Szczelnie zakr\u0119\u0107, odczekaj godzin\u0119",
-    "Co tydzie\u0144 wymieniaj papier i dolewaj olejku (cytrusy szybko oksyduj\u0105)",
-    "Popro\u015b kogo\u015b ze sprawnym w\u0119chem o weryfikacj\u0119 intensywno\u015bci",
-], numbered=True)
-
-
-# 6. Wybór zapachów
-s = add_blank_slide()
-add_section_label(s, "3 \u00b7 Wyb\u00f3r zapach\u00f3w")
-add_title(s, "Cztery fundamenty treningu")
-add_table(s,
-    ["Grupa zapachowa", "Zamienniki", "Dlaczego?"],
-    [
-        ["Kwiatowa (R\u00f3\u017ca)", "Geranium, ylang-ylang", "Subtelne receptory"],
-        ["Owocowa (Cytryna)", "Pomara\u0144cza, grejpfrut", "Wysoka intensywno\u015b\u0107"],
-        ["Korzenna (Go\u017adziki)", "Cynamon, wanilia", "Zakotwiczenie w pami\u0119ci"],
-        ["\u017bywicza (Eukaliptus)", "Mi\u0119ta, rozmaryn", "Nerw tr\u00f3jdzielny (ch\u0142\u00f3d)"],
-    ],
-    top=Inches(1.9),
-    col_widths=[Inches(4), Inches(3.5), Inches(3.4)]
-)
-add_highlight_box(s,
-    " Wybieraj aromaty budz\u0105ce silne wspomnienia. Emocjonalny \u015blad w m\u00f3zgu u\u0142atwia regeneracj\u0119 po\u0142\u0105cze\u0144 synaptycznych.",
-    Inches(4.8),
-    bold_prefix="Pami\u0119\u0107 w\u0119chowa:"
-)
-
-
-# 7. Technika małych wdechów
-s = add_blank_slide()
-add_section_label(s, "4 \u00b7 Technika oddechowa")
-add_title(s, 'Technika \u201eMa\u0142ych Wdech\u00f3w\u201d')
-add_body_text(s, "G\u0142\u0119boki wdech omija nab\u0142onek w\u0119chowy \u2014 kieruje powietrze prosto do p\u0142uc.")
-add_highlight_box(s,
-    " Kr\u00f3tkie, ma\u0142e wdechy \u2014 jak pies na spacerze. Tworzysz zawirowania powietrza, "
-    "kt\u00f3re kieruj\u0105 headspace bezpo\u015brednio na pole w\u0119chowe.",
-    Inches(2.8),
-    bold_prefix="Prawid\u0142owa technika:"
-)
-
-
-# 8. Sesja treningowa
-s = add_blank_slide()
-add_section_label(s, "4 \u00b7 Sesja treningowa")
-add_title(s, "Sesja treningowa (~2 min.)")
-add_bullets(s, [
-    ("☐ ", "Wybierz spokojne miejsce, wycisz telefon"),
-    ("☐ ", "Otwórz słoiczek, zbliż go do nosa"),
-    ("☐ ", "20 sekund wąchania techniką małych wdechów"),
-    ("☐ ", "Zamknij słoiczek \u2014 10-15 sek. przerwy (neutralne powietrze)"),
-    ("☐ ", "Przejdź do kolejnego zapachu"),
-    ("☐ ", "Powtarzaj 2x dziennie: rano i wieczorem"),
-])
-
-
-# 9. Praca mentalna
-s = add_blank_slide()
-add_section_label(s, "5 \u00b7 Praca mentalna")
-add_title(s, "Wąchanie wyobraźnią")
-add_body_text(s, "Nawet przy absolutnej pustce Twoja kora węchowa może wykazywać aktywność.")
-add_bullets(s, [
-    ("Zamknij oczy", " podczas wąchania"),
-    ("Przywołaj obraz obiektu", " \u2014 kolor, teksturę, smak"),
-    ("", 'Spróbuj \u201epoczuć\u201d zapach siłą woli'),
-    ("Wspieraj się bodźcami wizualnymi", " \u2014 zdjęcia, obrazy"),
-], top=Inches(2.8))
-
-
-# 10. Dzienniczek
-s = add_blank_slide()
-add_section_label(s, "6 \u00b7 Dzienniczek postępów")
-add_title(s, "Cierpliwość i śledzenie postępów")
-add_bullets(s, [
-    ("Pierwsze efekty:", " zazwyczaj po 4 miesiącach"),
-    ("Pełna rehabilitacja:", " 14-24 miesiące"),
-], top=Inches(1.9))
-add_highlight_box(s,
-    " Nieprzyjemne, zniekształcone zapachy (np. spalona guma zamiast kawy) "
-    "to dowód, że neurony nawiązują nowe połączenia.",
-    Inches(3.2),
-    bold_prefix="Parosmia = dobry znak!"
-)
-add_table(s,
-    ["Pole", "Wpis"],
-    [
-        ["Data", ".................."],
-        ["Zapach", ".................."],
-        ["Odczucia", "nic / chłód / zniekształcony / czysty"],
-        ["Intensywność", "0 \u2013 1 \u2013 2 \u2013 3 \u2013 4 \u2013 5"],
-    ],
-    top=Inches(4.5),
-    col_widths=[Inches(2.5), Inches(5)],
-    small=True
-)
-
-
-# 11. Szersze korzyści
-s = add_blank_slide()
-add_section_label(s, "7 \u00b7 Szersze korzyści")
-add_title(s, "Nie tylko po wirusie")
-add_body_text(s, "Trening węchowy przynosi szersze korzyści dla mózgu:")
-add_bullets(s, [
-    ("Poprawa funkcji poznawczych", " \u2014 udowodniona u osób starszych"),
-    ("Poprawa płynności semantycznej i werbalnej", ""),
-    ("Zwiększenie objętości istoty szarej", " \u2014 odwraca skutki anosmii"),
-    ("Wydłużenie życia neuronów węchowych", ""),
-    ("Poprawa nastroju", " \u2014 potwierdzona klinicznie"),
-], top=Inches(2.8))
-
-
-# 12. Neuroplastyczność
-s = add_blank_slide()
-add_section_label(s, "7 \u00b7 Neuroplastyczność")
-add_title(s, "Mózg się odbudowuje")
-add_h3(s, "Istota szara", Inches(1.8))
-add_body_text(s,
-    "Anosmia powoduje utratę istoty szarej. Systematyczny trening olfaktoryczny "
-    "fizycznie zwiększa jej objętość, odwracając negatywne skutki.",
-    top=Inches(2.3)
-)
-add_h3(s, "Łączność strukturalna", Inches(3.4))
-add_body_text(s,
-    "Długoterminowa ekspozycja na bodźce węchowe przebudowuje szlaki nerwowe. "
-    "Nawet nocna ekspozycja (2h/noc przez 6 miesięcy) poprawia łączność "
-    "między układem limbicznym a korą mózgową.",
-    top=Inches(3.9)
-)
-
-
-# 13. Złote zasady
-s = add_blank_slide()
-add_section_label(s, "8 \u00b7 Podsumowanie")
-add_title(s, "Złote zasady cierpliwego odkrywcy")
-add_bullets(s, [
-    ("SYSTEMATYCZNOŚĆ", " \u2014 2x dziennie, codziennie. To Twoje lekarstwo."),
-    ("TECHNIKA ODDECHU", ' \u2014 Krótkie, \u201ewęszące\u201d wdechy.'),
-    ("WYOBRAŹNIA", " \u2014 Mózg reaguje na wspomnienie zapachu tak samo intensywnie jak na bodziec."),
-    ("STYMULACJA TRÓJDZIELNA", " \u2014 Zawsze mięta lub eukaliptus w zestawie."),
-    ("CZAS I CIERPLIWOŚĆ", " \u2014 4 miesiące na pierwszy sygnał powrotu."),
-], numbered=True)
-
-
-# ===== SAVE =====
-out_path = os.path.join(
-    os.path.dirname(os.path.abspath(__file__)),
-    "Trening Węchowy — Prezentacja.pptx"
-)
-prs.save(out_path)
-print(f"PPTX: {out_path}")
+            widths = [int(self.width / n_cols)] * n_cols
+        small = n_cols < 3
+        size = style.size_small if small else style.size
+        header_size = style.header_size_small if small else style.header_size
+        min_h = Inches(style.row)
+        heights = [max(min_h, self._row_height(block.headers, widths, header_size))]
+        heights += [max(min_h, self._row_height(row, widths, size)) for row in block.rows]
+        return widths, heights, small
+
+    def _row_height(self, cells, widths, size):
+        # Default cell margins: 0.1" left/right, 0.05" top/bottom.
+        return max(self.text_height(c, size, size * 1.2, w - Inches(0.2))
+                   for c, w in zip(cells, widths)) + Inches(0.1)
+
+    def _cell_xml(self, text, rpr, fill):
+        run = "<a:r>%s<a:t>%s</a:t></a:r>" % (rpr, escape(text)) if text else ""
+        return ("<a:tc><a:txBody><a:bodyPr/><a:lstStyle/><a:p>%s</a:p></a:txBody>"
+                '<a:tcPr><a:solidFill><a:srgbClr val="%s"/></a:solidFill></a:tcPr></a:tc>'
+                % (run, fill[1:]))
+
+    def add_table(self, slide, block, top, layout=None):
+        """Table block as one <a:tbl> written in a single pass.
+
+        Every cell of a row kind shares one run style and fill, so hundreds of
+        rows cost one string join and one parse. layout is table_layout(block).
+        """
+        style = self.t.table
+        widths, heights, small = layout or self.table_layout(block)
+        size = style.size_small if small else style.size
+        header_size = style.header_size_small if small else style.header_size
+        header_rpr = self._rpr_xml(header_size, style.header_color, True)
+        rpr = self._rpr_xml(size, style.color, False)
+        parts = ["<a:tbl %s><a:tblGrid>" % nsdecls("a")]
+        parts += ['<a:gridCol w="%d"/>' % w for w in widths]
+        parts.append("</a:tblGrid>")
+        parts.append('<a:tr h="%d">' % heights[0])
+        parts += [self._cell_xml(h, header_rpr, style.header_fill) for h in block.headers]
+        parts.append("</a:tr>")
+        for r_idx, row in enumerate(block.rows):
+            fill = style.fills[r_idx % len(style.fills)]
+            parts.append('<a:tr h="%d">' % heights[r_idx + 1])
+            parts += [self._cell_xml(val, rpr, fill) for val in row]
+            parts.append("</a:tr>")
+        parts.append("</a:tbl>")
+        tbl = parse_xml("".join(parts))
+
+        height = sum(heights)
+        frame = slide.shapes.add_table(1, len(widths), self.left, top, sum(widths), height)
+        old = frame.element.graphic.graphicData.tbl
+        tbl.insert(0, old.tblPr)  # python-pptx's table style and banding flags
+        old.getparent().replace(old, tbl)
+        return height
+
+    # === DECK RENDERING ===
+
+    def add_cover(self, prs, deck):
+        style = self.t.cover
+        s = self.add_blank_slide(prs)
+        if "panel" in self.t:
+            self.add_panel(s, self.t.panel.cover)
+        if deck.label:
+            self.add_section_label(s, deck.label)
+        tf = self.add_textbox(s, self.left, Inches(style.top), self.width, Inches(style.height)).text_frame
+        title = "\n".join(line for line in (deck.title, deck.subtitle) if line)
+        size = self.title_size(title, style.size, Inches(style.height), (deck, 1))
+        self.add_text(tf.paragraphs[0], deck.title, size, style.color, True)
+        if deck.subtitle:
+            p2 = tf.add_paragraph()
+            self.add_text(p2, deck.subtitle, size, style.color, True)
+            p2.space_before = Pt(0)
+
+        tf2 = self.add_textbox(s, self.left, Inches(style.byline_top), self.width, Inches(0.5)).text_frame
+        self.add_text(tf2.paragraphs[0], " · ".join(t for t in (deck.author, deck.credit) if t),
+                      style.byline_size, style.byline_color, False)
+
+    def add_block(self, slide, block, top):
+        """Draw one block at top; return the top of the next block."""
+        gap = self.gap
+        if isinstance(block, dk.Lead):
+            return top + self.add_body_text(slide, block.text, top, emphasis=block.emphasis) + gap
+        if isinstance(block, dk.Paragraph):
+            return top + self.add_body_text(slide, block.text, top) + gap
+        if isinstance(block, dk.Heading):
+            return top + self.add_h3(slide, block.text, top)
+        if isinstance(block, dk.Bullets):
+            return top + self.add_bullets(slide, block.items, top) + gap
+        if isinstance(block, dk.Steps):
+            return top + self.add_bullets(slide, block.items, top, numbered=True,
+                                          start=block.start) + gap
+        if isinstance(block, dk.Checklist):
+            return top + self.add_bullets(slide, block.items, top, marker=self.t.list.checkbox) + gap
+        if isinstance(block, dk.Stats):
+            return top + self.add_bullets(slide, stat_items(block), top) + gap
+        if isinstance(block, dk.Callout):
+            return top + self.add_box(slide, block.text, top, self.t.callout) + gap
+        if isinstance(block, dk.Quote):
+            return top + self.add_box(slide, block.text, top, self.t.quote, cite=block.cite) + gap
+        if isinstance(block, dk.Table):
+            return top + self.add_table(slide, block, top) + gap
+        if isinstance(block, dk.Cards):
+            return self.add_cards(slide, block, top)
+        raise TypeError("Unsupported block: " + type(block).__name__)
+
+    def start_slide(self, prs, slide, index, deck=None):
+        s = self.add_blank_slide(prs)
+        if "panel" in self.t:
+            colors = self.t.panel.colors
+            self.add_panel(s, colors[index % len(colors)])
+        self.add_section_label(s, slide.section)
+        self.add_title(s, slide.title, (deck, len(prs.slides)) if deck else None)
+        return s
+
+    def add_deck_slide(self, prs, slide, index, deck=None):
+        """Draw slide; blocks that do not fit above the bottom margin continue
+        on "(cd.)" slides. With deck, splits and overflows go to fit.report()."""
+        room = self.bottom - self.top_body + self.gap  # the last gap may hang below
+        blocks, current = list(slide.blocks), slide
+        while True:
+            s = self.start_slide(prs, current, index, deck)
+            page, blocks = fit.paginate(blocks, room, self.block_height, self.split_block)
+            top = self.top_body
+            for block in page:
+                top = self.add_block(s, block, top)
+            number = len(prs.slides)
+            excess = top - self.gap - self.bottom
+            if deck and excess > 0:
+                fit.report(deck.name, self.t.name, number, current.title, fit.OVERFLOW,
+                           type(page[0]).__name__, excess / 12700)
+            if not blocks:
+                return s
+            if deck:
+                fit.report(deck.name, self.t.name, number, current.title, fit.SPLIT,
+                           "ciąg dalszy na następnym slajdzie")
+            current = dk.continued(slide, ())
+
+    def output_path(self, deck, outdir=OUTDIR):
+        return os.path.join(outdir, deck.output_name(self.SUFFIX, EXT))
+
+    def render(self, deck, out_path=None):
+        if out_path is None:
+            out_path = self.output_path(deck)
+        prs = self.new_presentation()
+        self.add_cover(prs, deck)
+        for i, slide in enumerate(deck.slides):
+            self.add_deck_slide(prs, slide, i, deck)
+        prs.save(out_path)
+        return out_path, len(prs.slides)
+
+
+_backends = {}
+
+
+def backend(theme=DEFAULT_THEME):
+    """Backend for a compiled theme or a theme name; memoized per process."""
+    if isinstance(theme, str):
+        theme = themes.load(theme)
+    if theme.name not in _backends:
+        _backends[theme.name] = Backend(theme)
+    return _backends[theme.name]
+
+
+def output_path(deck, outdir=OUTDIR):
+    return backend().output_path(deck, outdir)
+
+
+def render(deck, out_path=None):
+    return backend().render(deck, out_path)
+
+
+if __name__ == "__main__":
+    from slides import build_deck
+    deck = build_deck()
+    for name in sys.argv[1:] or [DEFAULT_THEME]:
+        out_path, _ = backend(name).render(deck)
+        print(f"PPTX: {out_path}")
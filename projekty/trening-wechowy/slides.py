@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Treść prezentacji Trening Węchowy — jedno źródło dla wszystkich motywów."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, "narzedzia"))
+
+from deck import (Deck, Lead, Steps, Checklist, Table, Callout, Quote,
+                  Card, Cards, Stats, slide)
+
+# Polish quotes
+LQ = "„"  # opening lower
+RQ = "”"  # closing upper
+
+
+def build_deck():
+    return Deck(
+        name="Trening Węchowy",
+        title="Trening węchowy",
+        subtitle="w warunkach domowych",
+        label="Aromapsychologia",
+        author="Opracowanie: Emilia Chodorowska",
+        credit="na podstawie kursu Aromapsychologia Anny Bober",
+        slides=SLIDES,
+    )
+
+
+SLIDES = (
+    slide(
+        "1 · Wstęp", "Dlaczego Twój nos " + LQ + "zamilkł" + RQ + "?",
+        Lead("Utrata węchu w COVID-19 to zjawisko inne niż zatkany nos przy grypie."),
+        Cards((
+            Card("Grypa", "Obrzęk tkanek fizycznie blokuje dostęp aromatów do nabłonka węchowego. Nos jest zatkany — powietrze nie przechodzi."),
+            Card("COVID-19", "Drożne przewody nosowe, ale wirus atakuje <b>komórki podporowe</b> i <b>gruczoły Bowmana</b>. Zapach nie dociera mimo wolnych dróg oddechowych."),
+        )),
+        Cards((
+            Card(None, "Neurony tracą " + LQ + "system podtrzymywania życia" + RQ + " — jak sprawne odbiorniki, którym odcięto zasilanie. Brak stymulacji prowadzi do <b>atrofii opuszki węchowej</b> i zmian w hipokampie, co wpływa na pamięć i emocje."),
+        ), columns=1),
+    ),
+
+    slide(
+        "1 · Wstęp", "Dlaczego to minie?",
+        Lead("Neurony węchowe mają unikalną zdolność do regeneracji — jako jedyne w organizmie odnawiają się przez całe życie.", emphasis=True),
+        Quote(LQ + "Systematyczny trening węchowy wykazuje skuteczność porównywalną z terapią sterydową. Regularna stymulacja zwiększa objętość istoty szarej w mózgu. Twój mózg jest plastyczny — trening to proces jego fizycznej odbudowy." + RQ,
+              "— metaanalizy prof. Thomasa Hummela"),
+        Callout("\U0001f4a1 <b>Kluczowy wniosek:</b> Trening węchowy to nie " + LQ + "alternatywna medycyna" + RQ + " — to metoda poparta setkami badań naukowych, w tym badaniami obrazowania mózgu (fMRI/MRI)."),
+    ),
+
+    slide(
+        "2 · Warsztat zapachowy", "Co przygotować?",
+        Lead("Potrzebujemy stworzyć <b>headspace</b> — nasyconą cząsteczkami przestrzeń nad źródłem zapachu."),
+        Cards((
+            Card("Słoiczki z ciemnego szkła", "15–30 ml pojemności. Chronią olejki przed światłem i koncentrują opary wewnątrz. Najlepiej z zakrętkami — szczelność jest kluczowa."),
+            Card("Papier akwarelowy", "Porowatość idealnie trzyma aromat wewnątrz słoiczka. Wycinamy pasek dopasowany do wielkości słoiczka."),
+            Card("Olejki eteryczne", "Wyłącznie naturalne koncentraty wysokiej jakości. Syntetyczne odpowiedniki nie aktywują właściwych receptorów."),
+        ), columns=3),
+    ),
+
+    slide(
+        "2 · Warsztat zapachowy", "Jak przygotować słoiczek?",
+        Steps((
+            "Włóż do słoiczka pasek papieru akwarelowego",
+            "Nasącz go <b>4–8 kroplami</b> wybranego olejku eterycznego",
+            "Szczelnie zakręć i odczekaj <b>minimum godzinę</b> na nasycenie",
+            "<b>Co tydzień</b> wymieniaj papier i dolewaj świeżego olejku",
+            "Poproś kogoś ze sprawnym węchem o <b>weryfikację intensywności</b>",
+        )),
+        Callout("\U0001f4a1 <b>Cytrusy szybko oksydują</b> — myj słoiczki po nich dokładnie mydłem, ponieważ utlenione olejki tracą właściwości terapeutyczne i mogą podrażniać skórę."),
+    ),
+
+    slide(
+        "3 · Wybór zapachów", "Jakie zapachy wybrać?",
+        Table(
+            ("Grupa zapachowa", "Zamienniki", "Dlaczego?"),
+            (
+                ("Kwiatowa (Róża)", "Geranium, ylang-ylang", "Pobudza subtelne receptory"),
+                ("Owocowa (Cytryna)", "Pomarańcza, grejpfrut", "Wysoka intensywność"),
+                ("Korzenna (Goździki)", "Cynamon, wanilia", "Zakotwiczenie w pamięci"),
+                ("Żywicza (Eukaliptus)", "Mięta, rozmaryn", "Nerw trójdzielny (chłód)"),
+            ),
+            widths=(0.35, 0.35, 0.30),
+        ),
+        Callout("\U0001f9e0 <b>Pamięć węchowa:</b> Wybieraj aromaty budzące silne wspomnienia — emocjonalny ślad ułatwia regenerację połączeń synaptycznych. Im silniejsze skojarzenie, tym lepszy efekt terapeutyczny."),
+    ),
+
+    slide(
+        "4 · Technika oddechowa", "Technika " + LQ + "małych wdechów" + RQ,
+        Lead("<b>Głęboki wdech omija nabłonek węchowy</b> — kieruje powietrze prosto do płuc, zamiast do pola węchowego."),
+        Cards((
+            Card("Prawidłowa technika", "Krótkie, małe wdechy — jak pies na spacerze. Tworzysz <b>zawirowania powietrza</b>, które kierują headspace bezpośrednio na pole węchowe w górnej części jamy nosowej.", tone="accent"),
+            Card("Błąd do unikania", "Głęboki, długi wdech nosem — powietrze omija nabłonek węchowy i trafia wprost do płuc. <b>Nie stymuluje receptorów</b> i nie przynosi efektu terapeutycznego."),
+        )),
+    ),
+
+    slide(
+        "4 · Sesja treningowa", "Jak wygląda sesja treningowa?",
+        Checklist((
+            "Wybierz spokojne miejsce, wycisz telefon",
+            "Otwórz słoiczek i zbliż go do nosa (ok. 2–3 cm)",
+            "<b>20 sekund</b> wąchania techniką małych wdechów",
+            "Zamknij słoiczek — <b>10–15 sekund przerwy</b> między zapachami",
+            "Przejdź do kolejnego zapachu (4 zapachy = 1 sesja)",
+            "Powtarzaj <b>2× dziennie: rano i wieczorem</b>",
+        )),
+    ),
+
+    slide(
+        "5 · Praca mentalna", "Wąchaj wyobraźnią",
+        Lead("Trening węchowy to w połowie praca umysłu. Kora węchowa wykazuje aktywność nawet przy braku fizycznego bodźca."),
+        Cards((
+            Card("Wizualizacja", "<b>Zamknij oczy</b> i przywołaj obraz obiektu — kolor cytryny, porowatość skórki, kwaśny smak na języku, chłód z lodówki. Angażuj <b>wszystkie zmysły</b> naraz."),
+            Card("Wsparcie wizualne", "Patrz na <b>zdjęcia</b> wąchanych obiektów podczas sesji. Medytacja sensoryczna zapobiega degradacji neuronów i <b>wzmacnia ścieżki pamięciowe</b>."),
+        )),
+    ),
+
+    slide(
+        "6 · Dzienniczek postępów", "Jak śledzić postępy?",
+        Stats((("4 mies.", "Pierwsze efekty"), ("14–24", "Miesiące rehabilitacji"))),
+        Callout("✅ <b>Parosmia = dobry znak!</b> Zniekształcone zapachy (np. zapach gumy zamiast kawy) to dowód, że neurony nawiązują nowe połączenia synaptyczne.", tone="success"),
+        Table(
+            ("Pole", "Wpis"),
+            (
+                ("Data", ".................."),
+                ("Zapach", ".................."),
+                ("Odczucia", "nic / chłód / zniekształcony / czysty"),
+                ("Intensywność", "0 – 1 – 2 – 3 – 4 – 5"),
+            ),
+            widths=(0.3, 0.7),
+        ),
+    ),
+
+    slide(
+        "7 · Szersze korzyści", "Nie tylko po wirusie",
+        Lead("Trening węchowy przynosi szersze korzyści dla mózgu i zdrowia psychicznego:"),
+        Cards((
+            Card("Funkcje poznawcze", "Udowodniona poprawa pamięci i koncentracji, szczególnie u osób starszych i po urazach."),
+            Card("Płynność werbalna", "Badania potwierdzają poprawę płynności semantycznej i zdolności nazywania."),
+            Card("Istota szara", "Zwiększenie objętości istoty szarej — odwraca skutki anosmii potwierdzone w MRI."),
+            Card("Nastrój i emocje", "Poprawa nastroju i redukcja objawów depresji potwierdzona klinicznie."),
+        )),
+    ),
+
+    slide(
+        "7 · Neuroplastyczność", "Jak mózg się odbudowuje?",
+        Cards((
+            Card("Istota szara", "Anosmia powoduje utratę istoty szarej w obszarach odpowiedzialnych za węch. Systematyczny trening <b>fizycznie zwiększa jej objętość</b>, odwracając negatywne skutki utraty powonienia. Potwierdzone w badaniach MRI.", tone="accent"),
+            Card("Łączność strukturalna", "Długoterminowa ekspozycja na bodźce węchowe <b>przebudowuje szlaki nerwowe</b>. Nawet nocna ekspozycja (2h/noc przez 6 miesięcy) poprawia fizyczną łączność między układem limbicznym a korą mózgową.", tone="accent"),
+        ), columns=1),
+        Callout("\U0001f9d3 Trening węchowy to także skuteczny <b>trening umysłu i pamięci dla seniorów</b> — niezależnie od tego, czy doszło do utraty węchu."),
+    ),
+
+    slide(
+        "8 · Podsumowanie", "Zapamiętaj te zasady",
+        Cards((
+            Card("1. Systematyczność", "2× dziennie, codziennie — rano i wieczorem. To Twoje lekarstwo.", tone="accent"),
+            Card("2. Technika oddechu", "Krótkie, " + LQ + "węszące" + RQ + " wdechy jak pies. Nie omijaj receptorów.", tone="accent"),
+            Card("3. Wyobraźnia", "Mózg reaguje na wspomnienie zapachu tak samo intensywnie jak na prawdziwy.", tone="accent"),
+            Card("4. Stymulacja trójdzielna", "Zawsze mięta lub eukaliptus w zestawie — aktywują nerw trójdzielny.", tone="accent"),
+        )),
+        Cards((
+            Card("5. Czas i cierpliwość", "Daj sobie minimum 4 miesiące na pierwszy sygnał powrotu. Pełna rehabilitacja to 14–24 miesiące — ale każdy dzień treningu przybliża Cię do celu.", tone="success"),
+        ), columns=1),
+    ),
+)
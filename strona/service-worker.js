@@ -0,0 +1,97 @@
+// Offline service worker, published as sw.js next to each page in
+// sitebuild.OFFLINE_PAGES. The build puts MANIFEST in front of this file:
+//
+//   {precache: [[url, revision], ...], runtime: [[url, revision], ...]}
+//
+// with urls relative to sw.js and revisions hashing the file contents.
+// "precache" (the page, its styles, scripts, fonts and plain images) is
+// fetched on install; "runtime" (responsive image candidates, of which the
+// browser picks one) is cached the first time it is requested. Both are
+// served cache-first. Entries are keyed by url and revision, so a changed
+// file is refetched and the old entry dropped when the new worker
+// activates; sw.js itself changes with every revision, which is what makes
+// the browser install it.
+
+// One cache per scope: other projects may share the origin.
+const CACHE = "offline:" + self.registration.scope;
+const revisions = new Map();
+for (const [url, revision] of MANIFEST.precache.concat(MANIFEST.runtime)) {
+  revisions.set(new URL(url, self.location).href, revision);
+}
+
+function cacheKey(href, revision) {
+  return href + (href.includes("?") ? "&" : "?") + "__rev=" + revision;
+}
+
+// The page answers to its directory and to index.html, with any query.
+function resolve(request) {
+  const url = new URL(request.url);
+  url.hash = "";
+  if (request.mode === "navigate") {
+    url.search = "";
+    if (url.pathname.endsWith("/index.html")) {
+      url.pathname = url.pathname.slice(0, -"index.html".length);
+    }
+  }
+  return url.href;
+}
+
+self.addEventListener("install", (event) => {
+  event.waitUntil((async () => {
+    const cache = await caches.open(CACHE);
+    await Promise.all(MANIFEST.precache.map(async ([url, revision]) => {
+      const href = new URL(url, self.location).href;
+      const key = cacheKey(href, revision);
+      if (await cache.match(key)) {
+        return;
+      }
+      // Revalidate: an HTTP-cached copy may predate this revision.
+      const response = await fetch(href, {cache: "no-cache"});
+      if (!response.ok) {
+        throw new Error(href + ": HTTP " + response.status);
+      }
+      await cache.put(key, response);
+    }));
+    await self.skipWaiting();
+  })());
+});
+
+self.addEventListener("activate", (event) => {
+  event.waitUntil((async () => {
+    const cache = await caches.open(CACHE);
+    const current = new Set();
+    for (const [href, revision] of revisions) {
+      current.add(cacheKey(href, revision));
+    }
+    for (const request of await cache.keys()) {
+      if (!current.has(request.url)) {
+        await cache.delete(request);
+      }
+    }
+    await self.clients.claim();
+  })());
+});
+
+self.addEventListener("fetch", (event) => {
+  if (event.request.method !== "GET") {
+    return;
+  }
+  const href = resolve(event.request);
+  const revision = revisions.get(href);
+  if (revision === undefined) {
+    return;  // not ours: the network, as without a worker
+  }
+  event.respondWith((async () => {
+    const cache = await caches.open(CACHE);
+    const key = cacheKey(href, revision);
+    const cached = await cache.match(key);
+    if (cached) {
+      return cached;
+    }
+    const response = await fetch(event.request);
+    if (response.ok) {
+      await cache.put(key, response.clone());
+    }
+    return response;
+  })());
+});